@@ -22,8 +22,10 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+from fraiseql_doctor.models import load_all_models
 from fraiseql_doctor.models.base import Base
 
+load_all_models()
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
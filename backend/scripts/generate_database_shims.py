@@ -0,0 +1,247 @@
+"""Generate the deprecated ``core.database`` re-export shims.
+
+``core/database/models.py`` and ``core/database/schemas.py`` keep old import
+paths working by resolving names lazily (PEP 562). Type checkers and IDEs read
+the matching ``.pyi`` stubs instead, so the runtime modules carry no imports
+for them. Each module's ``__all__`` (a sorted tuple), its ``_LAZY`` lookup
+table and its stub must list the same names, so they are all written from the
+specs below.
+
+Usage::
+
+    python scripts/generate_database_shims.py          # rewrite the shims
+    python scripts/generate_database_shims.py --check  # fail if they are stale
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PACKAGE = "fraiseql_doctor.core.database"
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "src" / "fraiseql_doctor" / "core" / "database"
+LINE_LENGTH = 100
+
+
+@dataclass(frozen=True)
+class Shim:
+    """A lazily re-exporting module."""
+
+    filename: str
+    docstring: str
+    what: str
+    # Re-exported name -> module it is defined in
+    lazy: dict[str, str]
+    # Names imported eagerly, with the comment placed above their import
+    eager: dict[str, str] = field(default_factory=dict)
+    eager_comment: str = ""
+
+
+SHIMS = [
+    Shim(
+        filename="models.py",
+        docstring=(
+            "Database models re-exported for backwards compatibility (deprecated).\n"
+            "\n"
+            "Apart from ``Base`` the models are resolved on first access (PEP 562), so a\n"
+            "caller that needs one model does not evaluate every mapped class. First\n"
+            "access to a name emits a ``DeprecationWarning`` pointing at the module that"
+            " defines it.\n"
+        ),
+        what="model",
+        lazy={
+            "Endpoint": "fraiseql_doctor.models.endpoint",
+            "Query": "fraiseql_doctor.models.query",
+            "QueryCollection": "fraiseql_doctor.models.query_collection",
+            "Execution": "fraiseql_doctor.models.execution",
+            "HealthCheck": "fraiseql_doctor.models.health_check",
+            "Schedule": "fraiseql_doctor.models.schedule",
+            "QueryResult": "fraiseql_doctor.models.result",
+            "ResultMetadata": "fraiseql_doctor.models.result",
+        },
+        eager={"Base": "fraiseql_doctor.models.base"},
+        eager_comment="Re-export all models from the models module",
+    ),
+    Shim(
+        filename="schemas.py",
+        docstring=(
+            "Database schemas re-exported for backwards compatibility (deprecated).\n"
+            "\n"
+            "The names are resolved on first access (PEP 562): the execution manager\n"
+            "behind them is only imported when a caller needs it. The search filters are\n"
+            "not re-exported; import them from the core module that uses them.\n"
+            "First access to a name emits a ``DeprecationWarning`` pointing at the module"
+            " that defines it.\n"
+        ),
+        what="name",
+        lazy={
+            "QueryCreate": "fraiseql_doctor.schemas.query",
+            "QueryUpdate": "fraiseql_doctor.schemas.query",
+            "QueryCollectionCreate": "fraiseql_doctor.schemas.query",
+            "QueryCollectionUpdate": "fraiseql_doctor.schemas.query",
+            "QueryResponse": "fraiseql_doctor.schemas.query",
+            "EndpointCreate": "fraiseql_doctor.schemas.endpoint",
+            "EndpointUpdate": "fraiseql_doctor.schemas.endpoint",
+            "EndpointResponse": "fraiseql_doctor.schemas.endpoint",
+            "BatchMode": "fraiseql_doctor.core.execution_manager",
+            "ExecutionConfig": "fraiseql_doctor.core.execution_manager",
+        },
+    ),
+]
+
+GETATTR_TEMPLATE = '''
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported {what} on first access and cache it on the module."""
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}") from None
+    warnings.warn(
+        f"{{__name__}}.{{name}} is deprecated, import it from {{module}} instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    # Skip the import machinery when the defining module is already loaded
+    loaded = sys.modules.get(module) or import_module(module)
+    value = getattr(loaded, name)
+    # Later lookups find the global and never reach __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> tuple[str, ...]:
+    # dir() copies and sorts whatever this returns, so hand back the tuple itself
+    return __all__
+'''
+
+
+def _relative(module: str) -> tuple[int, str]:
+    """Return (level, remainder) for a relative import of ``module`` from PACKAGE."""
+    package = PACKAGE.split(".")
+    target = module.split(".")
+    common = 0
+    while common < min(len(package), len(target)) and package[common] == target[common]:
+        common += 1
+    return len(package) - common + 1, ".".join(target[common:])
+
+
+def _import_lines(names_by_module: dict[str, list[str]], *, reexport: bool = False) -> list[str]:
+    """Render sorted relative imports, furthest package first (ruff/isort order).
+
+    ``reexport`` writes ``name as name``, which marks a re-export in a stub.
+    Those imports get a statement per name, as ruff's isort rules (without
+    ``combine-as-imports``) expect.
+    """
+    imports = sorted(
+        ((_relative(module), sorted(names)) for module, names in names_by_module.items()),
+        key=lambda item: (-item[0][0], item[0][1]),
+    )
+
+    lines = []
+    for (level, remainder), names in imports:
+        head = f"from {'.' * level}{remainder} import "
+        statements = [[f"{name} as {name}"] for name in names] if reexport else [names]
+        for members in statements:
+            single = head + ", ".join(members)
+            if len(single) <= LINE_LENGTH:
+                lines.append(single)
+            else:
+                lines.append(head + "(")
+                lines.extend(f"    {member}," for member in members)
+                lines.append(")")
+    return lines
+
+
+def _group(mapping: dict[str, str]) -> dict[str, list[str]]:
+    grouped: dict[str, list[str]] = {}
+    for name, module in mapping.items():
+        grouped.setdefault(module, []).append(name)
+    return grouped
+
+
+GENERATED = "# Generated by scripts/generate_database_shims.py; edit the spec there instead."
+
+
+def _all_lines(shim: Shim) -> list[str]:
+    # Sorted so the tuple (and the module's bytecode) doesn't depend on spec order
+    return [
+        "__all__ = (",
+        *(f'    "{name}",' for name in sorted([*shim.lazy, *shim.eager])),
+        ")",
+    ]
+
+
+def render(shim: Shim) -> str:
+    """Return the source of one shim module."""
+    lines = [
+        f'"""{shim.docstring}"""',
+        "",
+        GENERATED,
+        "",
+        "import sys",
+        "import warnings",
+        "from importlib import import_module",
+        "from typing import Any",
+        "",
+    ]
+    if shim.eager:
+        lines.append(f"# {shim.eager_comment}")
+        lines.extend(_import_lines(_group(shim.eager)))
+        lines.append("")
+
+    lines.append("# Re-exported name -> module it is defined in")
+    lines.append("_LAZY: dict[str, str] = {")
+    lines.extend(f'    "{name}": "{module}",' for name, module in shim.lazy.items())
+    lines.append("}")
+    lines.append("")
+    lines.extend(_all_lines(shim))
+
+    return "\n".join(lines) + "\n" + GETATTR_TEMPLATE.format(what=shim.what)
+
+
+def render_stub(shim: Shim) -> str:
+    """Return the ``.pyi`` stub type checkers read instead of the shim module."""
+    module = f"{PACKAGE}.{shim.filename.removesuffix('.py')}"
+    lines = [
+        f'"""Type stub for ``{module}``."""',
+        "",
+        GENERATED,
+        "",
+        *_import_lines(_group({**shim.eager, **shim.lazy}), reexport=True),
+        "",
+        *_all_lines(shim),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check", action="store_true", help="report stale shims instead of rewriting them"
+    )
+    args = parser.parse_args(argv)
+
+    outputs = {}
+    for shim in SHIMS:
+        path = PACKAGE_DIR / shim.filename
+        outputs[path] = render(shim)
+        outputs[path.with_suffix(".pyi")] = render_stub(shim)
+
+    stale = []
+    for path, source in outputs.items():
+        if path.exists() and path.read_text(encoding="utf-8") == source:
+            continue
+        stale.append(path)
+        if not args.check:
+            path.write_text(source, encoding="utf-8")
+
+    if args.check and stale:
+        for path in stale:
+            print(f"{path} is stale; run scripts/generate_database_shims.py", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
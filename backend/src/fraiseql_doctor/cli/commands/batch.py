@@ -1,6 +1,7 @@
 """Batch operations CLI commands."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
@@ -90,8 +91,12 @@ console = Console()
 batch_app = typer.Typer(name="batch", help="Batch operations for queries and health checks")
 
 
+@lru_cache(maxsize=1)
 def get_managers():
-    """Get required managers for batch operations - mock for Phase 2."""
+    """Get required managers for batch operations - mock for Phase 2.
+
+    Built once per process and shared by every batch command.
+    """
     return MockDB(), "mock-query-manager", "mock-execution-manager"
 
 
@@ -1,6 +1,7 @@
 """Endpoint management CLI commands."""
 
 import json
+import sys
 from pathlib import Path
 from typing import Optional
 from uuid import UUID, uuid4
@@ -54,6 +55,7 @@ class MockFraiseQLClient:
 FraiseQLClient = MockFraiseQLClient
 Endpoint = MockEndpoint
 
+from ...utils.serialization import dump
 from ..utils.formatters import format_endpoint_detail, format_endpoint_table, format_progress_bar
 
 console = Console()
@@ -307,7 +309,7 @@ def list_endpoints(
                 }
                 output.append(endpoint_dict)
 
-            rprint(json.dumps(output, indent=2))
+            dump(output, sys.stdout, indent=True)
 
         else:
             rprint(f"[red]Unknown format: {format}[/red]")
@@ -379,7 +381,7 @@ def show_endpoint(
                 "created_at": endpoint.created_at.isoformat() if endpoint.created_at else None,
                 "updated_at": endpoint.updated_at.isoformat() if endpoint.updated_at else None,
             }
-            rprint(json.dumps(endpoint_dict, indent=2))
+            dump(endpoint_dict, sys.stdout, indent=True)
 
         else:
             rprint(f"[red]Unknown format: {format}[/red]")
@@ -461,7 +463,7 @@ def test_endpoint(
 
                     if verbose:
                         rprint("\n[dim]Full response:[/dim]")
-                        rprint(json.dumps(result, indent=2))
+                        dump(result, sys.stdout, indent=True)
 
                     raise typer.Exit(1)
 
@@ -487,7 +489,7 @@ def test_endpoint(
 
                     if verbose:
                         rprint("\n[dim]Full response:[/dim]")
-                        rprint(json.dumps(result, indent=2))
+                        dump(result, sys.stdout, indent=True)
 
             except NetworkError as e:
                 progress.stop()
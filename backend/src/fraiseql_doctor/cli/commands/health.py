@@ -1,6 +1,7 @@
 """Health monitoring CLI commands."""
 
 import json
+import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -75,10 +76,14 @@ class MockHealthCheck:
 
 
 HealthCheckModel = MockHealthCheck
+from ...utils.serialization import dump
 from ..utils.formatters import format_health_summary, format_progress_bar
 
 console = Console()
 
+# Introspection probe shared by `check` and every `monitor` cycle
+DEFAULT_HEALTH_QUERY = "query HealthCheck { __schema { queryType { name } } }"
+
 health_app = typer.Typer(name="health", help="Monitor endpoint health")
 
 
@@ -120,18 +125,7 @@ def health_check(
             raise typer.Exit(1)
 
         # Default health check query
-        health_query = (
-            query
-            or """
-            query HealthCheck {
-                __schema {
-                    queryType {
-                        name
-                    }
-                }
-            }
-        """
-        )
+        health_query = query or DEFAULT_HEALTH_QUERY
 
         results = {}
 
@@ -218,7 +212,7 @@ def health_check(
                 json_data["last_check"] = data["last_check"].isoformat()
                 json_results[name] = json_data
 
-            rprint(json.dumps(json_results, indent=2))
+            dump(json_results, sys.stdout, indent=True)
 
         else:
             rprint(f"[red]Unknown format: {format}[/red]")
@@ -294,16 +288,7 @@ def monitor_health(
             rprint(f"[dim]Duration: {duration} seconds[/dim]")
         rprint("[dim]Press Ctrl+C to stop monitoring[/dim]\n")
 
-        # Health check query
-        health_query = """
-            query HealthCheck {
-                __schema {
-                    queryType {
-                        name
-                    }
-                }
-            }
-        """
+        health_query = DEFAULT_HEALTH_QUERY
 
         start_time = time.time()
         last_status = {}
@@ -456,8 +441,9 @@ def health_report(
             rprint("[yellow]No health check data found for the specified criteria[/yellow]")
             return
 
-        # Process results
-        report_data = []
+        # Per-check detail rows are only rendered by the JSON format
+        want_details = format == "json"
+        report_data = [] if want_details else None
         endpoint_stats = {}
 
         for check in health_checks:
@@ -488,14 +474,16 @@ def health_report(
                 stats["response_times"].append(check.response_time_ms)
 
             # Add to report data
-            report_entry = {
-                "endpoint": endpoint_name,
-                "timestamp": check.check_timestamp.isoformat(),
-                "status": check.status,
-                "response_time_ms": check.response_time_ms,
-                "error": check.error_message if include_errors else None,
-            }
-            report_data.append(report_entry)
+            if want_details:
+                report_data.append(
+                    {
+                        "endpoint": endpoint_name,
+                        "timestamp": check.check_timestamp.isoformat(),
+                        "status": check.status,
+                        "response_time_ms": check.response_time_ms,
+                        "error": check.error_message if include_errors else None,
+                    }
+                )
 
         # Calculate averages
         for stats in endpoint_stats.values():
@@ -1,13 +1,18 @@
 """Query management CLI commands."""
 
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from uuid import UUID, uuid4
 
+import click
 import typer
-from rich import print as rprint
 from rich.console import Console
 
 # Temporarily commented out to avoid circular imports during Phase 2 implementation
@@ -40,10 +45,50 @@ class QueryPriority:
 QuerySearchFilter = MockQuerySearchFilter
 
 
+def _values_by_string(options) -> dict:
+    """Map the string value of each status/priority option to the option itself.
+
+    Works for both the mock constant classes above and the real enums.
+    """
+    if isinstance(options, type) and issubclass(options, Enum):
+        return {member.value: member for member in options}
+    return {value: value for key, value in vars(options).items() if key.isupper()}
+
+
+def _lookup_option(values: dict, value: Optional[str], label: str):
+    """Resolve a --status/--priority value, rejecting unknown ones."""
+    if value is None:
+        return None
+    try:
+        return values[value]
+    except KeyError:
+        raise ValueError(
+            f"Unknown {label} '{value}'. Expected one of: {', '.join(values)}"
+        ) from None
+
+
+@lru_cache(maxsize=64)
+def _tagset(tags: Optional[tuple[str, ...]]) -> Optional[frozenset[str]]:
+    """Return the shared, hashable tag set for a --tag combination."""
+    return frozenset(tags) if tags else None
+
+
+_STATUS_BY_VALUE = _values_by_string(QueryStatus)
+_PRIORITY_BY_VALUE = _values_by_string(QueryPriority)
+
+
 # Mock schema classes
 class QueryCreate:
     def __init__(
-        self, name, description=None, query_text="", variables=None, tags=None, created_by=None
+        self,
+        name,
+        description=None,
+        query_text="",
+        variables=None,
+        tags=None,
+        created_by=None,
+        expected_complexity_score=None,
+        query_metadata=None,
     ):
         self.name = name
         self.description = description
@@ -51,25 +96,138 @@ class QueryCreate:
         self.variables = variables or {}
         self.tags = tags or []
         self.created_by = created_by
+        self.expected_complexity_score = expected_complexity_score
+        self.query_metadata = query_metadata or {}
 
 
 class QueryUpdate:
-    def __init__(self, name=None, description=None, query_text=None):
+    def __init__(
+        self,
+        name=None,
+        description=None,
+        query_text=None,
+        expected_complexity_score=None,
+        query_metadata=None,
+    ):
         self.name = name
         self.description = description
         self.query_text = query_text
+        self.expected_complexity_score = expected_complexity_score
+        self.query_metadata = query_metadata
 
 
+from ...services.complexity import ComplexityMetrics, QueryComplexityAnalyzer
+from ...utils.serialization import dump, dumps
 from ..utils.file_handlers import GraphQLFileHandler, VariableFileHandler
 from ..utils.formatters import format_query_detail, format_query_table
+from ..utils.validation_cache import ValidationCache
 
 console = Console()
+err_console = Console(stderr=True)
 
 query_app = typer.Typer(name="query", help="Manage GraphQL queries")
 
+# Options shared by several commands; Typer copies these into each Click parameter
+_QUERY_ID_OPTION = typer.Option(None, "--id", help="Query ID")
+_QUERY_NAME_OPTION = typer.Option(None, "--name", "-n", help="Query name")
+_VALIDATE_OPTION = typer.Option(True, "--validate/--no-validate", help="Validate GraphQL syntax")
+
+# The analyzer is stateless (compiled patterns only), so one instance serves every command
+_ANALYZER = QueryComplexityAnalyzer()
+
+
+@lru_cache(maxsize=512)
+def _analyze_cached(query_text: str) -> ComplexityMetrics:
+    """Analyze query complexity, memoized on the query text.
+
+    Edited queries produce a different key, so no explicit invalidation is needed.
+    """
+    return _ANALYZER.analyze_query(query_text)
+
+
+# Analysis results of previously validated query texts, persisted across invocations
+_validation_cache = ValidationCache()
+
+# Below this many distinct queries, process start-up costs more than the analysis itself
+_PARALLEL_VALIDATION_THRESHOLD = 64
+# Collection queries are fetched for validation in pages of this size
+_COLLECTION_PAGE_SIZE = 1_000
 
+
+def _cached_analysis(query_text: str) -> dict:
+    """Return query schema fields holding the cached analysis of a query text, if any.
+
+    Passing them to the manager with validation off stores the cached result
+    with the query, instead of the blanks an unvalidated query gets.
+    """
+    metadata = _validation_cache.get(query_text)
+    if metadata is None:
+        return {}
+    return {
+        "expected_complexity_score": int(metadata.get("complexity_score", 0)),
+        "query_metadata": {**metadata, "last_validated": datetime.now(UTC).isoformat()},
+    }
+
+
+def _validation_error(query_text: str) -> Optional[str]:
+    """Return the analysis error for a query, or None if it is valid."""
+    try:
+        _analyze_cached(query_text)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _collection_queries(manager, collection_id: UUID) -> list:
+    """Fetch every query of a collection, page by page."""
+    queries = []
+    while True:
+        page = manager.search_queries(
+            QuerySearchFilter(
+                collection_ids=[collection_id], limit=_COLLECTION_PAGE_SIZE, offset=len(queries)
+            )
+        )
+        queries.extend(page)
+        if len(page) < _COLLECTION_PAGE_SIZE:
+            return queries
+
+
+def _validate_collection(queries) -> dict:
+    """Analyze every query of a collection, fanning out to worker processes when large."""
+    # Identical texts only need analyzing once
+    texts = list(dict.fromkeys(q.query_text for q in queries))
+
+    if len(texts) < _PARALLEL_VALIDATION_THRESHOLD:
+        errors_by_text = dict(zip(texts, map(_validation_error, texts)))
+    else:
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            errors_by_text = dict(
+                zip(texts, executor.map(_validation_error, texts, chunksize=chunksize))
+            )
+
+    results = {"total": len(queries), "valid": 0, "invalid": 0, "errors": []}
+    for query in queries:
+        error = errors_by_text[query.query_text]
+        if error is None:
+            results["valid"] += 1
+        else:
+            results["invalid"] += 1
+            results["errors"].append(
+                {"query_id": str(query.pk_query), "query_name": query.name, "error": error}
+            )
+
+    return results
+
+
+@lru_cache(maxsize=1)
 def get_query_manager():
-    """Get configured query collection manager - mock for Phase 2."""
+    """Get configured query collection manager - mock for Phase 2.
+
+    Built once per process so commands run in the same process (e.g. from
+    ``batch``) share one manager and its database connection.
+    """
 
     class MockQuery:
         def __init__(self, name="Mock Query", pk_query="mock-uuid"):
@@ -105,6 +263,9 @@ def get_query_manager():
         def get_query(self, query_id):
             return MockQuery("Retrieved Query", str(query_id))
 
+        def get_query_by_name(self, name):
+            return MockQuery(name)
+
         def add_query(self, collection_id, schema, validate=True):
             return MockQuery(getattr(schema, "name", "New Query"))
 
@@ -130,7 +291,7 @@ def create_query(
     priority: str = typer.Option(
         "medium", "--priority", help="Priority: low, medium, high, critical"
     ),
-    validate: bool = typer.Option(True, "--validate/--no-validate", help="Validate GraphQL syntax"),
+    validate: bool = _VALIDATE_OPTION,
     interactive: bool = typer.Option(False, "--interactive", "-i", help="Interactive query input"),
 ):
     """Create a new GraphQL query."""
@@ -138,23 +299,26 @@ def create_query(
         # Get query text
         if file:
             if not file.exists():
-                rprint(f"[red]Error: File {file} not found[/red]")
+                err_console.print(f"[red]Error: File {file} not found[/red]")
                 raise typer.Exit(1)
             query_text = GraphQLFileHandler.parse_graphql_file(file)
         elif interactive:
-            query_text = _interactive_query_input()
+            query_text = _interactive_query_input(validate)
         else:
-            rprint("[yellow]No query provided. Use --file or --interactive[/yellow]")
+            console.print("[yellow]No query provided. Use --file or --interactive[/yellow]")
             raise typer.Exit(1)
 
         # Load variables if provided
         variables = {}
         if variables_file:
             if not variables_file.exists():
-                rprint(f"[red]Error: Variables file {variables_file} not found[/red]")
+                err_console.print(f"[red]Error: Variables file {variables_file} not found[/red]")
                 raise typer.Exit(1)
             variables = VariableFileHandler.load_variables(variables_file)
 
+        # Identical query text that validated before doesn't need re-analyzing
+        cached_analysis = _cached_analysis(query_text) if validate else {}
+
         # Create query schema
         schema = QueryCreate(
             name=name,
@@ -163,6 +327,7 @@ def create_query(
             variables=variables,
             tags=tags or [],
             created_by="cli-user",  # TODO: Get from config/auth
+            **cached_analysis,
         )
 
         # Create query
@@ -171,21 +336,26 @@ def create_query(
         with console.status(f"[bold green]Creating query '{name}'..."):
             # For now, create without collection (simplified)
             collection_id = uuid4()  # TODO: Get from config or create default
-            query = manager.add_query(collection_id, schema, validate=validate)
+            query = manager.add_query(
+                collection_id, schema, validate=validate and not cached_analysis
+            )
 
         if query:
-            rprint(f"[green]✓[/green] Query '{name}' created successfully")
-            rprint(f"Query ID: {query.pk_query}")
+            if validate and not cached_analysis:
+                _validation_cache.put(query_text, query.query_metadata)
+
+            console.print(f"[green]✓[/green] Query '{name}' created successfully")
+            console.print(f"Query ID: {query.pk_query}")
 
             if validate and query.query_metadata.get("complexity_score"):
                 score = query.query_metadata["complexity_score"]
-                rprint(f"Complexity Score: {score:.2f}")
+                console.print(f"Complexity Score: {score:.2f}")
         else:
-            rprint("[red]Failed to create query[/red]")
+            err_console.print("[red]Failed to create query[/red]")
             raise typer.Exit(1)
 
     except Exception as e:
-        rprint(f"[red]Error creating query: {e}[/red]")
+        err_console.print(f"[red]Error creating query: {e}[/red]")
         raise typer.Exit(1)
 
 
@@ -207,9 +377,9 @@ def list_queries(
         # Build search filter
         filter_params = QuerySearchFilter(
             text=search,
-            status=QueryStatus(status) if status else None,
-            priority=QueryPriority(priority) if priority else None,
-            tags=set(tags) if tags else None,
+            status=_lookup_option(_STATUS_BY_VALUE, status, "status"),
+            priority=_lookup_option(_PRIORITY_BY_VALUE, priority, "priority"),
+            tags=_tagset(tuple(tags) if tags else None),
             limit=limit,
             offset=offset,
         )
@@ -218,77 +388,66 @@ def list_queries(
             queries = manager.search_queries(filter_params)
 
         if not queries:
-            rprint("[yellow]No queries found matching criteria[/yellow]")
+            console.print("[yellow]No queries found matching criteria[/yellow]")
             return
 
         if format == "table":
             table = format_query_table(queries)
             console.print(table)
         elif format == "json":
-            output = [q.to_dict() for q in queries]
-            rprint(json.dumps(output, indent=2, default=str))
+            sys.stdout.writelines(_iter_json(queries))
         elif format == "csv":
             _output_csv(queries)
         else:
-            rprint(f"[red]Unknown format: {format}[/red]")
+            err_console.print(f"[red]Unknown format: {format}[/red]")
             raise typer.Exit(1)
 
-        rprint(f"\n[dim]Showing {len(queries)} queries[/dim]")
+        console.print(f"\n[dim]Showing {len(queries)} queries[/dim]")
 
     except Exception as e:
-        rprint(f"[red]Error listing queries: {e}[/red]")
+        err_console.print(f"[red]Error listing queries: {e}[/red]")
         raise typer.Exit(1)
 
 
 @query_app.command("show")
 def show_query(
-    query_id: Optional[str] = typer.Option(None, "--id", help="Query ID"),
-    name: Optional[str] = typer.Option(None, "--name", "-n", help="Query name"),
+    query_id: Optional[UUID] = _QUERY_ID_OPTION,
+    name: Optional[str] = _QUERY_NAME_OPTION,
     format: str = typer.Option("pretty", "--format", help="Output format: pretty, json, raw"),
 ):
     """Show detailed information about a query."""
     if not query_id and not name:
-        rprint("[red]Error: Must specify either --id or --name[/red]")
+        err_console.print("[red]Error: Must specify either --id or --name[/red]")
         raise typer.Exit(1)
 
     try:
         manager = get_query_manager()
-
-        if query_id:
-            query = manager.get_query(UUID(query_id))
-        else:
-            # Search by name
-            filter_params = QuerySearchFilter(text=name, limit=1)
-            queries = manager.search_queries(filter_params)
-            query = queries[0] if queries else None
+        query = _resolve_query(manager, query_id, name)
 
         if not query:
-            rprint("[red]Query not found[/red]")
+            err_console.print("[red]Query not found[/red]")
             raise typer.Exit(1)
 
         if format == "pretty":
             panel = format_query_detail(query)
             console.print(panel)
         elif format == "json":
-            rprint(json.dumps(query.to_dict(), indent=2, default=str))
+            dump(query.to_dict(), sys.stdout, indent=True)
         elif format == "raw":
-            rprint(query.query_text)
+            sys.stdout.write(query.query_text + "\n")
         else:
-            rprint(f"[red]Unknown format: {format}[/red]")
+            err_console.print(f"[red]Unknown format: {format}[/red]")
             raise typer.Exit(1)
 
-    except ValueError as e:
-        rprint(f"[red]Invalid query ID: {e}[/red]")
-        raise typer.Exit(1)
     except Exception as e:
-        rprint(f"[red]Error showing query: {e}[/red]")
+        err_console.print(f"[red]Error showing query: {e}[/red]")
         raise typer.Exit(1)
 
 
 @query_app.command("execute")
 def execute_query(
-    query_id: Optional[str] = typer.Option(None, "--id", help="Query ID"),
-    name: Optional[str] = typer.Option(None, "--name", "-n", help="Query name"),
+    query_id: Optional[UUID] = _QUERY_ID_OPTION,
+    name: Optional[str] = _QUERY_NAME_OPTION,
     endpoint: Optional[str] = typer.Option(None, "--endpoint", "-e", help="Endpoint name or URL"),
     variables_file: Optional[Path] = typer.Option(None, "--variables", "-v", help="Variables file"),
     variables_json: Optional[str] = typer.Option(
@@ -300,22 +459,15 @@ def execute_query(
 ):
     """Execute a GraphQL query."""
     if not query_id and not name:
-        rprint("[red]Error: Must specify either --id or --name[/red]")
+        err_console.print("[red]Error: Must specify either --id or --name[/red]")
         raise typer.Exit(1)
 
     try:
         manager = get_query_manager()
-
-        # Get query
-        if query_id:
-            query = manager.get_query(UUID(query_id))
-        else:
-            filter_params = QuerySearchFilter(text=name, limit=1)
-            queries = manager.search_queries(filter_params)
-            query = queries[0] if queries else None
+        query = _resolve_query(manager, query_id, name)
 
         if not query:
-            rprint("[red]Query not found[/red]")
+            err_console.print("[red]Query not found[/red]")
             raise typer.Exit(1)
 
         # Load variables
@@ -328,37 +480,34 @@ def execute_query(
             variables = query.variables or {}
 
         # Execute query (simplified for now - would use execution manager)
-        rprint("[yellow]Note: Query execution not fully implemented yet[/yellow]")
-        rprint(f"Would execute query: {query.name}")
-        rprint(f"Variables: {variables}")
+        console.print("[yellow]Note: Query execution not fully implemented yet[/yellow]")
+        console.print(f"Would execute query: {query.name}")
+        console.print(f"Variables: {variables}")
 
         # TODO: Use execution manager to actually execute
         # execution_manager = get_execution_manager()
         # result = execution_manager.execute_query(query.pk_query, endpoint_id, variables)
 
-    except ValueError as e:
-        rprint(f"[red]Invalid query ID: {e}[/red]")
-        raise typer.Exit(1)
     except json.JSONDecodeError as e:
-        rprint(f"[red]Invalid JSON in variables: {e}[/red]")
+        err_console.print(f"[red]Invalid JSON in variables: {e}[/red]")
         raise typer.Exit(1)
     except Exception as e:
-        rprint(f"[red]Error executing query: {e}[/red]")
+        err_console.print(f"[red]Error executing query: {e}[/red]")
         raise typer.Exit(1)
 
 
 @query_app.command("update")
 def update_query(
-    query_id: Optional[str] = typer.Option(None, "--id", help="Query ID"),
+    query_id: Optional[UUID] = _QUERY_ID_OPTION,
     name: Optional[str] = typer.Option(None, "--name", "-n", help="Query name to update"),
     new_name: Optional[str] = typer.Option(None, "--new-name", help="New query name"),
     file: Optional[Path] = typer.Option(None, "--file", "-f", help="New GraphQL file"),
     description: Optional[str] = typer.Option(None, "--description", help="New description"),
-    validate: bool = typer.Option(True, "--validate/--no-validate", help="Validate GraphQL syntax"),
+    validate: bool = _VALIDATE_OPTION,
 ):
     """Update an existing query."""
     if not query_id and not name:
-        rprint("[red]Error: Must specify either --id or --name[/red]")
+        err_console.print("[red]Error: Must specify either --id or --name[/red]")
         raise typer.Exit(1)
 
     try:
@@ -366,108 +515,99 @@ def update_query(
 
         # Get query
         if query_id:
-            target_id = UUID(query_id)
+            target_id = query_id
         else:
-            filter_params = QuerySearchFilter(text=name, limit=1)
-            queries = manager.search_queries(filter_params)
-            if not queries:
-                rprint("[red]Query not found[/red]")
+            query = manager.get_query_by_name(name)
+            if not query:
+                err_console.print("[red]Query not found[/red]")
                 raise typer.Exit(1)
-            target_id = queries[0].pk_query
+            target_id = query.pk_query
 
         # Build update schema
         query_text = None
         if file:
             if not file.exists():
-                rprint(f"[red]Error: File {file} not found[/red]")
+                err_console.print(f"[red]Error: File {file} not found[/red]")
                 raise typer.Exit(1)
             query_text = GraphQLFileHandler.parse_graphql_file(file)
 
+        cached_analysis = _cached_analysis(query_text) if validate and query_text else {}
+
         schema = QueryUpdate(
             name=new_name,
             description=description,
             query_text=query_text,
+            **cached_analysis,
         )
 
         with console.status("[bold green]Updating query..."):
-            updated_query = manager.update_query(target_id, schema, validate=validate)
+            updated_query = manager.update_query(
+                target_id, schema, validate=validate and not cached_analysis
+            )
 
         if updated_query:
-            rprint("[green]✓[/green] Query updated successfully")
+            if validate and query_text and not cached_analysis:
+                _validation_cache.put(query_text, updated_query.query_metadata)
+
+            console.print("[green]✓[/green] Query updated successfully")
             if validate and query_text and updated_query.query_metadata.get("complexity_score"):
                 score = updated_query.query_metadata["complexity_score"]
-                rprint(f"New complexity score: {score:.2f}")
+                console.print(f"New complexity score: {score:.2f}")
         else:
-            rprint("[red]Query not found or update failed[/red]")
+            err_console.print("[red]Query not found or update failed[/red]")
             raise typer.Exit(1)
 
-    except ValueError as e:
-        rprint(f"[red]Invalid query ID: {e}[/red]")
-        raise typer.Exit(1)
     except Exception as e:
-        rprint(f"[red]Error updating query: {e}[/red]")
+        err_console.print(f"[red]Error updating query: {e}[/red]")
         raise typer.Exit(1)
 
 
 @query_app.command("delete")
 def delete_query(
-    query_id: Optional[str] = typer.Option(None, "--id", help="Query ID"),
-    name: Optional[str] = typer.Option(None, "--name", "-n", help="Query name"),
+    query_id: Optional[UUID] = _QUERY_ID_OPTION,
+    name: Optional[str] = _QUERY_NAME_OPTION,
     confirm: bool = typer.Option(False, "--confirm", help="Skip confirmation prompt"),
 ):
     """Delete a query."""
     if not query_id and not name:
-        rprint("[red]Error: Must specify either --id or --name[/red]")
+        err_console.print("[red]Error: Must specify either --id or --name[/red]")
         raise typer.Exit(1)
 
     try:
         manager = get_query_manager()
 
         # Get query first to confirm
-        if query_id:
-            target_id = UUID(query_id)
-            query = manager.get_query(target_id)
-        else:
-            filter_params = QuerySearchFilter(text=name, limit=1)
-            queries = manager.search_queries(filter_params)
-            if not queries:
-                rprint("[red]Query not found[/red]")
-                raise typer.Exit(1)
-            query = queries[0]
-            target_id = query.pk_query
-
+        query = _resolve_query(manager, query_id, name)
         if not query:
-            rprint("[red]Query not found[/red]")
+            err_console.print("[red]Query not found[/red]")
             raise typer.Exit(1)
+        target_id = query_id or query.pk_query
 
         # Confirm deletion
         if not confirm:
-            rprint(f"[yellow]Are you sure you want to delete query '{query.name}'?[/yellow]")
+            console.print(f"[yellow]Are you sure you want to delete query '{query.name}'?[/yellow]")
             if not typer.confirm("Continue?"):
-                rprint("Cancelled")
+                console.print("Cancelled")
                 raise typer.Exit(0)
 
         with console.status(f"[bold red]Deleting query '{query.name}'..."):
             success = manager.delete_query(target_id)
 
         if success:
-            rprint(f"[green]✓[/green] Query '{query.name}' deleted successfully")
+            console.print(f"[green]✓[/green] Query '{query.name}' deleted successfully")
         else:
-            rprint("[red]Failed to delete query[/red]")
+            err_console.print("[red]Failed to delete query[/red]")
             raise typer.Exit(1)
 
-    except ValueError as e:
-        rprint(f"[red]Invalid query ID: {e}[/red]")
-        raise typer.Exit(1)
     except Exception as e:
-        rprint(f"[red]Error deleting query: {e}[/red]")
+        err_console.print(f"[red]Error deleting query: {e}[/red]")
         raise typer.Exit(1)
 
 
 @query_app.command("validate")
 def validate_queries(
-    query_id: Optional[str] = typer.Option(None, "--id", help="Validate specific query"),
-    collection_id: Optional[str] = typer.Option(None, "--collection", help="Validate collection"),
+    query_id: Optional[UUID] = typer.Option(None, "--id", help="Validate specific query"),
+    collection_id: Optional[UUID] = typer.Option(None, "--collection", help="Validate collection"),
     fix_issues: bool = typer.Option(False, "--fix", help="Attempt to fix validation issues"),
 ):
     """Validate GraphQL query syntax."""
@@ -476,63 +616,104 @@ def validate_queries(
 
         if query_id:
             # Validate single query
-            query = manager.get_query(UUID(query_id))
+            query = manager.get_query(query_id)
             if not query:
-                rprint("[red]Query not found[/red]")
+                err_console.print("[red]Query not found[/red]")
                 raise typer.Exit(1)
 
             with console.status(f"[bold green]Validating query '{query.name}'..."):
-                # Re-analyze the query
-                complexity_analyzer = QueryComplexityAnalyzer()
                 try:
-                    analysis = complexity_analyzer.analyze_query(query.query_text)
-                    rprint(f"[green]✓[/green] Query '{query.name}' is valid")
-                    rprint(f"Complexity: {analysis.complexity_score:.2f}")
-                    rprint(f"Depth: {analysis.depth}")
-                    rprint(f"Field count: {analysis.field_count}")
+                    analysis = _analyze_cached(query.query_text)
+                    console.print(f"[green]✓[/green] Query '{query.name}' is valid")
+                    console.print(f"Complexity: {analysis.complexity_score:.2f}")
+                    console.print(f"Depth: {analysis.depth}")
+                    console.print(f"Field count: {analysis.field_count}")
                 except Exception as e:
-                    rprint(f"[red]✗[/red] Query '{query.name}' validation failed: {e}")
+                    console.print(f"[red]✗[/red] Query '{query.name}' validation failed: {e}")
 
         elif collection_id:
             # Validate all queries in collection
             with console.status("[bold green]Validating collection queries..."):
-                results = manager.validate_all_queries(UUID(collection_id))
+                queries = _collection_queries(manager, collection_id)
+                results = _validate_collection(queries)
 
-            rprint("[green]Validation Results:[/green]")
-            rprint(f"Total queries: {results['total']}")
-            rprint(f"Valid: {results['valid']}")
-            rprint(f"Invalid: {results['invalid']}")
+            console.print("[green]Validation Results:[/green]")
+            console.print(f"Total queries: {results['total']}")
+            console.print(f"Valid: {results['valid']}")
+            console.print(f"Invalid: {results['invalid']}")
 
             if results["errors"]:
-                rprint("\n[red]Errors found:[/red]")
+                console.print("\n[red]Errors found:[/red]")
                 for error in results["errors"]:
-                    rprint(f"- {error['query_name']}: {error['error']}")
+                    console.print(f"- {error['query_name']}: {error['error']}")
 
         else:
             # Validate all queries (simplified)
-            rprint("[yellow]Validating all queries not implemented yet[/yellow]")
+            console.print("[yellow]Validating all queries not implemented yet[/yellow]")
 
-    except ValueError as e:
-        rprint(f"[red]Invalid ID: {e}[/red]")
-        raise typer.Exit(1)
     except Exception as e:
-        rprint(f"[red]Error validating queries: {e}[/red]")
+        err_console.print(f"[red]Error validating queries: {e}[/red]")
         raise typer.Exit(1)
 
 
-def _interactive_query_input() -> str:
-    """Interactive query input using editor."""
-    rprint("[yellow]Enter your GraphQL query (Ctrl+D to finish):[/yellow]")
+_EDITOR_HINT = "# Write your GraphQL query below, then save and close the editor.\n"
+_EDITOR_TEMPLATE = _EDITOR_HINT + "query {\n  \n}\n"
 
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
 
-    return "\n".join(lines)
+def _interactive_query_input(validate: bool = False) -> str:
+    """Interactive query input using editor.
+
+    Opens ``$EDITOR`` on a query template when run from a terminal. With
+    ``validate``, syntax errors are reported straight away and the query can
+    be fixed in the editor before anything else runs. Piped input is read
+    from stdin as-is.
+    """
+    if not sys.stdin.isatty():
+        console.print("[yellow]Enter your GraphQL query (Ctrl+D to finish):[/yellow]")
+
+        # Read everything up to EOF in one call rather than one input() per line
+        return sys.stdin.read().rstrip("\n")
+
+    text = _EDITOR_TEMPLATE
+    while True:
+        edited = click.edit(text, extension=".graphql")
+        if edited is None:
+            err_console.print("[red]No query entered[/red]")
+            raise typer.Exit(1)
+
+        query_text = edited.replace(_EDITOR_HINT, "", 1).strip()
+        if not validate:
+            return query_text
+
+        try:
+            GraphQLFileHandler.validate_query_syntax(query_text)
+            return query_text
+        except ValueError as e:
+            err_console.print(f"[red]{e}[/red]")
+            if not typer.confirm("Edit the query again?", default=True):
+                raise typer.Exit(1)
+            text = edited
+
+
+def _resolve_query(manager, query_id: Optional[UUID], name: Optional[str]):
+    """Look up a single query by ID or exact name."""
+    if query_id:
+        return manager.get_query(query_id)
+    return manager.get_query_by_name(name)
+
+
+def _iter_json(queries):
+    """Yield queries as an indented JSON array, one element at a time.
+
+    Produces the same text as serializing the whole list with ``indent=True``
+    without holding the whole document in memory.
+    """
+    separator = "[\n"
+    for query in queries:
+        element = dumps(query.to_dict(), indent=True)
+        yield separator + "  " + element.replace("\n", "\n  ")
+        separator = ",\n"
+    yield "\n]\n" if separator == ",\n" else "[]\n"
 
 
 def _output_csv(queries):
@@ -541,15 +722,17 @@ def _output_csv(queries):
 
     writer = csv.writer(sys.stdout)
     writer.writerow(["ID", "Name", "Description", "Status", "Created", "Tags"])
+    writer.writerows(_csv_rows(queries))
+
 
+def _csv_rows(queries):
+    """Yield one CSV row tuple per query."""
     for query in queries:
-        writer.writerow(
-            [
-                str(query.pk_query),
-                query.name,
-                query.description or "",
-                getattr(query, "status", "active"),
-                query.created_at.isoformat() if query.created_at else "",
-                ",".join(query.tags) if query.tags else "",
-            ]
+        yield (
+            str(query.pk_query),
+            query.name,
+            query.description or "",
+            getattr(query, "status", "active"),
+            query.created_at.isoformat() if query.created_at else "",
+            ",".join(query.tags) if query.tags else "",
         )
@@ -1,26 +1,81 @@
 """FraiseQL Doctor CLI application."""
 
+import importlib
 from typing import Optional
 
+import click
 import typer
-from rich import print as rprint
+from typer.core import TyperGroup
+
+# Command groups are imported only when invoked, so `--version` and `--help`
+# don't pay for loading every command module (and their Rich/YAML imports).
+COMMAND_GROUPS = {
+    "query": ("fraiseql_doctor.cli.commands.query:query_app", "📝 Manage GraphQL queries"),
+    "endpoint": (
+        "fraiseql_doctor.cli.commands.endpoint:endpoint_app",
+        "🌐 Manage GraphQL endpoints",
+    ),
+    "health": ("fraiseql_doctor.cli.commands.health:health_app", "💚 Monitor endpoint health"),
+    "batch": ("fraiseql_doctor.cli.commands.batch:batch_app", "🔄 Batch operations for queries"),
+    "config": ("fraiseql_doctor.cli.commands.config:config_app", "⚙️ Configuration management"),
+}
+
+
+class LazyCommandGroup(TyperGroup):
+    """Placeholder for a command group whose module is imported on first use."""
+
+    def __init__(self, name: str, import_path: str, help: str):
+        super().__init__(name=name, help=help)
+        self.import_path = import_path
+        self._command: Optional[click.Group] = None
+
+    def load(self) -> click.Group:
+        """Import the Typer app and build its Click group."""
+        if self._command is None:
+            module_name, attr = self.import_path.split(":")
+            sub_app = getattr(importlib.import_module(module_name), attr)
+            command = typer.main.get_group(sub_app)
+            command.name = self.name
+            command.help = self.help
+            self._command = command
+        return self._command
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+    def list_commands(self, ctx):
+        return self.load().list_commands(ctx)
+
+    def get_command(self, ctx, cmd_name):
+        return self.load().get_command(ctx, cmd_name)
+
+
+class RootGroup(TyperGroup):
+    """Root group that registers the lazily loaded command groups."""
+
+    def __init__(self, **attrs):
+        super().__init__(**attrs)
+        for name, (import_path, help_text) in COMMAND_GROUPS.items():
+            self.add_command(LazyCommandGroup(name, import_path, help_text))
+
+    def list_commands(self, ctx):
+        # Keep registration order rather than Click's alphabetical default
+        return list(self.commands)
 
-from .commands.batch import batch_app
-from .commands.config import config_app
-from .commands.endpoint import endpoint_app
-from .commands.health import health_app
-from .commands.query import query_app
 
 app = typer.Typer(
     name="fraiseql-doctor",
     help="Health monitoring and query execution tool for FraiseQL/GraphQL endpoints",
     rich_markup_mode="rich",
     no_args_is_help=True,
+    cls=RootGroup,
 )
 
 
 def version_callback(value: bool):
     if value:
+        from rich import print as rprint
+
         rprint("[bold cyan]FraiseQL Doctor v0.1.0[/bold cyan]")
         rprint(
             "Test-driven health monitoring and query execution tool for FraiseQL/GraphQL endpoints"
@@ -56,12 +111,5 @@ def main(
         logging.basicConfig(level=logging.DEBUG)
 
 
-# Register command groups
-app.add_typer(query_app, name="query", help="📝 Manage GraphQL queries")
-app.add_typer(endpoint_app, name="endpoint", help="🌐 Manage GraphQL endpoints")
-app.add_typer(health_app, name="health", help="💚 Monitor endpoint health")
-app.add_typer(batch_app, name="batch", help="🔄 Batch operations for queries")
-app.add_typer(config_app, name="config", help="⚙️ Configuration management")
-
 if __name__ == "__main__":
     app()
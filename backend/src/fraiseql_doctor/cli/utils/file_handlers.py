@@ -1,23 +1,207 @@
-"""File parsing and handling utilities for CLI."""
+"""File parsing and handling utilities for CLI.
+
+PyYAML and graphql-core are imported on first use: together they make up
+most of the CLI's start-up time, and most commands need neither.
+"""
 
 import json
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any, NamedTuple, Union
+
+from ...utils.serialization import dump_bytes, dumps, loads
+
+if TYPE_CHECKING:
+    from graphql import DocumentNode
+
+# graphql-core names this module used to import eagerly, still served by __getattr__
+_LAZY_GRAPHQL_NAMES = {
+    "DocumentNode",
+    "GraphQLError",
+    "Visitor",
+    "build_client_schema",
+    "get_introspection_query",
+    "parse",
+    "validate",
+    "visit",
+}
+
+
+@lru_cache(maxsize=1)
+def _graphql():
+    """Import graphql-core, or return None if it is not installed."""
+    try:
+        import graphql
+    except ImportError:
+        return None
+    return graphql
+
+
+class _FallbackGraphQLError(Exception):
+    """Syntax error raised by the basic checks used without graphql-core."""
+
+
+def _syntax_error() -> type[Exception]:
+    """Return the exception type raised for GraphQL syntax errors."""
+    graphql = _graphql()
+    return graphql.GraphQLError if graphql is not None else _FallbackGraphQLError
+
+
+def _parse(query_string: str):
+    """Parse a query with graphql-core, or sanity-check it when that isn't installed."""
+    graphql = _graphql()
+    if graphql is not None:
+        return graphql.parse(query_string)
+
+    # Provide a basic fallback if graphql-core is not available:
+    # just check it's not empty
+    if not query_string.strip():
+        raise _FallbackGraphQLError("Empty query")
+    return True
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily imported graphql-core names (PEP 562)."""
+    if name in _LAZY_GRAPHQL_NAMES and (graphql := _graphql()) is not None:
+        return getattr(graphql, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _query_info_visitor() -> type:
+    """Build the query info visitor class once graphql-core is loaded."""
+    graphql = _graphql()
+    if graphql is None:
+        raise _FallbackGraphQLError("graphql-core is required to inspect queries")
+
+    class QueryInfoVisitor(graphql.Visitor):
+        """Collect a document's operations and fragments.
+
+        Only top-level definitions matter, so selection sets are never descended into.
+        """
+
+        def __init__(self):
+            super().__init__()
+            self.operations: list[dict[str, Any]] = []
+            self.fragments: list[dict[str, Any]] = []
+
+        def enter_operation_definition(self, node, *_):
+            selection_set = node.selection_set
+            self.operations.append(
+                {
+                    "operation": node.operation.value,
+                    "name": node.name.value if node.name else None,
+                    "selection_count": len(selection_set.selections) if selection_set else 0,
+                }
+            )
+            return self.SKIP
+
+        def enter_fragment_definition(self, node, *_):
+            self.fragments.append({"name": node.name.value, "type": node.type_condition.name.value})
+            return self.SKIP
+
+    return QueryInfoVisitor
+
+
+class _YamlClasses(NamedTuple):
+    loader: type
+    dumper: type
+    export_dumper: type
+
+
+@lru_cache(maxsize=1)
+def _yaml_classes() -> _YamlClasses:
+    """Import PyYAML and pick the loader/dumper classes to use.
+
+    Uses the libyaml-backed loader/dumper when PyYAML was built with it,
+    the pure Python ones otherwise.
+    """
+    try:
+        from yaml import CSafeDumper as Dumper
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+        from yaml import SafeLoader as Loader
+
+    class ExportDumper(Dumper):
+        """YAML dumper that writes values YAML can't represent (UUIDs...) as strings."""
+
+    ExportDumper.add_multi_representer(
+        object, lambda dumper, value: dumper.represent_str(str(value))
+    )
+    return _YamlClasses(Loader, Dumper, ExportDumper)
+
+
+@lru_cache(maxsize=256)
+def _cached_parse(query: str):
+    """Parse a query string, memoized on the raw text.
+
+    Callers only read the returned document, so one AST can be shared by
+    syntax validation, info extraction and variable checks on the same query.
+    """
+    return _parse(query)
+
+
+@lru_cache(maxsize=512)
+def _read_graphql_file(path: str, mtime_ns: int, size: int) -> str:
+    """Read a GraphQL file's stripped text.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    file is re-read while an unchanged one is served from memory.
+    """
+    content = Path(path).read_text(encoding="utf-8").strip()
+    if not content:
+        raise ValueError("GraphQL file is empty")
+
+    return content
+
+
+def _load_yaml(content: str) -> Any:
+    """Load a YAML document with the preferred safe loader."""
+    import yaml
+
+    return yaml.load(content, Loader=_yaml_classes().loader)
+
+
+def _load_yaml_variables(content: str) -> Any:
+    """Load a YAML variables file; an empty document means no variables."""
+    return _load_yaml(content) or {}
+
+
+def _load_csv(content: str) -> list[dict[str, Any]]:
+    """Read CSV rows as dicts, decoding cells that hold JSON objects or arrays."""
+    import csv
+    import io
 
-import yaml
+    data = []
+    for row in csv.DictReader(io.StringIO(content)):
+        # Try to parse JSON fields
+        parsed_row = {}
+        for key, value in row.items():
+            # Check the first character; only strip when it is whitespace
+            head = value[:1]
+            if head.isspace():
+                head = value.lstrip()[:1]
+            if head and head in "{[":
+                try:
+                    parsed_row[key] = loads(value)
+                except json.JSONDecodeError:
+                    parsed_row[key] = value
+            else:
+                parsed_row[key] = value
+        data.append(parsed_row)
+    return data
 
-try:
-    from graphql import GraphQLError, build_client_schema, get_introspection_query, parse, validate
-except ImportError:
-    # Provide a basic fallback if graphql-core is not available
-    class GraphQLError(Exception):
-        pass
 
-    def parse(query_string):
-        # Basic validation - just check it's not empty
-        if not query_string.strip():
-            raise GraphQLError("Empty query")
-        return True
+# Readers and output suffixes, keyed by lower-cased file suffix / format name
+_VARIABLE_READERS = {".json": loads, ".yaml": _load_yaml_variables, ".yml": _load_yaml_variables}
+_VARIABLE_SUFFIXES = {"json": ".json", "yaml": ".yaml", "yml": ".yaml"}
+_IMPORT_READERS = {".json": loads, ".yaml": _load_yaml, ".yml": _load_yaml, ".csv": _load_csv}
+_EXPORT_SUFFIXES = {"json": ".json", "yaml": ".yaml", "yml": ".yaml", "csv": ".csv"}
 
 
 class GraphQLFileHandler:
@@ -49,17 +233,41 @@ class GraphQLFileHandler:
             )
 
         try:
-            content = file_path.read_text(encoding="utf-8").strip()
-            if not content:
-                raise ValueError("GraphQL file is empty")
-
-            return content
+            stat = file_path.stat()
+            return _read_graphql_file(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
 
         except UnicodeDecodeError as e:
             raise ValueError(f"Cannot decode file {file_path}: {e}") from e
         except PermissionError as e:
             raise ValueError(f"Cannot read file {file_path}: {e}") from e
 
+    @staticmethod
+    def parse_graphql_file_ast(file_path: Path) -> "DocumentNode":
+        """Parse GraphQL file and return its document AST.
+
+        Both the file contents (keyed by path, mtime and size) and the parsed
+        document are cached, so an unchanged file is neither re-read nor
+        re-parsed.
+
+        Args:
+        ----
+            file_path: Path to GraphQL file
+
+        Returns:
+        -------
+            Parsed GraphQL document
+
+        Raises:
+        ------
+            ValueError: If the file is invalid or has syntax errors
+            FileNotFoundError: If file doesn't exist
+        """
+        query = GraphQLFileHandler.parse_graphql_file(file_path)
+        try:
+            return _cached_parse(query)
+        except _syntax_error() as e:
+            raise ValueError(f"GraphQL syntax error: {e}") from e
+
     @staticmethod
     def validate_query_syntax(query: str) -> bool:
         """Validate GraphQL query syntax.
@@ -78,7 +286,7 @@ class GraphQLFileHandler:
         """
         try:
             # Parse the query to check syntax
-            parsed = parse(query)
+            parsed = _cached_parse(query)
 
             # Basic validation without schema
             # For full validation, we'd need the target GraphQL schema
@@ -87,47 +295,30 @@ class GraphQLFileHandler:
 
             return True
 
-        except GraphQLError as e:
+        except _syntax_error() as e:
             raise ValueError(f"GraphQL syntax error: {e}") from e
         except Exception as e:
             raise ValueError(f"Query validation failed: {e}") from e
 
     @staticmethod
-    def extract_query_info(query: str) -> dict[str, Any]:
+    def extract_query_info(query: Union[str, "DocumentNode"]) -> dict[str, Any]:
         """Extract information from GraphQL query.
 
         Args:
         ----
-            query: GraphQL query string
+            query: GraphQL query string or an already parsed document
 
         Returns:
         -------
             Dictionary with query information
         """
         try:
-            parsed = parse(query)
+            parsed = _cached_parse(query) if isinstance(query, str) else query
 
-            operations = []
-            fragments = []
-
-            for definition in parsed.definitions:
-                if hasattr(definition, "operation"):
-                    operations.append(
-                        {
-                            "operation": definition.operation.value,
-                            "name": definition.name.value if definition.name else None,
-                            "selection_count": len(definition.selection_set.selections)
-                            if definition.selection_set
-                            else 0,
-                        }
-                    )
-                elif hasattr(definition, "name") and definition.kind == "fragment_definition":
-                    fragments.append(
-                        {
-                            "name": definition.name.value,
-                            "type": definition.type_condition.name.value,
-                        }
-                    )
+            visitor = _query_info_visitor()()
+            _graphql().visit(parsed, visitor)
+            operations = visitor.operations
+            fragments = visitor.fragments
 
             return {
                 "operations": operations,
@@ -160,22 +351,23 @@ class VariableFileHandler:
             ValueError: If file cannot be parsed
             FileNotFoundError: If file doesn't exist
         """
+        import yaml
+
         try:
             content = file_path.read_text(encoding="utf-8")
 
-            if file_path.suffix.lower() in {".json"}:
-                return json.loads(content)
-            elif file_path.suffix.lower() in {".yaml", ".yml"}:
-                return yaml.safe_load(content) or {}
-            else:
-                # Try to auto-detect format
+            reader = _VARIABLE_READERS.get(file_path.suffix.lower())
+            if reader is not None:
+                return reader(content)
+
+            # Try to auto-detect format
+            try:
+                return loads(content)
+            except json.JSONDecodeError:
                 try:
-                    return json.loads(content)
-                except json.JSONDecodeError:
-                    try:
-                        return yaml.safe_load(content) or {}
-                    except yaml.YAMLError as e:
-                        raise ValueError(f"Cannot parse file as JSON or YAML: {e}") from e
+                    return _load_yaml_variables(content)
+                except yaml.YAMLError as e:
+                    raise ValueError(f"Cannot parse file as JSON or YAML: {e}") from e
 
         except UnicodeDecodeError as e:
             raise ValueError(f"Cannot decode file {file_path}: {e}") from e
@@ -196,17 +388,22 @@ class VariableFileHandler:
             variables: Variables dictionary
             format: Output format ('json' or 'yaml')
         """
+        suffix = _VARIABLE_SUFFIXES.get(format.lower())
+        if suffix is None:
+            raise ValueError(f"Unsupported format: {format}")
+
         try:
-            if format.lower() == "json":
-                content = json.dumps(variables, indent=2)
-                if file_path.suffix == "":
-                    file_path = file_path.with_suffix(".json")
-            elif format.lower() in {"yaml", "yml"}:
-                content = yaml.safe_dump(variables, default_flow_style=False, indent=2)
-                if file_path.suffix == "":
-                    file_path = file_path.with_suffix(".yaml")
+            if suffix == ".json":
+                content = dumps(variables, indent=True)
             else:
-                raise ValueError(f"Unsupported format: {format}")
+                import yaml
+
+                content = yaml.dump(
+                    variables, Dumper=_yaml_classes().dumper, default_flow_style=False, indent=2
+                )
+
+            if file_path.suffix == "":
+                file_path = file_path.with_suffix(suffix)
 
             file_path.write_text(content, encoding="utf-8")
 
@@ -214,13 +411,15 @@ class VariableFileHandler:
             raise ValueError(f"Cannot write file {file_path}: {e}") from e
 
     @staticmethod
-    def validate_variables(variables: dict[str, Any], query: str) -> list[str]:
+    def validate_variables(
+        variables: dict[str, Any], query: Union[str, "DocumentNode"]
+    ) -> list[str]:
         """Validate that variables match query requirements.
 
         Args:
         ----
             variables: Variables dictionary
-            query: GraphQL query string
+            query: GraphQL query string or an already parsed document
 
         Returns:
         -------
@@ -230,7 +429,7 @@ class VariableFileHandler:
 
         try:
             # Parse query to find variable definitions
-            parsed = parse(query)
+            parsed = _cached_parse(query) if isinstance(query, str) else query
 
             required_vars = set()
             optional_vars = set()
@@ -272,6 +471,58 @@ class VariableFileHandler:
         return errors
 
 
+@contextmanager
+def _replacing(path: Path, mode: str, **open_kwargs) -> Iterator[IO]:
+    """Open a temporary file next to ``path`` that replaces it once fully written.
+
+    If writing fails, the temporary file is removed and ``path`` is left as it was.
+    """
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with open(fd, mode, **open_kwargs) as f:
+            yield f
+        # mkstemp creates the file private; give it the mode the file would normally get
+        try:
+            file_mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            file_mode = 0o666 & ~umask
+        os.chmod(temp_name, file_mode)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _csv_rows(queries: list[dict[str, Any]], fields: list[str]):
+    """Yield one CSV row per query, in ``fields`` order.
+
+    Missing and ``None`` values become empty cells and nested values (dicts
+    and lists, including subclasses such as ``OrderedDict``) are JSON-encoded.
+    Plain dicts, lists and strings, which is what ``to_dict()`` and JSON/YAML
+    loads produce, are recognised by exact type before falling back to
+    ``isinstance``.
+    """
+    _dumps = dumps
+    _dict, _list, _str = dict, list, str
+    _nested = (dict, list)
+    for query in queries:
+        get = query.get
+        yield [
+            ""
+            if (value := get(field)) is None
+            else _dumps(value)
+            if (kind := value.__class__) is _dict or kind is _list
+            else value
+            if kind is _str
+            else _dumps(value)
+            if isinstance(value, _nested)
+            else str(value)
+            for field in fields
+        ]
+
+
 class ExportHandler:
     """Handle query and result export operations."""
 
@@ -287,55 +538,46 @@ class ExportHandler:
             output_path: Output file path
             format: Export format ('json', 'yaml', 'csv')
         """
+        suffix = _EXPORT_SUFFIXES.get(format.lower())
+        if suffix is None:
+            raise ValueError(f"Unsupported export format: {format}")
+
         try:
-            if format.lower() == "json":
-                content = json.dumps(queries, indent=2, default=str)
-                if output_path.suffix == "":
-                    output_path = output_path.with_suffix(".json")
-
-            elif format.lower() in {"yaml", "yml"}:
-                content = yaml.safe_dump(queries, default_flow_style=False, indent=2, default=str)
-                if output_path.suffix == "":
-                    output_path = output_path.with_suffix(".yaml")
-
-            elif format.lower() == "csv":
-                import csv
-                import io
-
-                if not queries:
-                    content = ""
-                else:
-                    output = io.StringIO()
-
-                    # Get all possible field names
-                    all_fields = set()
-                    for query in queries:
-                        all_fields.update(query.keys())
-
-                    fields = sorted(all_fields)
-                    writer = csv.DictWriter(output, fieldnames=fields)
-
-                    writer.writeheader()
-                    for query in queries:
-                        # Convert complex values to strings
-                        row = {}
-                        for field in fields:
-                            value = query.get(field, "")
-                            if isinstance(value, (dict, list)):
-                                row[field] = json.dumps(value)
-                            else:
-                                row[field] = str(value) if value is not None else ""
-                        writer.writerow(row)
-
-                    content = output.getvalue()
-
-                if output_path.suffix == "":
-                    output_path = output_path.with_suffix(".csv")
+            if output_path.suffix == "":
+                output_path = output_path.with_suffix(suffix)
+
+            # Stream into a temporary file instead of building the whole document first;
+            # it only replaces the output once complete, so a failed export keeps the old file
+            if suffix == ".json":
+                # JSON is encoded as UTF-8 bytes already, so bypass the text layer
+                with _replacing(output_path, "wb", buffering=1 << 20) as f:
+                    dump_bytes(queries, f, indent=True)
+                return
+
+            newline = "" if suffix == ".csv" else None
+            with _replacing(
+                output_path, "w", encoding="utf-8", newline=newline, buffering=1 << 20
+            ) as f:
+                if suffix == ".yaml":
+                    import yaml
+
+                    yaml.dump(
+                        queries,
+                        f,
+                        Dumper=_yaml_classes().export_dumper,
+                        default_flow_style=False,
+                        indent=2,
+                    )
 
-            else:
-                raise ValueError(f"Unsupported export format: {format}")
+                elif queries:
+                    import csv
+
+                    # Get all possible field names, in first-seen order
+                    fields = list(dict.fromkeys(key for query in queries for key in query))
+                    writer = csv.writer(f)
 
-            output_path.write_text(content, encoding="utf-8")
+                    writer.writerow(fields)
+                    writer.writerows(_csv_rows(queries, fields))
 
         except PermissionError as e:
             raise ValueError(f"Cannot write file {output_path}: {e}") from e
@@ -352,33 +594,15 @@ class ExportHandler:
         -------
             List of query dictionaries
         """
+        import yaml
+
         try:
             content = file_path.read_text(encoding="utf-8")
 
-            if file_path.suffix.lower() == ".json":
-                data = json.loads(content)
-            elif file_path.suffix.lower() in {".yaml", ".yml"}:
-                data = yaml.safe_load(content)
-            elif file_path.suffix.lower() == ".csv":
-                import csv
-                import io
-
-                reader = csv.DictReader(io.StringIO(content))
-                data = []
-                for row in reader:
-                    # Try to parse JSON fields
-                    parsed_row = {}
-                    for key, value in row.items():
-                        if value.strip().startswith(("{", "[")):
-                            try:
-                                parsed_row[key] = json.loads(value)
-                            except json.JSONDecodeError:
-                                parsed_row[key] = value
-                        else:
-                            parsed_row[key] = value
-                    data.append(parsed_row)
-            else:
+            reader = _IMPORT_READERS.get(file_path.suffix.lower())
+            if reader is None:
                 raise ValueError(f"Unsupported import format: {file_path.suffix}")
+            data = reader(content)
 
             # Ensure data is a list
             if not isinstance(data, list):
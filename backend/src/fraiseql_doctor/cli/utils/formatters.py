@@ -1,20 +1,57 @@
 """Rich formatting utilities for CLI output."""
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
-from ...models.endpoint import Endpoint
-from ...models.execution import Execution
-from ...models.query import Query
-
-
-def format_query_table(queries: list[Query]) -> Table:
+from ...utils.serialization import dumps, dumps_head
+
+# The models (and SQLAlchemy with them) are only needed for annotations; the
+# detail views import Panel/Syntax (and with them Pygments) when first used.
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from rich.progress import Progress
+
+    from ...models.endpoint import Endpoint
+    from ...models.execution import Execution
+    from ...models.query import Query
+
+# Status cells are shared by every row that needs them; Rich only reads a Text
+# when rendering it, so one instance per status is enough.
+_QUERY_STATUS_TEXT = {
+    "active": Text("ACTIVE", style="green"),
+    "draft": Text("DRAFT", style="yellow"),
+    "deprecated": Text("DEPRECATED", style="red"),
+}
+_HEALTH_STATUS_TEXT = {
+    "healthy": Text("HEALTHY", style="green"),
+    "unhealthy": Text("UNHEALTHY", style="red"),
+    "timeout": Text("TIMEOUT", style="yellow"),
+}
+_UNKNOWN_STATUS_TEXT = Text("UNKNOWN", style="dim")
+
+# Detail panels render status as console markup rather than a Text cell.
+_QUERY_STATUS_MARKUP = {
+    "active": "[green]ACTIVE[/green]",
+    "draft": "[yellow]DRAFT[/yellow]",
+    "deprecated": "[red]DEPRECATED[/red]",
+    "error": "[red]ERROR[/red]",
+}
+_HEALTH_STATUS_MARKUP = {
+    "healthy": "[green]HEALTHY[/green]",
+    "unhealthy": "[red]UNHEALTHY[/red]",
+    "timeout": "[yellow]TIMEOUT[/yellow]",
+    "unknown": "[dim]UNKNOWN[/dim]",
+}
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def format_query_table(queries: list["Query"]) -> Table:
     """Format queries as a rich table."""
     table = Table(title="GraphQL Queries", show_header=True, header_style="bold magenta")
 
@@ -28,14 +65,7 @@ def format_query_table(queries: list[Query]) -> Table:
     for query in queries:
         # Format status with color
         status = getattr(query, "status", "active")
-        if status == "active":
-            status_text = Text("ACTIVE", style="green")
-        elif status == "draft":
-            status_text = Text("DRAFT", style="yellow")
-        elif status == "deprecated":
-            status_text = Text("DEPRECATED", style="red")
-        else:
-            status_text = Text(status.upper(), style="white")
+        status_text = _QUERY_STATUS_TEXT.get(status) or Text(status.upper(), style="white")
 
         # Format complexity score
         complexity = query.expected_complexity_score or 0
@@ -46,58 +76,52 @@ def format_query_table(queries: list[Query]) -> Table:
         if len(query.tags) > 3:
             tags_text += "..."
 
-        # Format creation date
-        created_text = query.created_at.strftime("%Y-%m-%d") if query.created_at else "-"
+        # Format creation date; ISO slicing avoids strftime's per-call locale work
+        created_text = query.created_at.isoformat()[:10] if query.created_at else "-"
 
         # Truncate description
-        desc = query.description or ""
-        desc_text = (desc[:50] + "...") if len(desc) > 50 else desc
+        desc_text = _truncate(query.description or "", 50)
 
         table.add_row(query.name, desc_text, status_text, complexity_text, tags_text, created_text)
 
     return table
 
 
-def format_query_detail(query: Query) -> Panel:
+def format_query_detail(query: "Query") -> "Panel":
     """Format query details as a rich panel."""
-    # Query metadata
-    metadata_lines = [
-        f"[cyan]ID:[/cyan] {query.pk_query}",
-        f"[cyan]Name:[/cyan] {query.name}",
-    ]
-
-    if query.description:
-        metadata_lines.append(f"[cyan]Description:[/cyan] {query.description}")
+    from rich.panel import Panel
+    from rich.syntax import Syntax
 
+    # Query metadata; optional lines carry their own leading newline so the
+    # whole block is assembled in one f-string
     status = getattr(query, "status", "active")
-    status_color = {"active": "green", "draft": "yellow", "deprecated": "red", "error": "red"}.get(
-        status, "white"
+    status_markup = _QUERY_STATUS_MARKUP.get(status) or f"[white]{status.upper()}[/white]"
+    description_line = (
+        f"\n[cyan]Description:[/cyan] {query.description}" if query.description else ""
+    )
+    complexity_line = (
+        f"\n[cyan]Complexity Score:[/cyan] {query.expected_complexity_score:.2f}"
+        if query.expected_complexity_score
+        else ""
+    )
+    tags_line = f"\n[cyan]Tags:[/cyan] {', '.join(query.tags)}" if query.tags else ""
+    created_by_line = f"\n[cyan]Created By:[/cyan] {query.created_by}" if query.created_by else ""
+    created_line = (
+        f"\n[cyan]Created:[/cyan] {query.created_at:%Y-%m-%d %H:%M:%S}" if query.created_at else ""
+    )
+    updated_line = (
+        f"\n[cyan]Updated:[/cyan] {query.updated_at:%Y-%m-%d %H:%M:%S}"
+        if query.updated_at and query.updated_at != query.created_at
+        else ""
     )
-    metadata_lines.append(f"[cyan]Status:[/cyan] [{status_color}]{status.upper()}[/{status_color}]")
-
-    if query.expected_complexity_score:
-        metadata_lines.append(
-            f"[cyan]Complexity Score:[/cyan] {query.expected_complexity_score:.2f}"
-        )
-
-    if query.tags:
-        tags_str = ", ".join(query.tags)
-        metadata_lines.append(f"[cyan]Tags:[/cyan] {tags_str}")
-
-    if query.created_by:
-        metadata_lines.append(f"[cyan]Created By:[/cyan] {query.created_by}")
-
-    if query.created_at:
-        metadata_lines.append(
-            f"[cyan]Created:[/cyan] {query.created_at.strftime('%Y-%m-%d %H:%M:%S')}"
-        )
-
-    if query.updated_at and query.updated_at != query.created_at:
-        metadata_lines.append(
-            f"[cyan]Updated:[/cyan] {query.updated_at.strftime('%Y-%m-%d %H:%M:%S')}"
-        )
 
-    metadata_text = "\n".join(metadata_lines)
+    metadata_text = (
+        f"[cyan]ID:[/cyan] {query.pk_query}\n"
+        f"[cyan]Name:[/cyan] {query.name}"
+        f"{description_line}\n"
+        f"[cyan]Status:[/cyan] {status_markup}"
+        f"{complexity_line}{tags_line}{created_by_line}{created_line}{updated_line}"
+    )
 
     # Query text with syntax highlighting
     query_syntax = Syntax(
@@ -107,7 +131,7 @@ def format_query_detail(query: Query) -> Panel:
     # Variables if present
     variables_text = ""
     if query.variables:
-        variables_json = json.dumps(query.variables, indent=2)
+        variables_json = dumps(query.variables, indent=True)
         variables_syntax = Syntax(variables_json, "json", theme="monokai", line_numbers=True)
         variables_text = f"\n\n[cyan]Variables:[/cyan]\n{variables_syntax}"
 
@@ -120,7 +144,7 @@ def format_query_detail(query: Query) -> Panel:
             if k in ["complexity_score", "field_count", "depth", "estimated_cost", "last_validated"]
         }
         if interesting_metadata:
-            metadata_json = json.dumps(interesting_metadata, indent=2, default=str)
+            metadata_json = dumps(interesting_metadata, indent=True)
             metadata_syntax = Syntax(metadata_json, "json", theme="monokai")
             metadata_info = f"\n\n[cyan]Analysis Metadata:[/cyan]\n{metadata_syntax}"
 
@@ -129,7 +153,7 @@ def format_query_detail(query: Query) -> Panel:
     return Panel(content, title=f"Query: {query.name}", title_align="left", border_style="blue")
 
 
-def format_endpoint_table(endpoints: list[Endpoint]) -> Table:
+def format_endpoint_table(endpoints: list["Endpoint"]) -> Table:
     """Format endpoints as a rich table."""
     table = Table(title="GraphQL Endpoints", show_header=True, header_style="bold magenta")
 
@@ -143,14 +167,7 @@ def format_endpoint_table(endpoints: list[Endpoint]) -> Table:
     for endpoint in endpoints:
         # Format status with color
         status = getattr(endpoint, "status", "unknown")
-        if status == "healthy":
-            status_text = Text("HEALTHY", style="green")
-        elif status == "unhealthy":
-            status_text = Text("UNHEALTHY", style="red")
-        elif status == "timeout":
-            status_text = Text("TIMEOUT", style="yellow")
-        else:
-            status_text = Text("UNKNOWN", style="dim")
+        status_text = _HEALTH_STATUS_TEXT.get(status, _UNKNOWN_STATUS_TEXT)
 
         # Format auth method
         auth_method = endpoint.auth_config.get("method", "none") if endpoint.auth_config else "none"
@@ -161,11 +178,12 @@ def format_endpoint_table(endpoints: list[Endpoint]) -> Table:
 
         # Format last check
         last_check = getattr(endpoint, "last_health_check", None)
-        last_check_text = last_check.strftime("%m-%d %H:%M") if last_check else "-"
+        last_check_text = (
+            last_check.isoformat(sep=" ", timespec="minutes")[5:16] if last_check else "-"
+        )
 
         # Truncate URL for display
-        url = endpoint.url
-        url_text = (url[:40] + "...") if len(url) > 40 else url
+        url_text = _truncate(endpoint.url, 40)
 
         table.add_row(
             endpoint.name, url_text, status_text, auth_text, timeout_text, last_check_text
@@ -174,46 +192,33 @@ def format_endpoint_table(endpoints: list[Endpoint]) -> Table:
     return table
 
 
-def format_endpoint_detail(endpoint: Endpoint) -> Panel:
+def format_endpoint_detail(endpoint: "Endpoint") -> "Panel":
     """Format endpoint details as a rich panel."""
-    metadata_lines = [
-        f"[cyan]ID:[/cyan] {endpoint.pk_endpoint}",
-        f"[cyan]Name:[/cyan] {endpoint.name}",
-        f"[cyan]URL:[/cyan] {endpoint.url}",
-        f"[cyan]Timeout:[/cyan] {endpoint.timeout_seconds}s",
-    ]
+    from rich.panel import Panel
+    from rich.syntax import Syntax
 
-    if endpoint.description:
-        metadata_lines.append(f"[cyan]Description:[/cyan] {endpoint.description}")
+    description_line = (
+        f"\n[cyan]Description:[/cyan] {endpoint.description}" if endpoint.description else ""
+    )
 
     # Status
     status = getattr(endpoint, "status", "unknown")
-    status_color = {
-        "healthy": "green",
-        "unhealthy": "red",
-        "timeout": "yellow",
-        "unknown": "dim",
-    }.get(status, "white")
-    metadata_lines.append(f"[cyan]Status:[/cyan] [{status_color}]{status.upper()}[/{status_color}]")
+    status_markup = _HEALTH_STATUS_MARKUP.get(status) or f"[white]{status.upper()}[/white]"
 
     # Auth configuration
+    auth_lines = ""
     if endpoint.auth_config:
         auth_method = endpoint.auth_config.get("method", "none")
-        metadata_lines.append(f"[cyan]Auth Method:[/cyan] {auth_method.upper()}")
+        auth_lines = f"\n[cyan]Auth Method:[/cyan] {auth_method.upper()}"
 
         if auth_method == "bearer" and endpoint.auth_config.get("token"):
-            token_preview = (
-                endpoint.auth_config["token"][:10] + "..."
-                if len(endpoint.auth_config["token"]) > 10
-                else endpoint.auth_config["token"]
-            )
-            metadata_lines.append(f"[cyan]Token:[/cyan] {token_preview}")
+            auth_lines += f"\n[cyan]Token:[/cyan] {_truncate(endpoint.auth_config['token'], 10)}"
         elif auth_method == "basic" and endpoint.auth_config.get("username"):
-            metadata_lines.append(f"[cyan]Username:[/cyan] {endpoint.auth_config['username']}")
+            auth_lines += f"\n[cyan]Username:[/cyan] {endpoint.auth_config['username']}"
 
     # Custom headers
     if endpoint.custom_headers:
-        headers_json = json.dumps(endpoint.custom_headers, indent=2)
+        headers_json = dumps(endpoint.custom_headers, indent=True)
         headers_syntax = Syntax(headers_json, "json", theme="monokai", line_numbers=True)
         headers_text = f"\n\n[cyan]Custom Headers:[/cyan]\n{headers_syntax}"
     else:
@@ -223,27 +228,35 @@ def format_endpoint_detail(endpoint: Endpoint) -> Panel:
     health_info = ""
     last_check = getattr(endpoint, "last_health_check", None)
     if last_check:
-        health_info = (
-            f"\n[cyan]Last Health Check:[/cyan] {last_check.strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+        health_info = f"\n[cyan]Last Health Check:[/cyan] {last_check:%Y-%m-%d %H:%M:%S}"
 
     # Additional metadata
     metadata_info = ""
     if endpoint.endpoint_metadata:
-        metadata_json = json.dumps(endpoint.endpoint_metadata, indent=2, default=str)
+        metadata_json = dumps(endpoint.endpoint_metadata, indent=True)
         metadata_syntax = Syntax(metadata_json, "json", theme="monokai")
         metadata_info = f"\n\n[cyan]Metadata:[/cyan]\n{metadata_syntax}"
 
-    metadata_text = "\n".join(metadata_lines)
-    content = f"{metadata_text}{health_info}{headers_text}{metadata_info}"
+    content = (
+        f"[cyan]ID:[/cyan] {endpoint.pk_endpoint}\n"
+        f"[cyan]Name:[/cyan] {endpoint.name}\n"
+        f"[cyan]URL:[/cyan] {endpoint.url}\n"
+        f"[cyan]Timeout:[/cyan] {endpoint.timeout_seconds}s"
+        f"{description_line}\n"
+        f"[cyan]Status:[/cyan] {status_markup}"
+        f"{auth_lines}{health_info}{headers_text}{metadata_info}"
+    )
 
     return Panel(
         content, title=f"Endpoint: {endpoint.name}", title_align="left", border_style="blue"
     )
 
 
-def format_execution_result(execution: Execution) -> Panel:
+def format_execution_result(execution: "Execution") -> "Panel":
     """Format query execution result as a rich panel."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     # Basic execution info
     info_lines = [
         f"[cyan]Execution ID:[/cyan] {execution.pk_execution}",
@@ -286,18 +299,17 @@ def format_execution_result(execution: Execution) -> Panel:
     # Variables used
     variables_text = ""
     if execution.variables_used:
-        variables_json = json.dumps(execution.variables_used, indent=2)
+        variables_json = dumps(execution.variables_used, indent=True)
         variables_syntax = Syntax(variables_json, "json", theme="monokai", line_numbers=True)
         variables_text = f"\n\n[cyan]Variables:[/cyan]\n{variables_syntax}"
 
     # Response data (truncated if large)
     response_text = ""
     if execution.response_data:
-        response_json = json.dumps(execution.response_data, indent=2, default=str)
-
-        # Truncate if too long
-        if len(response_json) > 2000:
-            response_json = response_json[:2000] + "\n... (truncated)"
+        # Only the first 2000 characters are shown, so don't keep the rest
+        response_json, truncated = dumps_head(execution.response_data, 2000, indent=True)
+        if truncated:
+            response_json += "\n... (truncated)"
 
         response_syntax = Syntax(response_json, "json", theme="monokai", line_numbers=True)
         response_text = f"\n\n[cyan]Response Data:[/cyan]\n{response_syntax}"
@@ -322,23 +334,15 @@ def format_health_summary(health_data: dict[str, Any]) -> Table:
 
     for endpoint_name, data in health_data.items():
         status = data.get("status", "unknown")
-        if status == "healthy":
-            status_text = Text("HEALTHY", style="green")
-        elif status == "unhealthy":
-            status_text = Text("UNHEALTHY", style="red")
-        elif status == "timeout":
-            status_text = Text("TIMEOUT", style="yellow")
-        else:
-            status_text = Text("UNKNOWN", style="dim")
+        status_text = _HEALTH_STATUS_TEXT.get(status, _UNKNOWN_STATUS_TEXT)
 
         response_time = data.get("response_time_ms", 0)
         response_text = f"{response_time}ms" if response_time > 0 else "-"
 
         last_check = data.get("last_check")
-        last_check_text = last_check.strftime("%H:%M:%S") if last_check else "-"
+        last_check_text = last_check.isoformat(timespec="seconds")[11:19] if last_check else "-"
 
-        error = data.get("error", "")
-        error_text = (error[:30] + "...") if len(error) > 30 else error
+        error_text = _truncate(data.get("error", ""), 30)
 
         table.add_row(endpoint_name, status_text, response_text, last_check_text, error_text)
 
@@ -347,6 +351,7 @@ def format_health_summary(health_data: dict[str, Any]) -> Table:
 
 def format_progress_bar(description: str = "Processing") -> "Progress":
     """Create a rich progress bar for long operations."""
+    from rich.console import Console
     from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
     return Progress(
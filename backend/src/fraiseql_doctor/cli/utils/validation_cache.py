@@ -0,0 +1,77 @@
+"""Persistent cache of query validation results for the CLI."""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+# Analysis fields worth carrying over when validation is skipped on a cache hit
+CACHED_METADATA_KEYS = ("complexity_score", "estimated_cost", "field_count", "depth")
+
+
+def default_cache_path() -> Path:
+    """Return the validation cache location, honouring ``XDG_CACHE_HOME``."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "fraiseql_doctor" / "validation.db"
+
+
+class ValidationCache:
+    """Content-addressed store of query analysis results.
+
+    Queries are keyed by a BLAKE2b digest of their text, so re-uploading an
+    unchanged query (e.g. from a CI loop) can skip parsing and complexity
+    analysis. Cache failures are never fatal: an unreadable or unwritable
+    cache simply behaves as a miss.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def path(self) -> Path:
+        """Database file, resolved on first use so the environment can still change."""
+        return self._path or default_cache_path()
+
+    @staticmethod
+    def digest(query_text: str) -> bytes:
+        """Return the cache key for a query text."""
+        return hashlib.blake2b(query_text.encode("utf-8"), digest_size=16).digest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS validated (digest BLOB PRIMARY KEY, metadata TEXT)"
+            )
+            self._connection = connection
+        return self._connection
+
+    def get(self, query_text: str) -> Optional[dict[str, Any]]:
+        """Return cached analysis metadata for a query text, if any."""
+        try:
+            cursor = self._connect().execute(
+                "SELECT metadata FROM validated WHERE digest = ?", (self.digest(query_text),)
+            )
+            row = cursor.fetchone()
+        except (OSError, sqlite3.Error):
+            return None
+
+        return json.loads(row[0]) if row else None
+
+    def put(self, query_text: str, query_metadata: dict[str, Any]) -> None:
+        """Record the analysis metadata produced by a successful validation."""
+        metadata = {
+            key: query_metadata[key] for key in CACHED_METADATA_KEYS if key in query_metadata
+        }
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO validated (digest, metadata) VALUES (?, ?)",
+                    (self.digest(query_text), json.dumps(metadata)),
+                )
+        except (OSError, sqlite3.Error):
+            pass
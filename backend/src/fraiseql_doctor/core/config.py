@@ -1,5 +1,7 @@
 """Configuration management for FraiseQL Doctor."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
@@ -14,6 +16,11 @@ class Settings(BaseSettings):
     model_config = {"env_file": ".env"}
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+
+    The environment and ``.env`` file are read once per process; call
+    ``get_settings.cache_clear()`` to pick up changes.
+    """
     return Settings()
@@ -1,7 +1,28 @@
 """Database module for FraiseQL Doctor."""
 
-# Import from models and schemas to avoid circular imports
-from .models import *
-from .schemas import *
+# Only the declarative base and session helpers live here; models and schemas
+# are imported from their own modules so importing this package doesn't load them all
+from ...models.base import Base, TimestampMixin
+from .session import (
+    DatabaseConfig,
+    get_async_engine,
+    get_async_session_maker,
+    get_config,
+    get_database_session,
+    get_db_session,
+    get_sync_engine,
+    init_database,
+)
 
-__all__ = ["Base", "TimestampMixin"]
+__all__ = [
+    "Base",
+    "TimestampMixin",
+    "DatabaseConfig",
+    "get_async_engine",
+    "get_async_session_maker",
+    "get_config",
+    "get_database_session",
+    "get_db_session",
+    "get_sync_engine",
+    "init_database",
+]
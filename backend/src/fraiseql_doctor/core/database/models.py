@@ -1,23 +1,64 @@
-"""Database models re-exported for backwards compatibility with tests."""
+"""Database models re-exported for backwards compatibility (deprecated).
+
+Apart from ``Base`` the models are resolved on first access (PEP 562), so a
+caller that needs one model does not evaluate every mapped class. First
+access to a name emits a ``DeprecationWarning`` pointing at the module that defines it.
+"""
+
+# Generated by scripts/generate_database_shims.py; edit the spec there instead.
+
+import sys
+import warnings
+from importlib import import_module
+from typing import Any
 
 # Re-export all models from the models module
 from ...models.base import Base
-from ...models.endpoint import Endpoint
-from ...models.execution import Execution
-from ...models.health_check import HealthCheck
-from ...models.query import Query
-from ...models.query_collection import QueryCollection
-from ...models.result import QueryResult, ResultMetadata
-from ...models.schedule import Schedule
-
-__all__ = [
+
+# Re-exported name -> module it is defined in
+_LAZY: dict[str, str] = {
+    "Endpoint": "fraiseql_doctor.models.endpoint",
+    "Query": "fraiseql_doctor.models.query",
+    "QueryCollection": "fraiseql_doctor.models.query_collection",
+    "Execution": "fraiseql_doctor.models.execution",
+    "HealthCheck": "fraiseql_doctor.models.health_check",
+    "Schedule": "fraiseql_doctor.models.schedule",
+    "QueryResult": "fraiseql_doctor.models.result",
+    "ResultMetadata": "fraiseql_doctor.models.result",
+}
+
+__all__ = (
+    "Base",
     "Endpoint",
-    "Query",
-    "QueryCollection",
     "Execution",
     "HealthCheck",
-    "Schedule",
+    "Query",
+    "QueryCollection",
     "QueryResult",
     "ResultMetadata",
-    "Base",
-]
+    "Schedule",
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported model on first access and cache it on the module."""
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    warnings.warn(
+        f"{__name__}.{name} is deprecated, import it from {module} instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    # Skip the import machinery when the defining module is already loaded
+    loaded = sys.modules.get(module) or import_module(module)
+    value = getattr(loaded, name)
+    # Later lookups find the global and never reach __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> tuple[str, ...]:
+    # dir() copies and sorts whatever this returns, so hand back the tuple itself
+    return __all__
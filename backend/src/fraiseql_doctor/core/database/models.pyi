@@ -0,0 +1,25 @@
+"""Type stub for ``fraiseql_doctor.core.database.models``."""
+
+# Generated by scripts/generate_database_shims.py; edit the spec there instead.
+
+from ...models.base import Base as Base
+from ...models.endpoint import Endpoint as Endpoint
+from ...models.execution import Execution as Execution
+from ...models.health_check import HealthCheck as HealthCheck
+from ...models.query import Query as Query
+from ...models.query_collection import QueryCollection as QueryCollection
+from ...models.result import QueryResult as QueryResult
+from ...models.result import ResultMetadata as ResultMetadata
+from ...models.schedule import Schedule as Schedule
+
+__all__ = (
+    "Base",
+    "Endpoint",
+    "Execution",
+    "HealthCheck",
+    "Query",
+    "QueryCollection",
+    "QueryResult",
+    "ResultMetadata",
+    "Schedule",
+)
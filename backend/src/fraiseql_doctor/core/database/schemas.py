@@ -1,31 +1,65 @@
-"""Database schemas re-exported for backwards compatibility with tests."""
-
-# Re-export all schemas from the schemas module
-from ...schemas.endpoint import EndpointCreate, EndpointResponse, EndpointUpdate
-from ...schemas.query import (
-    QueryCollectionCreate,
-    QueryCollectionUpdate,
-    QueryCreate,
-    QueryResponse,
-    QueryUpdate,
-)
-from ..execution_manager import BatchMode, ExecutionConfig
+"""Database schemas re-exported for backwards compatibility (deprecated).
 
-# Re-export classes from core modules
-from ..query_collection import QuerySearchFilter
-from ..result_storage import ResultSearchFilter
+The names are resolved on first access (PEP 562): the execution manager
+behind them is only imported when a caller needs it. The search filters are
+not re-exported; import them from the core module that uses them.
+First access to a name emits a ``DeprecationWarning`` pointing at the module that defines it.
+"""
 
-__all__ = [
-    "QueryCreate",
-    "QueryUpdate",
-    "QueryCollectionCreate",
-    "QueryCollectionUpdate",
-    "QueryResponse",
+# Generated by scripts/generate_database_shims.py; edit the spec there instead.
+
+import sys
+import warnings
+from importlib import import_module
+from typing import Any
+
+# Re-exported name -> module it is defined in
+_LAZY: dict[str, str] = {
+    "QueryCreate": "fraiseql_doctor.schemas.query",
+    "QueryUpdate": "fraiseql_doctor.schemas.query",
+    "QueryCollectionCreate": "fraiseql_doctor.schemas.query",
+    "QueryCollectionUpdate": "fraiseql_doctor.schemas.query",
+    "QueryResponse": "fraiseql_doctor.schemas.query",
+    "EndpointCreate": "fraiseql_doctor.schemas.endpoint",
+    "EndpointUpdate": "fraiseql_doctor.schemas.endpoint",
+    "EndpointResponse": "fraiseql_doctor.schemas.endpoint",
+    "BatchMode": "fraiseql_doctor.core.execution_manager",
+    "ExecutionConfig": "fraiseql_doctor.core.execution_manager",
+}
+
+__all__ = (
+    "BatchMode",
     "EndpointCreate",
-    "EndpointUpdate",
     "EndpointResponse",
-    "QuerySearchFilter",
-    "ResultSearchFilter",
-    "BatchMode",
+    "EndpointUpdate",
     "ExecutionConfig",
-]
+    "QueryCollectionCreate",
+    "QueryCollectionUpdate",
+    "QueryCreate",
+    "QueryResponse",
+    "QueryUpdate",
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name on first access and cache it on the module."""
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    warnings.warn(
+        f"{__name__}.{name} is deprecated, import it from {module} instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    # Skip the import machinery when the defining module is already loaded
+    loaded = sys.modules.get(module) or import_module(module)
+    value = getattr(loaded, name)
+    # Later lookups find the global and never reach __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> tuple[str, ...]:
+    # dir() copies and sorts whatever this returns, so hand back the tuple itself
+    return __all__
@@ -0,0 +1,27 @@
+"""Type stub for ``fraiseql_doctor.core.database.schemas``."""
+
+# Generated by scripts/generate_database_shims.py; edit the spec there instead.
+
+from ...schemas.endpoint import EndpointCreate as EndpointCreate
+from ...schemas.endpoint import EndpointResponse as EndpointResponse
+from ...schemas.endpoint import EndpointUpdate as EndpointUpdate
+from ...schemas.query import QueryCollectionCreate as QueryCollectionCreate
+from ...schemas.query import QueryCollectionUpdate as QueryCollectionUpdate
+from ...schemas.query import QueryCreate as QueryCreate
+from ...schemas.query import QueryResponse as QueryResponse
+from ...schemas.query import QueryUpdate as QueryUpdate
+from ..execution_manager import BatchMode as BatchMode
+from ..execution_manager import ExecutionConfig as ExecutionConfig
+
+__all__ = (
+    "BatchMode",
+    "EndpointCreate",
+    "EndpointResponse",
+    "EndpointUpdate",
+    "ExecutionConfig",
+    "QueryCollectionCreate",
+    "QueryCollectionUpdate",
+    "QueryCreate",
+    "QueryResponse",
+    "QueryUpdate",
+)
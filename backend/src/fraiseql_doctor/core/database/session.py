@@ -0,0 +1,156 @@
+"""Database connection and session management."""
+
+from collections.abc import AsyncGenerator
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from fraiseql_doctor.core.config import get_settings
+from fraiseql_doctor.utils.serialization import dumps, loads
+
+# Engines are created once per process so sessions share one connection pool
+_async_engine = None
+_async_session_maker = None
+_sync_engine = None
+_sync_session_maker = None
+
+
+def _create_async_engine(pool: "DatabaseConfig"):
+    """Create an async engine whose pool is sized by ``pool``."""
+    return create_async_engine(
+        pool.url,
+        pool_size=pool.pool_size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.pool_timeout,
+        pool_recycle=pool.pool_recycle,
+        pool_pre_ping=True,
+        # JSON columns (execution responses, variables) go through orjson with the fast extra
+        json_serializer=dumps,
+        json_deserializer=loads,
+    )
+
+
+def get_async_engine():
+    """Get or create the async database engine."""
+    global _async_engine
+
+    if _async_engine is None:
+        settings = get_settings()
+        _async_engine = _create_async_engine(DatabaseConfig(url=settings.database_url))
+
+    return _async_engine
+
+
+def get_sync_engine():
+    """Get or create the synchronous database engine."""
+    global _sync_engine
+
+    if _sync_engine is None:
+        settings = get_settings()
+        # Convert async URL to sync URL (a sync URL is left unchanged)
+        pool = DatabaseConfig(url=settings.database_url.replace("+asyncpg", ""))
+        _sync_engine = create_engine(
+            pool.url,
+            pool_size=pool.pool_size,
+            max_overflow=pool.max_overflow,
+            pool_timeout=pool.pool_timeout,
+            pool_recycle=pool.pool_recycle,
+            pool_pre_ping=True,
+            json_serializer=dumps,
+            json_deserializer=loads,
+        )
+
+    return _sync_engine
+
+
+def get_async_session_maker():
+    """Get or create the async session maker."""
+    global _async_session_maker
+
+    if _async_session_maker is None:
+        _async_session_maker = async_sessionmaker(
+            get_async_engine(), class_=AsyncSession, expire_on_commit=False
+        )
+
+    return _async_session_maker
+
+
+# Async database session (for async operations)
+async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session."""
+    async with get_async_session_maker()() as session:
+        yield session
+
+
+# Sync database session (for CLI operations)
+def get_db_session() -> Session:
+    """Get synchronous database session for CLI operations."""
+    global _sync_session_maker
+
+    if _sync_session_maker is None:
+        _sync_session_maker = sessionmaker(bind=get_sync_engine())
+
+    return _sync_session_maker()
+
+
+# Database configuration class for config management
+class DatabaseConfig:
+    """Database configuration helper."""
+
+    # A fixed pool of 25 connections (no overflow) gave PostgreSQL its best
+    # response times under heavy concurrency; pool_size is the knob to tune
+    def __init__(
+        self,
+        url: str,
+        pool_size: int = 25,
+        max_overflow: int = 0,
+        pool_timeout: int = 30,
+        pool_recycle: int = 1800,
+    ):
+        self.url = url
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+
+
+def init_database(config: Optional[DatabaseConfig] = None):
+    """Initialize database schema and the process-wide async connection pool.
+
+    ``config`` sizes the pool; it defaults to the configured database URL with
+    the ``DatabaseConfig`` pool defaults. An engine that already exists is kept.
+    """
+    global _async_engine
+
+    from fraiseql_doctor.models import load_all_models
+
+    load_all_models()
+
+    if _async_engine is None:
+        if config is None:
+            config = DatabaseConfig(url=get_settings().database_url)
+        _async_engine = _create_async_engine(config)
+
+    # This would run Alembic migrations
+    # For now, just a placeholder
+    print("Database initialization would run here")
+
+
+@lru_cache(maxsize=1)
+def get_config():
+    """Get configuration object.
+
+    Built once per process from the cached settings; callers share it and
+    should treat it as read-only.
+    """
+    settings = get_settings()
+
+    # Create a configuration object that matches what the CLI expects
+    class Config:
+        def __init__(self):
+            self.database = DatabaseConfig(url=settings.database_url)
+
+    return Config()
@@ -9,25 +9,230 @@ Orchestrates GraphQL query execution with:
 """
 
 import asyncio
-import json
+import hashlib
+import heapq
+import importlib.util
 import logging
-from collections.abc import Callable
+import os
+import re
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime, timedelta
 from enum import Enum
+from functools import cached_property
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from croniter import croniter
+from sqlalchemy import text
 
 from ..models.endpoint import Endpoint
 from ..models.execution import Execution
-from ..services.fraiseql_client import FraiseQLClient, GraphQLExecutionError, NetworkError
+from ..models.query import Query
+from ..services.batching import merge_queries, split_response
+from ..services.fraiseql_client import (
+    AuthenticationError,
+    FraiseQLClient,
+    GraphQLClientError,
+    GraphQLExecutionError,
+    GraphQLResponse,
+    NetworkError,
+)
+from ..utils.cache import TTLCache
+from ..utils.serialization import canonical_bytes, dumps, dumps_bytes, loads
 from .query_collection import QueryCollectionManager, QueryPriority
 
 logger = logging.getLogger(__name__)
 
+# Most results kept by the in-process result cache before evicting the LRU entry
+_RESULT_CACHE_SIZE = 1024
+
+# Endpoints rarely change, so lookups are cached briefly (and for this many endpoints at most)
+_ENDPOINT_CACHE_TTL_SECONDS = 60
+_ENDPOINT_CACHE_SIZE = 256
+
+# Execution records buffered by a running batch before they are written out
+_EXECUTION_FLUSH_SIZE = 50
+
+# Set while a batch runs, so its executions are stored together instead of one commit each
+_storing_batch: ContextVar[bool] = ContextVar("_storing_batch", default=False)
+
+# Spare workers of the outermost running _map_bounded call, shared with calls nested in it
+_spare_workers: ContextVar[Optional[list[int]]] = ContextVar("_spare_workers", default=None)
+
+# The running batch's queries, fetched in one go so its executions skip the lookup
+_batch_queries: ContextVar[Optional[dict[UUID, Query]]] = ContextVar("_batch_queries", default=None)
+
+# JSON keys of priority weights, so serializing a config doesn't format each enum member
+_PRIORITY_KEYS = {priority: str(priority) for priority in QueryPriority}
+
+# Write statements are built once; SQLAlchemy caches their compiled form and the asyncpg
+# driver reuses the server-side prepared statement on each connection
+_INSERT_BATCH_EXECUTION = text(
+    """
+    INSERT INTO batch_executions (
+        id, total_queries, successful, failed, cancelled, total_time, created_at
+    ) VALUES (
+        :id, :total_queries, :successful, :failed, :cancelled, :total_time, :created_at
+    )
+    """
+)
+_INSERT_SCHEDULED_EXECUTION = text(
+    """
+    INSERT INTO scheduled_executions (
+        id, query_id, cron_expression, endpoint_id, config, enabled, created_at, next_execution
+    ) VALUES (
+        :id, :query_id, :cron_expression, :endpoint_id, :config, :enabled, :created_at,
+        :next_execution
+    )
+    """
+)
+_DELETE_SCHEDULED_EXECUTION = text("DELETE FROM scheduled_executions WHERE id = :id")
+
+# Mutations and subscriptions can't be written without their keyword, so documents that
+# never mention one only read and are safe to cache (a stray match merely skips the cache)
+_WRITE_OPERATION = re.compile(r"\b(?:mutation|subscription)\b")
+
+# Serializing or hashing more than this many bytes runs in the thread pool, off the event loop
+_OFFLOAD_THRESHOLD_BYTES = 64 * 1024
+
+
+def _lazy_module(name: str):
+    """Return module ``name``, deferring its execution until an attribute is used.
+
+    Uses ``importlib.util.LazyLoader``: the module is registered in
+    ``sys.modules`` straight away but its code only runs on first access.
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# croniter (and dateutil with it) is only needed once something is scheduled
+_croniter = _lazy_module("croniter")
+
+
+# Eager tasks (3.12+) run synchronously up to their first await, so executions that
+# finish without suspending (e.g. missing queries) skip a trip through the event loop
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+
+def _eager_task(coro) -> asyncio.Task:
+    """Create a task for ``coro``, started eagerly where Python supports it."""
+    if _EAGER_TASKS:
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.create_task(coro)
+
+
+async def _map_bounded(func, items: list, limit: int, on_error) -> list:
+    """Await ``func(item)`` for every item, with at most ``limit`` tasks alive.
+
+    A few workers take items in turn instead of one task per item, so large
+    batches don't flood the event loop's ready queue. Results come back in
+    item order; when ``func`` raises, ``on_error(item, exception)`` provides
+    the item's result instead.
+
+    The calling task is one of the workers. Calls nested in ``func`` share the
+    outermost call's ``limit``: they only start the workers it left spare and
+    otherwise work through their items in the calling worker, so nesting
+    doesn't multiply the number of tasks.
+    """
+    results: list = [None] * len(items)
+    work = iter(enumerate(items))
+
+    async def worker():
+        # Workers share the iterator, each taking the next item once it is done
+        for index, item in work:
+            try:
+                results[index] = await func(item)
+            except Exception as e:
+                results[index] = on_error(item, e)
+
+    spare = _spare_workers.get()
+    token = None
+    if spare is None:
+        spare = [limit - 1]
+        token = _spare_workers.set(spare)
+
+    async def extra_worker():
+        try:
+            await worker()
+        finally:
+            spare[0] += 1
+
+    started = max(0, min(spare[0], limit - 1, len(items) - 1))
+    spare[0] -= started
+    tasks = [_eager_task(extra_worker()) for _ in range(started)]
+    try:
+        await worker()
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # A cancelled caller takes its workers down with it, as gather would
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        if token is not None:
+            _spare_workers.reset(token)
+    return results
+
+
+def _response_size(result_data) -> int:
+    """Return the size of a GraphQL response in bytes.
+
+    Uses the body size the client measured when it reports one; responses
+    without it (e.g. split from a batched request) are serialized to be
+    measured.
+    """
+    if not result_data:
+        return 0
+    size = getattr(result_data, "response_size_bytes", None)
+    if size is not None:
+        return size
+    return len(dumps_bytes(result_data))
+
+
+def _response_dict(response) -> dict[str, Any]:
+    """Return a GraphQL response as a plain ``data``/``errors`` dict.
+
+    ``FraiseQLClient`` returns a ``GraphQLResponse`` model; clients returning
+    the decoded body already give a dict.
+    """
+    if isinstance(response, GraphQLResponse):
+        return response.model_dump(include={"data", "errors"}, exclude_none=True)
+    return response
+
+
+@dataclass(frozen=True)
+class _Start:
+    """When an execution started: wall-clock time to report, monotonic reading to time it."""
+
+    at: datetime
+    counter: float
+
+    @classmethod
+    def now(cls) -> "_Start":
+        return cls(datetime.now(UTC), time.perf_counter())
+
+    def finish(self) -> tuple[datetime, float]:
+        """Return ``(completed_at, execution_time)`` without reading the wall clock again."""
+        execution_time = time.perf_counter() - self.counter
+        return self.at + timedelta(seconds=execution_time), execution_time
+
 
 class ExecutionStatus(Enum):
     """Query execution status."""
@@ -40,6 +245,16 @@ class ExecutionStatus(Enum):
     TIMEOUT = "timeout"
 
 
+# Expected execution errors -> (status, error code, message template); anything else is
+# logged as unexpected. Templates are formatted with the error and the timeout in use.
+_ERROR_RESULTS: dict[type[Exception], tuple[ExecutionStatus, str, str]] = {
+    TimeoutError: (ExecutionStatus.TIMEOUT, "TIMEOUT", "Query timed out after {timeout}s"),
+    GraphQLExecutionError: (ExecutionStatus.FAILED, "GRAPHQL_EXECUTION_ERROR", "{error}"),
+    NetworkError: (ExecutionStatus.FAILED, "NETWORK_ERROR", "Network error: {error}"),
+}
+_UNEXPECTED_ERROR = (ExecutionStatus.FAILED, "UNEXPECTED_ERROR", "Unexpected error: {error}")
+
+
 class BatchMode(Enum):
     """Batch execution modes."""
 
@@ -56,10 +271,18 @@ class ExecutionConfig:
     timeout_seconds: int = 300
     max_retries: int = 3
     retry_delay_seconds: int = 5
+    # Concurrent executions per endpoint, so a slow endpoint can't starve the others
     max_concurrent: int = 10
+    # Optional cap on concurrent executions across all endpoints
+    max_concurrent_total: Optional[int] = None
     batch_size: int = 50
+    # Reuse results of read-only queries; mutations, subscriptions and scheduled runs
+    # always execute
     enable_caching: bool = True
     cache_ttl_seconds: int = 3600
+    # Only results of queries at least this slow or this complex are cached
+    cache_min_execution_seconds: float = 0.1
+    cache_min_complexity_score: float = 10.0
     priority_weights: dict[QueryPriority, int] = field(
         default_factory=lambda: {
             QueryPriority.LOW: 1,
@@ -118,6 +341,26 @@ class ScheduledExecution:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     last_execution: Optional[datetime] = None
     next_execution: Optional[datetime] = None
+    # Parsed cron expression, created on first use and reused for later runs
+    _cron: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def next_run_after(self, moment: datetime) -> datetime:
+        """Return the first run of the cron expression after ``moment``.
+
+        Raises:
+        ------
+            ValueError: If the cron expression is invalid
+        """
+        if self._cron is None:
+            self._cron = _croniter.croniter(self.cron_expression, moment)
+        else:
+            self._cron.set_current(moment, force=True)
+
+        next_run = self._cron.get_next(datetime)
+        # Ensure timezone-aware datetime
+        if next_run.tzinfo is None:
+            next_run = next_run.replace(tzinfo=UTC)
+        return next_run
 
 
 class QueryExecutionManager:
@@ -147,10 +390,30 @@ class QueryExecutionManager:
         # Execution state
         self._running_executions: dict[UUID, asyncio.Task] = {}
         self._scheduled_executions: dict[UUID, ScheduledExecution] = {}
-        self._execution_semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        # (next execution timestamp, scheduled id); entries go stale when rescheduled
+        self._schedule_heap: list[tuple[float, UUID]] = []
+        self._schedule_changed = asyncio.Event()
+        self._endpoint_semaphores: dict[UUID, asyncio.Semaphore] = {}
+        self._execution_semaphore = (
+            asyncio.Semaphore(self.config.max_concurrent_total)
+            if self.config.max_concurrent_total
+            else None
+        )
         self._scheduler_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
 
+        # Result cache: key -> (monotonic time stored, result), least recently used first
+        self._result_cache: OrderedDict[bytes, tuple[float, ExecutionResult]] = OrderedDict()
+        self._result_cache_lock = asyncio.Lock()
+
+        # Execution records not yet written to the database
+        self._pending_executions: list[Execution] = []
+
+        # Endpoints fetched recently, by ID
+        self._endpoint_cache: TTLCache[UUID, Endpoint] = TTLCache(
+            _ENDPOINT_CACHE_SIZE, _ENDPOINT_CACHE_TTL_SECONDS
+        )
+
         # Metrics
         self._execution_metrics = {
             "total_executions": 0,
@@ -160,8 +423,39 @@ class QueryExecutionManager:
             "total_execution_time": 0.0,
         }
 
-        # Thread pool for CPU-bound operations
-        self._thread_pool = ThreadPoolExecutor(max_workers=4)
+    @cached_property
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for large serialization and hashing, created on first offload.
+
+        Two workers are plenty: serializing holds the GIL, so more threads
+        would only queue behind each other while still holding memory.
+        """
+        return ThreadPoolExecutor(
+            max_workers=min(2, os.cpu_count() or 1), thread_name_prefix="execution-offload"
+        )
+
+    async def _get_query(self, query_id: UUID) -> Optional[Query]:
+        """Return the query, from the running batch's prefetched queries when it's there."""
+        batch_queries = _batch_queries.get()
+        if batch_queries is not None and query_id in batch_queries:
+            return batch_queries[query_id]
+        return await self.collection_manager.get_query(query_id)
+
+    @asynccontextmanager
+    async def _execution_slot(self, endpoint_id: UUID) -> AsyncIterator[None]:
+        """Hold one of ``endpoint_id``'s concurrency slots (and a global one, if capped)."""
+        semaphore = self._endpoint_semaphores.get(endpoint_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent)
+            self._endpoint_semaphores[endpoint_id] = semaphore
+
+        # Take the endpoint slot first so waiting on a busy endpoint holds no global slot
+        async with semaphore:
+            if self._execution_semaphore is None:
+                yield
+            else:
+                async with self._execution_semaphore:
+                    yield
 
     # Single Query Execution
 
@@ -187,30 +481,30 @@ class QueryExecutionManager:
         """
         execution_id = uuid4()
         config = config_override or self.config
-        started_at = datetime.now(UTC)
+        started = _Start.now()
 
         # Get query and endpoint
-        query = await self.collection_manager.get_query(query_id)
+        query = await self._get_query(query_id)
         if not query:
             return ExecutionResult(
                 execution_id=execution_id,
                 query_id=query_id,
                 endpoint_id=endpoint_id,
                 status=ExecutionStatus.FAILED,
-                started_at=started_at,
+                started_at=started.at,
                 error_message="Query not found",
                 error_code="QUERY_NOT_FOUND",
                 variables=variables,
             )
 
-        endpoint = await self.db_session.get(Endpoint, endpoint_id)
+        endpoint = await self._get_endpoint(endpoint_id)
         if not endpoint:
             return ExecutionResult(
                 execution_id=execution_id,
                 query_id=query_id,
                 endpoint_id=endpoint_id,
                 status=ExecutionStatus.FAILED,
-                started_at=started_at,
+                started_at=started.at,
                 error_message="Endpoint not found",
                 error_code="ENDPOINT_NOT_FOUND",
                 variables=variables,
@@ -225,116 +519,235 @@ class QueryExecutionManager:
         logger.info(f"Starting execution {execution_id} for query {query.name}")
 
         try:
-            async with self._execution_semaphore:
+            cache_key = None
+            # Mutations and subscriptions must reach the endpoint every time
+            if config.enable_caching and not _WRITE_OPERATION.search(query.query_text):
+                cache_key = await self._offload(
+                    len(query.query_text),
+                    self._result_cache_key,
+                    query.query_text,
+                    endpoint_id,
+                    final_variables,
+                )
+                cached = await self._serve_cached_result(cache_key, execution_id, started, config)
+                if cached is not None:
+                    return cached
+
+            async with self._execution_slot(endpoint_id):
                 # Execute query with timeout
-                result_data = await asyncio.wait_for(
+                reply = await asyncio.wait_for(
                     client.execute_query(query.query_text, final_variables),
                     timeout=config.timeout_seconds,
                 )
 
-                completed_at = datetime.now(UTC)
-                execution_time = (completed_at - started_at).total_seconds()
-
-                # Calculate response size
-                response_size = len(json.dumps(result_data)) if result_data else 0
-
-                # Check for GraphQL errors
-                if "errors" in result_data:
-                    error_messages = [
-                        err.get("message", "Unknown error") for err in result_data["errors"]
-                    ]
-                    return ExecutionResult(
-                        execution_id=execution_id,
-                        query_id=query_id,
-                        endpoint_id=endpoint_id,
-                        status=ExecutionStatus.FAILED,
-                        started_at=started_at,
-                        completed_at=completed_at,
-                        execution_time=execution_time,
-                        error_message="; ".join(error_messages),
-                        error_code="GRAPHQL_ERROR",
-                        response_size=response_size,
-                        variables=final_variables,
-                    )
-
-                # Successful execution
-                result = ExecutionResult(
-                    execution_id=execution_id,
-                    query_id=query_id,
-                    endpoint_id=endpoint_id,
-                    status=ExecutionStatus.COMPLETED,
-                    started_at=started_at,
-                    completed_at=completed_at,
-                    execution_time=execution_time,
-                    success=True,
-                    result_data=result_data,
-                    complexity_score=query.expected_complexity_score,
-                    response_size=response_size,
-                    cache_hit=result_data.get("_cache_hit", False),
-                    variables=final_variables,
+                return await self._complete_execution(
+                    execution_id,
+                    query_id,
+                    query,
+                    endpoint_id,
+                    started,
+                    _response_dict(reply),
+                    final_variables,
+                    config,
+                    cache_key,
+                    _response_size(reply),
                 )
 
-                # Update metrics
-                self._update_execution_metrics(result)
+        except Exception as e:
+            return self._failed_execution(
+                e, execution_id, query_id, endpoint_id, started, final_variables, config
+            )
 
-                # Store execution record
-                await self._store_execution_result(result)
+    async def _complete_execution(
+        self,
+        execution_id: UUID,
+        query_id: UUID,
+        query: Query,
+        endpoint_id: UUID,
+        started: _Start,
+        result_data: dict[str, Any],
+        variables: Optional[dict[str, Any]],
+        config: ExecutionConfig,
+        cache_key: Optional[bytes],
+        response_size: Optional[int] = None,
+    ) -> ExecutionResult:
+        """Turn a GraphQL response into an execution result, then record and cache it.
 
-                logger.info(f"Completed execution {execution_id} in {execution_time:.2f}s")
-                return result
+        ``response_size`` is measured from ``result_data`` unless given.
+        """
+        completed_at, execution_time = started.finish()
 
-        except asyncio.TimeoutError:
-            return ExecutionResult(
-                execution_id=execution_id,
-                query_id=query_id,
-                endpoint_id=endpoint_id,
-                status=ExecutionStatus.TIMEOUT,
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
-                error_message=f"Query timed out after {config.timeout_seconds}s",
-                error_code="TIMEOUT",
-                variables=final_variables,
-            )
+        if response_size is None:
+            response_size = _response_size(result_data)
 
-        except GraphQLExecutionError as e:
+        # Check for GraphQL errors
+        if "errors" in result_data:
+            error_messages = [err.get("message", "Unknown error") for err in result_data["errors"]]
             return ExecutionResult(
                 execution_id=execution_id,
                 query_id=query_id,
                 endpoint_id=endpoint_id,
                 status=ExecutionStatus.FAILED,
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
-                error_message=str(e),
-                error_code="GRAPHQL_EXECUTION_ERROR",
-                variables=final_variables,
+                started_at=started.at,
+                completed_at=completed_at,
+                execution_time=execution_time,
+                error_message="; ".join(error_messages),
+                error_code="GRAPHQL_ERROR",
+                response_size=response_size,
+                variables=variables,
             )
 
-        except NetworkError as e:
-            return ExecutionResult(
-                execution_id=execution_id,
-                query_id=query_id,
-                endpoint_id=endpoint_id,
-                status=ExecutionStatus.FAILED,
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
-                error_message=f"Network error: {e}",
-                error_code="NETWORK_ERROR",
-                variables=final_variables,
-            )
+        # Successful execution
+        result = ExecutionResult(
+            execution_id=execution_id,
+            query_id=query_id,
+            endpoint_id=endpoint_id,
+            status=ExecutionStatus.COMPLETED,
+            started_at=started.at,
+            completed_at=completed_at,
+            execution_time=execution_time,
+            success=True,
+            result_data=result_data,
+            complexity_score=query.expected_complexity_score,
+            response_size=response_size,
+            cache_hit=result_data.get("_cache_hit", False),
+            variables=variables,
+        )
 
-        except Exception as e:
+        # Update metrics
+        self._update_execution_metrics(result)
+
+        if cache_key is not None and (
+            execution_time >= config.cache_min_execution_seconds
+            or (query.expected_complexity_score or 0.0) >= config.cache_min_complexity_score
+        ):
+            await self._cache_result(cache_key, result)
+
+        # Store execution record
+        await self._store_execution_result(result)
+
+        logger.info(f"Completed execution {execution_id} in {execution_time:.2f}s")
+        return result
+
+    def _failed_execution(
+        self,
+        error: Exception,
+        execution_id: UUID,
+        query_id: UUID,
+        endpoint_id: UUID,
+        started: _Start,
+        variables: Optional[dict[str, Any]],
+        config: ExecutionConfig,
+    ) -> ExecutionResult:
+        """Build the result of an execution that raised ``error``."""
+        # The nearest class of the error with an entry in _ERROR_RESULTS decides the result
+        for error_type in type(error).__mro__:
+            if error_type in _ERROR_RESULTS:
+                status, error_code, message = _ERROR_RESULTS[error_type]
+                break
+        else:
             logger.exception(f"Unexpected error in execution {execution_id}")
-            return ExecutionResult(
-                execution_id=execution_id,
-                query_id=query_id,
-                endpoint_id=endpoint_id,
-                status=ExecutionStatus.FAILED,
-                started_at=started_at,
-                completed_at=datetime.now(UTC),
-                error_message=f"Unexpected error: {e}",
-                error_code="UNEXPECTED_ERROR",
-                variables=variables,
-            )
+            status, error_code, message = _UNEXPECTED_ERROR
+
+        completed_at, _ = started.finish()
+        return ExecutionResult(
+            execution_id=execution_id,
+            query_id=query_id,
+            endpoint_id=endpoint_id,
+            status=status,
+            started_at=started.at,
+            completed_at=completed_at,
+            error_message=message.format(error=error, timeout=config.timeout_seconds),
+            error_code=error_code,
+            variables=variables,
+        )
+
+    async def _offload(self, size: int, func: Callable[..., Any], *args: Any) -> Any:
+        """Call CPU-bound ``func``, in the thread pool if it works on ``size`` bytes or more.
+
+        Small inputs stay on the event loop, where a call is cheaper than a thread hop.
+        """
+        if size < _OFFLOAD_THRESHOLD_BYTES:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._thread_pool, func, *args)
+
+    # Result Caching
+
+    @staticmethod
+    def _result_cache_key(
+        query_text: str, endpoint_id: UUID, variables: Optional[dict[str, Any]]
+    ) -> bytes:
+        """Build a content-addressed cache key for a query execution.
+
+        The query text and variables are hashed together, so keys have a fixed
+        size however large the variables are.
+        """
+        digest = hashlib.blake2b(canonical_bytes([query_text, variables]), digest_size=16)
+        return endpoint_id.bytes + digest.digest()
+
+    async def _get_endpoint(self, endpoint_id: UUID) -> Optional[Endpoint]:
+        """Return the endpoint, from the cache if it was fetched recently.
+
+        The query and endpoint lookups share ``db_session``, which can't run
+        them concurrently, so warm executions skip the endpoint round trip
+        instead. Missing endpoints are not cached.
+        """
+        endpoint = self._endpoint_cache.get(endpoint_id)
+        if endpoint is not None:
+            return endpoint
+
+        endpoint = await self.db_session.get(Endpoint, endpoint_id)
+        if endpoint:
+            self._endpoint_cache[endpoint_id] = endpoint
+        return endpoint
+
+    async def _get_cached_result(
+        self, key: bytes, config: ExecutionConfig
+    ) -> Optional[ExecutionResult]:
+        """Return the cached result for ``key`` unless it is missing or expired."""
+        async with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None:
+                return None
+
+            stored_at, result = entry
+            if time.monotonic() - stored_at >= config.cache_ttl_seconds:
+                del self._result_cache[key]
+                return None
+
+            self._result_cache.move_to_end(key)
+            return result
+
+    async def _serve_cached_result(
+        self, key: bytes, execution_id: UUID, started: _Start, config: ExecutionConfig
+    ) -> Optional[ExecutionResult]:
+        """Record a cache hit for ``key`` as a new execution, if the cache has one."""
+        cached = await self._get_cached_result(key, config)
+        if cached is None:
+            return None
+
+        completed_at, execution_time = started.finish()
+        result = replace(
+            cached,
+            execution_id=execution_id,
+            started_at=started.at,
+            completed_at=completed_at,
+            execution_time=execution_time,
+            cache_hit=True,
+        )
+        self._update_execution_metrics(result)
+        await self._store_execution_result(result)
+
+        logger.info(f"Served execution {execution_id} from the result cache")
+        return result
+
+    async def _cache_result(self, key: bytes, result: ExecutionResult):
+        """Cache a successful result, evicting the least recently used entries."""
+        async with self._result_cache_lock:
+            self._result_cache[key] = (time.monotonic(), result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
 
     # Batch Execution
 
@@ -362,7 +775,7 @@ class QueryExecutionManager:
         """
         batch_id = uuid4()
         config = config_override or self.config
-        batch_start = datetime.now(UTC)
+        batch_start = time.perf_counter()
 
         logger.info(
             f"Starting batch execution {batch_id} with {len(query_ids)} queries in {mode.value} mode"
@@ -371,24 +784,52 @@ class QueryExecutionManager:
         # Prepare execution tasks
         variables_map = variables_map or {}
 
-        if mode == BatchMode.SEQUENTIAL:
-            results = await self._execute_sequential(query_ids, endpoint_id, variables_map, config)
-        elif mode == BatchMode.PARALLEL:
-            results = await self._execute_parallel(query_ids, endpoint_id, variables_map, config)
-        elif mode == BatchMode.PRIORITY:
-            results = await self._execute_by_priority(query_ids, endpoint_id, variables_map, config)
-        elif mode == BatchMode.ADAPTIVE:
-            results = await self._execute_adaptive(query_ids, endpoint_id, variables_map, config)
-        else:
-            raise ValueError(f"Unknown batch mode: {mode}")
-
-        batch_end = datetime.now(UTC)
-        total_time = (batch_end - batch_start).total_seconds()
+        # Prefetching is only a shortcut: if it fails, each execution looks its query up
+        try:
+            queries = await self.collection_manager.get_queries(query_ids)
+        except Exception:
+            logger.exception(f"Prefetching the queries of batch {batch_id} failed")
+            queries = []
+        batch_queries = _batch_queries.set(
+            {query_id: query for query_id, query in zip(query_ids, queries) if query}
+        )
 
-        # Aggregate results
-        successful = len([r for r in results if r.success])
-        failed = len([r for r in results if not r.success and r.status == ExecutionStatus.FAILED])
-        cancelled = len([r for r in results if r.status == ExecutionStatus.CANCELLED])
+        # Execution records are buffered and written with the batch record
+        storing_batch = _storing_batch.set(True)
+        try:
+            if mode == BatchMode.SEQUENTIAL:
+                results = await self._execute_sequential(
+                    query_ids, endpoint_id, variables_map, config
+                )
+            elif mode == BatchMode.PARALLEL:
+                results = await self._execute_parallel(
+                    query_ids, endpoint_id, variables_map, config
+                )
+            elif mode == BatchMode.PRIORITY:
+                results = await self._execute_by_priority(
+                    query_ids, endpoint_id, variables_map, config
+                )
+            elif mode == BatchMode.ADAPTIVE:
+                results = await self._execute_adaptive(
+                    query_ids, endpoint_id, variables_map, config
+                )
+            else:
+                raise ValueError(f"Unknown batch mode: {mode}")
+        finally:
+            _storing_batch.reset(storing_batch)
+            _batch_queries.reset(batch_queries)
+
+        total_time = time.perf_counter() - batch_start
+
+        # Aggregate results in one pass
+        successful = failed = cancelled = 0
+        for result in results:
+            if result.success:
+                successful += 1
+            elif result.status == ExecutionStatus.FAILED:
+                failed += 1
+            if result.status == ExecutionStatus.CANCELLED:
+                cancelled += 1
 
         batch_result = BatchExecutionResult(
             batch_id=batch_id,
@@ -437,37 +878,230 @@ class QueryExecutionManager:
         variables_map: dict[UUID, dict[str, Any]],
         config: ExecutionConfig,
     ) -> list[ExecutionResult]:
-        """Execute queries in parallel with concurrency control."""
-        # Create tasks for all queries
-        tasks = []
-        for query_id in query_ids:
-            variables = variables_map.get(query_id)
-            task = asyncio.create_task(self.execute_query(query_id, endpoint_id, variables, config))
-            tasks.append(task)
-
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Convert exceptions to failed results
-        final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                final_results.append(
-                    ExecutionResult(
-                        execution_id=uuid4(),
-                        query_id=query_ids[i],
-                        endpoint_id=endpoint_id,
-                        status=ExecutionStatus.FAILED,
-                        started_at=datetime.now(UTC),
-                        error_message=str(result),
-                        error_code="TASK_EXCEPTION",
-                        variables=variables_map.get(query_ids[i]),
-                    )
+        """Execute queries in parallel with concurrency control.
+
+        Every ``config.batch_size`` queries are sent as one merged GraphQL
+        document (see ``_execute_batched_document``).
+        """
+        windows = [
+            query_ids[start : start + config.batch_size]
+            for start in range(0, len(query_ids), config.batch_size)
+        ]
+        window_results = await _map_bounded(
+            lambda window: self._execute_window(window, endpoint_id, variables_map, config),
+            windows,
+            config.max_concurrent,
+            lambda window, error: [
+                self._task_exception_result(error, query_id, endpoint_id, variables_map)
+                for query_id in window
+            ],
+        )
+        return [result for results in window_results for result in results]
+
+    def _task_exception_result(
+        self,
+        error: Exception,
+        query_id: UUID,
+        endpoint_id: UUID,
+        variables_map: dict[UUID, dict[str, Any]],
+    ) -> ExecutionResult:
+        """Build the failed result of a batched execution whose task raised ``error``."""
+        return ExecutionResult(
+            execution_id=uuid4(),
+            query_id=query_id,
+            endpoint_id=endpoint_id,
+            status=ExecutionStatus.FAILED,
+            started_at=datetime.now(UTC),
+            error_message=str(error),
+            error_code="TASK_EXCEPTION",
+            variables=variables_map.get(query_id),
+        )
+
+    async def _execute_window(
+        self,
+        query_ids: list[UUID],
+        endpoint_id: UUID,
+        variables_map: dict[UUID, dict[str, Any]],
+        config: ExecutionConfig,
+    ) -> list[ExecutionResult]:
+        """Execute one window of a parallel batch, as a single request if possible."""
+        if len(query_ids) > 1:
+            endpoint = await self._get_endpoint(endpoint_id)
+            queries = [(query_id, await self._get_query(query_id)) for query_id in query_ids]
+            if endpoint and all(query for _, query in queries):
+                results = await self._execute_batched_document(
+                    queries, endpoint_id, endpoint, variables_map, config
                 )
-            else:
-                final_results.append(result)
+                if results is not None:
+                    return results
+
+        return await _map_bounded(
+            lambda query_id: self.execute_query(
+                query_id, endpoint_id, variables_map.get(query_id), config
+            ),
+            query_ids,
+            config.max_concurrent,
+            lambda query_id, error: self._task_exception_result(
+                error, query_id, endpoint_id, variables_map
+            ),
+        )
+
+    async def _execute_batched_document(
+        self,
+        queries: list[tuple[UUID, Query]],
+        endpoint_id: UUID,
+        endpoint: Endpoint,
+        variables_map: dict[UUID, dict[str, Any]],
+        config: ExecutionConfig,
+    ) -> Optional[list[ExecutionResult]]:
+        """Execute queries against one endpoint in a single GraphQL request.
+
+        Cached results are served as in ``execute_query``. The other queries
+        are merged into one operation, and the response is split back into one
+        result per query. If the response can't be split (e.g. the merged
+        document failed validation or the endpoint answered with an HTTP
+        error), those queries are executed one by one. When the client raises
+        for GraphQL errors, the queries the errors belong to fail and the
+        others, whose data the client dropped, are executed one by one.
+
+        Returns:
+        -------
+            Results in the order of ``queries``, or None (before anything is
+            executed) when the queries can't be merged.
+        """
+        executions = [
+            (query_id, query, variables_map.get(query_id) or query.variables)
+            for query_id, query in queries
+        ]
+        merged = merge_queries(
+            [(query.query_text, variables) for _, query, variables in executions]
+        )
+        if merged is None:
+            return None
+
+        started = _Start.now()
+        results: list[Optional[ExecutionResult]] = [None] * len(executions)
+        pending = []
+
+        for index, (query_id, query, variables) in enumerate(executions):
+            execution_id = uuid4()
+            cache_key = None
+            if config.enable_caching:
+                cache_key = await self._offload(
+                    len(query.query_text),
+                    self._result_cache_key,
+                    query.query_text,
+                    endpoint_id,
+                    variables,
+                )
+                results[index] = await self._serve_cached_result(
+                    cache_key, execution_id, started, config
+                )
+            if results[index] is None:
+                pending.append((index, execution_id, cache_key))
+
+        if not pending:
+            return results
+
+        # Usually nothing was cached and the document merged above is sent as it is
+        if len(pending) < len(executions):
+            merged = merge_queries(
+                [(executions[index][1].query_text, executions[index][2]) for index, _, _ in pending]
+            )
+        client = self.client_factory(endpoint)
+
+        logger.info(f"Executing {len(pending)} queries as one batched request")
 
-        return final_results
+        retry_successes = False
+        body_size = 0
+        try:
+            async with self._execution_slot(endpoint_id):
+                reply = await asyncio.wait_for(
+                    client.execute_query(merged.query, merged.variables),
+                    timeout=config.timeout_seconds,
+                )
+            body_size = _response_size(reply)
+            response = _response_dict(reply)
+        except GraphQLExecutionError as e:
+            # The client raises on any error, dropping the data of the queries that
+            # succeeded: the queries the errors belong to fail, the others run again
+            response = {"data": {}, "errors": e.errors}
+            retry_successes = True
+        except Exception as e:
+            if not isinstance(e, GraphQLClientError) or isinstance(
+                e, (NetworkError, AuthenticationError)
+            ):
+                for index, execution_id, _ in pending:
+                    query_id, _, variables = executions[index]
+                    results[index] = self._failed_execution(
+                        e, execution_id, query_id, endpoint_id, started, variables, config
+                    )
+                return results
+            # Other client errors are HTTP errors, e.g. a 400 for a merged document one
+            # of the queries made invalid, so each query gets a request of its own
+            response = {}
+
+        responses = split_response(merged, response)
+        if responses is None:
+            logger.info("Batched response can't be split per query, executing them one by one")
+            await self._execute_pending_individually(
+                pending, results, executions, endpoint_id, variables_map, config
+            )
+            return results
+
+        if retry_successes:
+            succeeded = [entry for entry, data in zip(pending, responses) if "errors" not in data]
+            await self._execute_pending_individually(
+                succeeded, results, executions, endpoint_id, variables_map, config
+            )
+            failed = [position for position, data in enumerate(responses) if "errors" in data]
+            pending = [pending[position] for position in failed]
+            responses = [responses[position] for position in failed]
+
+        # The split responses have to be serialized to be measured
+        sizes = await self._offload(body_size, lambda: [_response_size(data) for data in responses])
+        for (index, execution_id, cache_key), result_data, size in zip(pending, responses, sizes):
+            query_id, query, variables = executions[index]
+            results[index] = await self._complete_execution(
+                execution_id,
+                query_id,
+                query,
+                endpoint_id,
+                started,
+                result_data,
+                variables,
+                config,
+                cache_key,
+                size,
+            )
+
+        return results
+
+    async def _execute_pending_individually(
+        self,
+        pending: list[tuple[int, UUID, Optional[bytes]]],
+        results: list[Optional[ExecutionResult]],
+        executions: list[tuple[UUID, Query, Optional[dict[str, Any]]]],
+        endpoint_id: UUID,
+        variables_map: dict[UUID, dict[str, Any]],
+        config: ExecutionConfig,
+    ):
+        """Execute the ``pending`` queries of a batched document one request each.
+
+        Their results are written to ``results`` at the queries' indexes.
+        """
+        individual = await _map_bounded(
+            lambda index: self.execute_query(
+                executions[index][0], endpoint_id, executions[index][2], config
+            ),
+            [index for index, _, _ in pending],
+            config.max_concurrent,
+            lambda index, error: self._task_exception_result(
+                error, executions[index][0], endpoint_id, variables_map
+            ),
+        )
+        for (index, _, _), result in zip(pending, individual):
+            results[index] = result
 
     async def _execute_by_priority(
         self,
@@ -480,7 +1114,7 @@ class QueryExecutionManager:
         # Get queries and sort by priority
         queries = []
         for query_id in query_ids:
-            query = await self.collection_manager.get_query(query_id)
+            query = await self._get_query(query_id)
             if query:
                 queries.append(query)
 
@@ -503,7 +1137,7 @@ class QueryExecutionManager:
         # Get queries with complexity scores
         query_complexities = []
         for query_id in query_ids:
-            query = await self.collection_manager.get_query(query_id)
+            query = await self._get_query(query_id)
             if query:
                 complexity = query.expected_complexity_score or 0.0
                 query_complexities.append((query_id, complexity))
@@ -562,16 +1196,6 @@ class QueryExecutionManager:
         -------
             ScheduledExecution instance
         """
-        # Validate cron expression
-        try:
-            cron = croniter(cron_expression, datetime.now(UTC))
-            next_run = cron.get_next(datetime)
-            # Ensure timezone-aware datetime
-            if next_run.tzinfo is None:
-                next_run = next_run.replace(tzinfo=UTC)
-        except ValueError as e:
-            raise ValueError(f"Invalid cron expression: {e}")
-
         # Create scheduled execution
         scheduled = ScheduledExecution(
             id=uuid4(),
@@ -579,10 +1203,17 @@ class QueryExecutionManager:
             cron_expression=cron_expression,
             endpoint_id=endpoint_id,
             config=config_override or self.config,
-            next_execution=next_run,
         )
 
+        # Validate cron expression
+        try:
+            next_run = scheduled.next_run_after(datetime.now(UTC))
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression: {e}")
+        scheduled.next_execution = next_run
+
         self._scheduled_executions[scheduled.id] = scheduled
+        self._push_schedule(scheduled)
 
         # Start scheduler if not already running
         if not self._scheduler_task or self._scheduler_task.done():
@@ -603,9 +1234,7 @@ class QueryExecutionManager:
             del self._scheduled_executions[scheduled_id]
 
             # Remove from database
-            await self.db_session.execute(
-                "DELETE FROM scheduled_executions WHERE id = $1", [scheduled_id]
-            )
+            await self.db_session.execute(_DELETE_SCHEDULED_EXECUTION, {"id": scheduled_id})
             await self.db_session.commit()
 
             logger.info(f"Unscheduled execution {scheduled_id}")
@@ -613,48 +1242,78 @@ class QueryExecutionManager:
 
         return False
 
+    def _track_execution(self, coro) -> asyncio.Task:
+        """Run ``coro`` as a task listed in ``_running_executions`` until it finishes."""
+        run_id = uuid4()
+        task = asyncio.create_task(coro)
+        self._running_executions[run_id] = task
+        # Drop the reference once done so finished runs (and their results) can be freed
+        task.add_done_callback(lambda _: self._running_executions.pop(run_id, None))
+        return task
+
+    def _push_schedule(self, scheduled: ScheduledExecution):
+        """Queue the next run of ``scheduled``, waking the scheduler if it is now first."""
+        if scheduled.next_execution is None:
+            return
+
+        entry = (scheduled.next_execution.timestamp(), scheduled.id)
+        heapq.heappush(self._schedule_heap, entry)
+        if self._schedule_heap[0] == entry:
+            self._schedule_changed.set()
+
     async def _scheduler_loop(self):
-        """Main scheduler loop for executing scheduled queries."""
+        """Main scheduler loop: sleep until the earliest scheduled run, then start it."""
         logger.info("Starting query scheduler")
 
         while not self._shutdown_event.is_set():
             try:
+                if not self._schedule_heap or self._schedule_heap[0][0] > time.time():
+                    delay = self._schedule_heap[0][0] - time.time() if self._schedule_heap else None
+                    # A run queued ahead of the current first one sets the event
+                    self._schedule_changed.clear()
+                    try:
+                        await asyncio.wait_for(self._schedule_changed.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                timestamp, scheduled_id = heapq.heappop(self._schedule_heap)
+                scheduled = self._scheduled_executions.get(scheduled_id)
+                # Skip entries of unscheduled, disabled or since rescheduled executions
+                if (
+                    scheduled is None
+                    or not scheduled.enabled
+                    or scheduled.next_execution is None
+                    or scheduled.next_execution.timestamp() != timestamp
+                ):
+                    continue
+
+                # Execute query
+                logger.info(f"Executing scheduled query {scheduled.query_id}")
+
+                # Don't await to avoid blocking scheduler
+                self._track_execution(self._execute_scheduled_query(scheduled))
+
+                # Calculate next execution time
                 now = datetime.now(UTC)
-
-                # Check for due executions
-                for scheduled in list(self._scheduled_executions.values()):
-                    if (
-                        scheduled.enabled
-                        and scheduled.next_execution
-                        and now >= scheduled.next_execution
-                    ):
-                        # Execute query
-                        logger.info(f"Executing scheduled query {scheduled.query_id}")
-
-                        # Don't await to avoid blocking scheduler
-                        asyncio.create_task(self._execute_scheduled_query(scheduled))
-
-                        # Calculate next execution time
-                        cron = croniter(scheduled.cron_expression, now)
-                        next_run = cron.get_next(datetime)
-                        # Ensure timezone-aware datetime
-                        if next_run.tzinfo is None:
-                            next_run = next_run.replace(tzinfo=UTC)
-                        scheduled.next_execution = next_run
-                        scheduled.last_execution = now
-
-                # Sleep until next check (every 30 seconds)
-                await asyncio.sleep(30)
+                scheduled.next_execution = scheduled.next_run_after(now)
+                scheduled.last_execution = now
+                self._push_schedule(scheduled)
 
             except Exception:
                 logger.exception("Error in scheduler loop")
                 await asyncio.sleep(60)  # Longer sleep on error
 
     async def _execute_scheduled_query(self, scheduled: ScheduledExecution):
-        """Execute a scheduled query."""
+        """Execute a scheduled query.
+
+        Scheduled runs monitor the endpoint, so they always bypass the result cache.
+        """
         try:
             result = await self.execute_query(
-                scheduled.query_id, scheduled.endpoint_id, config_override=scheduled.config
+                scheduled.query_id,
+                scheduled.endpoint_id,
+                config_override=replace(scheduled.config, enable_caching=False),
             )
 
             logger.info(f"Scheduled execution completed: {result.status.value}")
@@ -685,30 +1344,41 @@ class QueryExecutionManager:
             else {},
         )
 
-        self.db_session.add(execution)
-        await self.db_session.commit()
+        self._pending_executions.append(execution)
+        # Outside a batch the record is written straight away
+        if not _storing_batch.get() or len(self._pending_executions) >= _EXECUTION_FLUSH_SIZE:
+            await self._flush_execution_results(commit=True)
+
+    async def _flush_execution_results(self, commit: bool):
+        """Add the buffered execution records to the session, committing if asked.
+
+        The ORM flushes records of one model as a single multi-row INSERT, so
+        a batch's records cost one round trip and one commit.
+        """
+        if not self._pending_executions:
+            return
+        executions, self._pending_executions = self._pending_executions, []
+        self.db_session.add_all(executions)
+        if commit:
+            await self.db_session.commit()
 
     async def _store_batch_result(self, batch_result: BatchExecutionResult):
         """Store batch execution result."""
-        # Store individual results (already done in _store_execution_result)
+        # Individual results still buffered are committed with the batch summary
+        await self._flush_execution_results(commit=False)
 
         # Store batch summary
         await self.db_session.execute(
-            """
-            INSERT INTO batch_executions (
-                id, total_queries, successful, failed, cancelled,
-                total_time, created_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-        """,
-            [
-                batch_result.batch_id,
-                batch_result.total_queries,
-                batch_result.successful,
-                batch_result.failed,
-                batch_result.cancelled,
-                batch_result.total_time,
-                datetime.now(UTC),
-            ],
+            _INSERT_BATCH_EXECUTION,
+            {
+                "id": batch_result.batch_id,
+                "total_queries": batch_result.total_queries,
+                "successful": batch_result.successful,
+                "failed": batch_result.failed,
+                "cancelled": batch_result.cancelled,
+                "total_time": batch_result.total_time,
+                "created_at": datetime.now(UTC),
+            },
         )
 
         await self.db_session.commit()
@@ -716,22 +1386,17 @@ class QueryExecutionManager:
     async def _store_scheduled_execution(self, scheduled: ScheduledExecution):
         """Store scheduled execution configuration."""
         await self.db_session.execute(
-            """
-            INSERT INTO scheduled_executions (
-                id, query_id, cron_expression, endpoint_id, config,
-                enabled, created_at, next_execution
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-        """,
-            [
-                scheduled.id,
-                scheduled.query_id,
-                scheduled.cron_expression,
-                scheduled.endpoint_id,
-                json.dumps(self._serialize_config(scheduled.config)),
-                scheduled.enabled,
-                scheduled.created_at,
-                scheduled.next_execution,
-            ],
+            _INSERT_SCHEDULED_EXECUTION,
+            {
+                "id": scheduled.id,
+                "query_id": scheduled.query_id,
+                "cron_expression": scheduled.cron_expression,
+                "endpoint_id": scheduled.endpoint_id,
+                "config": dumps(self._serialize_config(scheduled.config)),
+                "enabled": scheduled.enabled,
+                "created_at": scheduled.created_at,
+                "next_execution": scheduled.next_execution,
+            },
         )
 
         await self.db_session.commit()
@@ -739,9 +1404,11 @@ class QueryExecutionManager:
     def _serialize_config(self, config: ExecutionConfig) -> dict:
         """Serialize ExecutionConfig to JSON-compatible dictionary."""
         result = config.__dict__.copy()
-        # Convert enum keys to strings
-        if "priority_weights" in result:
-            result["priority_weights"] = {str(k): v for k, v in result["priority_weights"].items()}
+        # Convert enum keys to strings (keys loaded back from JSON are strings already)
+        result["priority_weights"] = {
+            _PRIORITY_KEYS.get(priority) or str(priority): weight
+            for priority, weight in config.priority_weights.items()
+        }
         return result
 
     # Metrics and Monitoring
@@ -822,13 +1489,14 @@ class QueryExecutionManager:
                 query_id=row["query_id"],
                 cron_expression=row["cron_expression"],
                 endpoint_id=row["endpoint_id"],
-                config=ExecutionConfig(**json.loads(row["config"])),
+                config=ExecutionConfig(**loads(row["config"])),
                 enabled=row["enabled"],
                 created_at=row["created_at"],
                 last_execution=row["last_execution"],
                 next_execution=row["next_execution"],
             )
             self._scheduled_executions[scheduled.id] = scheduled
+            self._push_schedule(scheduled)
 
         # Start scheduler
         if self._scheduled_executions and not self._scheduler_task:
@@ -853,14 +1521,21 @@ class QueryExecutionManager:
             except asyncio.CancelledError:
                 pass
 
-        # Cancel running executions
-        for task in self._running_executions.values():
+        # Cancel running executions. Snapshot them first, as done callbacks remove finished
+        # tasks from the registry; asyncio.wait takes the tasks as they are, where gather
+        # would wrap each one and collect results nobody reads.
+        tasks = list(self._running_executions.values())
+        for task in tasks:
             task.cancel()
 
-        if self._running_executions:
-            await asyncio.gather(*self._running_executions.values(), return_exceptions=True)
+        if tasks:
+            await asyncio.wait(tasks)
+
+        # Write out execution records of batches that didn't finish
+        await self._flush_execution_results(commit=True)
 
-        # Cleanup thread pool
-        self._thread_pool.shutdown(wait=True)
+        # Cleanup thread pool, if anything was offloaded
+        if "_thread_pool" in self.__dict__:
+            self._thread_pool.shutdown(wait=True)
 
         logger.info("Execution manager stopped")
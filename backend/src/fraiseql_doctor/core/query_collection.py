@@ -7,16 +7,29 @@ Provides comprehensive management of GraphQL queries including:
 - Search and filtering capabilities
 """
 
+import asyncio
+import hashlib
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
+from functools import cache
+from operator import attrgetter
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import select
+
 from ..models.query import Query
 from ..models.query_collection import QueryCollection
 from ..schemas.query import QueryCollectionCreate, QueryCollectionUpdate, QueryCreate, QueryUpdate
-from ..services.complexity import QueryComplexityAnalyzer
+from ..services.complexity import ComplexityMetrics, QueryComplexityAnalyzer
+from ..services.retry import CircuitBreaker, CircuitBreakerConfig
+from ..utils.cache import TTLCache
+
+
+class DatabaseUnavailableError(Exception):
+    """Raised instead of querying while the database circuit breaker is open."""
 
 
 class QueryStatus(Enum):
@@ -63,11 +76,57 @@ class QuerySearchFilter:
     complexity_max: Optional[float] = None
     created_after: Optional[datetime] = None
     created_before: Optional[datetime] = None
-    tags: Optional[set[str]] = None
+    tags: Optional[frozenset[str]] = None
     limit: int = 100
     offset: int = 0
 
 
+# Search filter -> (SQL predicate with a {p} placeholder, filter value -> bound parameter)
+_SEARCH_CLAUSES: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    "text": (
+        "AND (name ILIKE {p} OR description ILIKE {p} OR content ILIKE {p})",
+        lambda text: f"%{text}%",
+    ),
+    "status": ("AND status = {p}", attrgetter("value")),
+    "priority": ("AND priority = {p}", attrgetter("value")),
+    "collection_ids": ("AND collection_id = ANY({p})", list),
+    "complexity_min": ("AND metadata->>'complexity_score' >= {p}", str),
+    "complexity_max": ("AND metadata->>'complexity_score' <= {p}", str),
+    "created_after": ("AND created_at >= {p}", lambda date: date),
+    "created_before": ("AND created_at <= {p}", lambda date: date),
+    "tags": ("AND tags @> {p}", list),
+}
+
+
+def _filter_is_set(value: Any) -> bool:
+    """Return whether a search filter value narrows the search (empty text or lists don't)."""
+    if isinstance(value, str | list | set | frozenset):
+        return bool(value)
+    return value is not None
+
+
+# Keyed by the active filter names, of which there are only a few hundred combinations
+@cache
+def _search_sql(active: tuple[str, ...]) -> str:
+    """Build the search statement for ``active`` filters, numbering parameters in order."""
+    parts = ["SELECT * FROM queries WHERE 1=1"]
+    parts += [
+        _SEARCH_CLAUSES[name][0].format(p=f"${number}")
+        for number, name in enumerate(active, start=1)
+    ]
+    parts.append(f"ORDER BY created_at DESC LIMIT ${len(active) + 1} OFFSET ${len(active) + 2}")
+    return " ".join(parts)
+
+
+def _estimated_cost(analysis: ComplexityMetrics) -> float:
+    """Return the analysis's execution time estimate, 0.0 if the analyzer makes none.
+
+    ``QueryComplexityAnalyzer`` doesn't estimate execution time; analyzers that
+    do report it as ``estimated_execution_time``.
+    """
+    return getattr(analysis, "estimated_execution_time", 0.0)
+
+
 class QueryCollectionManager:
     """Manages GraphQL query collections with advanced organization and search capabilities.
 
@@ -79,11 +138,65 @@ class QueryCollectionManager:
     - Performance metrics tracking
     """
 
-    def __init__(self, db_session, complexity_analyzer: QueryComplexityAnalyzer):
+    def __init__(
+        self,
+        db_session,
+        complexity_analyzer: QueryComplexityAnalyzer,
+        cache_size: int = 1024,
+        cache_ttl_seconds: float = 300,
+        max_concurrent_queries: Optional[int] = None,
+        circuit_breaker_config: Optional[CircuitBreakerConfig] = None,
+    ):
         self.db_session = db_session
         self.complexity_analyzer = complexity_analyzer
-        self._cache: dict[UUID, QueryCollection] = {}
-        self._query_cache: dict[UUID, Query] = {}
+        # Optional cap on statements in flight, and optional breaker that stops sending
+        # statements for a while once the database keeps failing
+        self._statement_semaphore = (
+            asyncio.Semaphore(max_concurrent_queries) if max_concurrent_queries else None
+        )
+        self._circuit_breaker = (
+            CircuitBreaker(circuit_breaker_config) if circuit_breaker_config else None
+        )
+        # Bounded, and expiring so changes made by other processes are picked up. Keyed by
+        # the UUIDs themselves: UUID.bytes is rebuilt on every access, which makes lookups
+        # slower, and int keys would save well under a microsecond per hit.
+        self._cache: TTLCache[UUID, QueryCollection] = TTLCache(cache_size, cache_ttl_seconds)
+        self._query_cache: TTLCache[UUID, Query] = TTLCache(cache_size, cache_ttl_seconds)
+        # Name -> ID of cached collections, so name lookups can skip the database
+        self._name_index: TTLCache[str, UUID] = TTLCache(cache_size, cache_ttl_seconds)
+        # Query text digest -> analysis; analysis only depends on the text
+        self._analysis_cache: TTLCache[bytes, ComplexityMetrics] = TTLCache(
+            cache_size, cache_ttl_seconds
+        )
+
+    async def _execute(self, statement: Any, params: Optional[list[Any]] = None) -> Any:
+        """Run ``statement`` on the session, within the concurrency cap and circuit breaker.
+
+        ``params`` are passed on when given; SQLAlchemy statements carry their own.
+
+        Raises:
+        ------
+            DatabaseUnavailableError: If the circuit breaker is open
+        """
+        breaker = self._circuit_breaker
+        if breaker is not None and not breaker.is_request_allowed():
+            raise DatabaseUnavailableError("Circuit breaker is OPEN - database unavailable")
+
+        args = (statement,) if params is None else (statement, params)
+        try:
+            if self._statement_semaphore is None:
+                result = await self.db_session.execute(*args)
+            else:
+                async with self._statement_semaphore:
+                    result = await self.db_session.execute(*args)
+        except Exception:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+
+        if breaker is not None:
+            breaker.record_success()
+        return result
 
     # Collection Management
 
@@ -111,57 +224,77 @@ class QueryCollectionManager:
             raise ValueError(f"Collection with name '{schema.name}' already exists")
 
         # Create collection
+        now = datetime.now(UTC)
         collection = QueryCollection(
             pk_query_collection=uuid4(),
             name=schema.name,
             description=schema.description,
-            tags={tag: True for tag in schema.tags} if schema.tags else {},
+            tags=list(schema.tags),
             is_active=schema.is_active,
             created_by=schema.created_by,
             collection_metadata=schema.metadata,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=now,
+            updated_at=now,
         )
 
-        # Add initial queries if provided
-        if schema.initial_queries:
-            for query_data in schema.initial_queries:
-                await self._add_query_to_collection(
-                    collection, query_data, validate=validate_queries
-                )
+        # Build initial queries, analyzing them all before anything is stored
+        validated_at = now if validate_queries else None
+        queries = [
+            self._new_query(
+                collection,
+                query_data,
+                self._analyze_new_query(query_data.query_text) if validate_queries else None,
+                validated_at,
+            )
+            for query_data in schema.initial_queries
+        ]
 
-        # Store in database
+        # Store the collection and its queries in one transaction
         self.db_session.add(collection)
+        self.db_session.add_all(queries)
         await self.db_session.commit()
 
         # Cache and return
-        self._cache[collection.pk_query_collection] = collection
+        self._cache_collection(collection)
+        for query in queries:
+            self._query_cache[query.pk_query] = query
         return collection
 
     async def get_collection(self, collection_id: UUID) -> Optional[QueryCollection]:
         """Get collection by ID with caching."""
-        if collection_id in self._cache:
-            return self._cache[collection_id]
+        collection = self._cache.get(collection_id)
+        if collection is not None:
+            return collection
 
         collection = await self.db_session.get(QueryCollection, collection_id)
         if collection:
-            self._cache[collection_id] = collection
+            self._cache_collection(collection)
 
         return collection
 
     async def get_collection_by_name(self, name: str) -> Optional[QueryCollection]:
-        """Get collection by name."""
-        result = await self.db_session.execute(
-            "SELECT * FROM query_collections WHERE name = $1", [name]
-        )
+        """Get collection by name, from the cache when it holds a collection by that name."""
+        collection_id = self._name_index.get(name)
+        if collection_id is not None:
+            collection = self._cache.get(collection_id)
+            if collection is not None and collection.name == name:
+                return collection
+            self._name_index.pop(name, None)
+
+        result = await self._execute("SELECT * FROM query_collections WHERE name = $1", [name])
 
         if result:
             collection = QueryCollection.from_dict(result[0])
-            self._cache[collection.pk_query_collection] = collection
+            self._cache_collection(collection)
             return collection
 
         return None
 
+    def _cache_collection(self, collection: QueryCollection) -> None:
+        """Cache ``collection`` by ID and index it by name."""
+        self._cache[collection.pk_query_collection] = collection
+        self._name_index[collection.name] = collection.pk_query_collection
+
     async def update_collection(
         self, collection_id: UUID, schema: QueryCollectionUpdate
     ) -> Optional[QueryCollection]:
@@ -171,18 +304,19 @@ class QueryCollectionManager:
             return None
 
         # Update fields
-        if schema.name is not None:
+        if schema.name is not None and schema.name != collection.name:
             # Check for name conflicts
             existing = await self.get_collection_by_name(schema.name)
-            if existing and existing.id != collection_id:
+            if existing and existing.pk_query_collection != collection_id:
                 raise ValueError(f"Collection with name '{schema.name}' already exists")
+            self._name_index.pop(collection.name, None)
             collection.name = schema.name
 
         if schema.description is not None:
             collection.description = schema.description
 
         if schema.tags is not None:
-            collection.tags = set(schema.tags)
+            collection.tags = list(schema.tags)
 
         if schema.is_active is not None:
             collection.is_active = schema.is_active
@@ -193,7 +327,7 @@ class QueryCollectionManager:
         await self.db_session.commit()
 
         # Update cache
-        self._cache[collection_id] = collection
+        self._cache_collection(collection)
         return collection
 
     async def delete_collection(self, collection_id: UUID, force: bool = False) -> bool:
@@ -224,8 +358,8 @@ class QueryCollectionManager:
         await self.db_session.commit()
 
         # Remove from cache
-        if collection_id in self._cache:
-            del self._cache[collection_id]
+        self._cache.pop(collection_id, None)
+        self._name_index.pop(collection.name, None)
 
         return True
 
@@ -242,15 +376,16 @@ class QueryCollectionManager:
 
         query += " ORDER BY name"
 
-        results = await self.db_session.execute(query, params)
+        results = await self._execute(query, params)
         collections = [QueryCollection.from_dict(row) for row in results]
 
-        # Add metrics if requested
+        # Add metrics if requested, computed for all collections at once
         if include_metrics:
+            metrics = await self._calculate_metrics_bulk(
+                [collection.pk_query_collection for collection in collections]
+            )
             for collection in collections:
-                collection.metrics = await self._calculate_collection_metrics(
-                    collection.pk_query_collection
-                )
+                collection.metrics = metrics[collection.pk_query_collection]
 
         return collections
 
@@ -271,40 +406,16 @@ class QueryCollectionManager:
     ) -> Query:
         """Internal method to add query to collection."""
         # Validate GraphQL syntax if requested
-        if validate:
-            try:
-                analysis = await self.complexity_analyzer.analyze_query(schema.query_text)
-            except Exception as e:
-                raise ValueError(f"Invalid GraphQL query: {e}")
-        else:
-            analysis = None
+        analysis = self._analyze_new_query(schema.query_text) if validate else None
 
-        # Create query
-        query = Query(
-            pk_query=uuid4(),
-            name=schema.name,
-            description=schema.description,
-            query_text=schema.query_text,
-            variables=schema.variables or {},
-            expected_complexity_score=int(analysis.complexity_score) if analysis else 0,
-            tags=schema.tags or [],
-            is_active=True,
-            created_by=schema.created_by,
-            query_metadata={
-                "collection_id": str(collection.pk_query_collection),
-                "complexity_score": analysis.complexity_score if analysis else 0.0,
-                "estimated_cost": analysis.estimated_execution_time if analysis else 0.0,
-                "field_count": analysis.field_count if analysis else 0,
-                "depth": analysis.depth if analysis else 0,
-                "last_validated": datetime.now(UTC).isoformat() if validate else None,
-            },
-        )
+        now = datetime.now(UTC)
+        query = self._new_query(collection, schema, analysis, now if validate else None)
 
         # Note: In this simplified version, we just create the query
         # In a full implementation, queries would be stored separately
         # and linked to collections via collection_id in metadata
 
-        collection.updated_at = datetime.now(UTC)
+        collection.updated_at = now
 
         # Store in database
         self.db_session.add(query)
@@ -315,10 +426,75 @@ class QueryCollectionManager:
 
         return query
 
+    def _analyze_new_query(self, query_text: str) -> ComplexityMetrics:
+        """Analyze a query about to be added, rejecting invalid GraphQL with ValueError."""
+        try:
+            return self._analyze(query_text)
+        except Exception as e:
+            raise ValueError(f"Invalid GraphQL query: {e}")
+
+    def _analyze(self, query_text: str) -> ComplexityMetrics:
+        """Analyze ``query_text``, reusing the result for text analyzed before."""
+        key = hashlib.blake2b(query_text.encode("utf-8"), digest_size=16).digest()
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            analysis = self.complexity_analyzer.analyze_query(query_text)
+            self._analysis_cache[key] = analysis
+        return analysis
+
+    def _new_query(
+        self,
+        collection: QueryCollection,
+        schema: QueryCreate,
+        analysis: Optional[ComplexityMetrics],
+        validated_at: Optional[datetime],
+    ) -> Query:
+        """Build an unsaved query for ``collection`` from its creation schema.
+
+        Without an analysis, the analysis fields the schema supplies (e.g. a
+        result the caller cached) are stored as given.
+        """
+        metadata = {
+            "complexity_score": 0.0,
+            "estimated_cost": 0.0,
+            "field_count": 0,
+            "depth": 0,
+            "last_validated": None,
+            **schema.query_metadata,
+            "collection_id": str(collection.pk_query_collection),
+        }
+        if analysis:
+            metadata.update(
+                complexity_score=analysis.complexity_score,
+                estimated_cost=_estimated_cost(analysis),
+                field_count=analysis.field_count,
+                depth=analysis.depth,
+            )
+        if validated_at:
+            metadata["last_validated"] = validated_at.isoformat()
+
+        return Query(
+            pk_query=uuid4(),
+            name=schema.name,
+            description=schema.description,
+            query_text=schema.query_text,
+            variables=schema.variables or {},
+            expected_complexity_score=(
+                int(analysis.complexity_score)
+                if analysis
+                else schema.expected_complexity_score or 0
+            ),
+            tags=list(schema.tags),
+            is_active=True,
+            created_by=schema.created_by,
+            query_metadata=metadata,
+        )
+
     async def get_query(self, query_id: UUID) -> Optional[Query]:
         """Get query by ID with caching."""
-        if query_id in self._query_cache:
-            return self._query_cache[query_id]
+        query = self._query_cache.get(query_id)
+        if query is not None:
+            return query
 
         query = await self.db_session.get(Query, query_id)
         if query:
@@ -326,6 +502,39 @@ class QueryCollectionManager:
 
         return query
 
+    async def get_queries(self, query_ids: list[UUID]) -> list[Optional[Query]]:
+        """Get several queries by ID, fetching the uncached ones in a single query.
+
+        Returns the queries in ``query_ids`` order, with None for unknown IDs.
+        """
+        found: dict[UUID, Query] = {}
+        missing = []
+        for query_id in dict.fromkeys(query_ids):
+            query = self._query_cache.get(query_id)
+            if query is None:
+                missing.append(query_id)
+            else:
+                found[query_id] = query
+
+        if missing:
+            result = await self._execute(select(Query).where(Query.pk_query.in_(missing)))
+            for query in result.scalars():
+                self._query_cache[query.pk_query] = query
+                found[query.pk_query] = query
+
+        return [found.get(query_id) for query_id in query_ids]
+
+    async def get_query_by_name(self, name: str) -> Optional[Query]:
+        """Get query by exact name."""
+        result = await self._execute("SELECT * FROM queries WHERE name = $1 LIMIT 1", [name])
+
+        if result:
+            query = Query.from_dict(result[0])
+            self._query_cache[query.pk_query] = query
+            return query
+
+        return None
+
     async def update_query(
         self, query_id: UUID, schema: QueryUpdate, validate: bool = True
     ) -> Optional[Query]:
@@ -334,16 +543,18 @@ class QueryCollectionManager:
         if not query:
             return None
 
+        now = datetime.now(UTC)
+
         # Update content and re-analyze if changed
         if schema.query_text is not None and schema.query_text != query.query_text:
             if validate:
                 try:
-                    analysis = await self.complexity_analyzer.analyze_query(schema.query_text)
+                    analysis = self._analyze(schema.query_text)
                     query.metadata.complexity_score = analysis.complexity_score
-                    query.metadata.estimated_cost = analysis.estimated_execution_time
+                    query.metadata.estimated_cost = _estimated_cost(analysis)
                     query.metadata.field_count = analysis.field_count
                     query.metadata.depth = analysis.depth
-                    query.metadata.last_validated = datetime.now(UTC)
+                    query.metadata.last_validated = now
                 except Exception as e:
                     raise ValueError(f"Invalid GraphQL query: {e}")
 
@@ -366,9 +577,15 @@ class QueryCollectionManager:
             query.priority = QueryPriority(schema.priority)
 
         if schema.tags is not None:
-            query.tags = set(schema.tags)
+            query.tags = list(schema.tags)
+
+        if schema.expected_complexity_score is not None:
+            query.expected_complexity_score = schema.expected_complexity_score
+
+        if schema.query_metadata is not None:
+            query.query_metadata = {**(query.query_metadata or {}), **schema.query_metadata}
 
-        query.updated_at = datetime.now(UTC)
+        query.updated_at = now
 
         # Update database
         await self.db_session.commit()
@@ -386,7 +603,10 @@ class QueryCollectionManager:
         # Remove from collection
         collection = await self.get_collection(query.collection_id)
         if collection:
-            collection.queries = [q for q in collection.queries if q.id != query_id]
+            # Unlink in place rather than rebuilding the collection's query list
+            index = next((i for i, q in enumerate(collection.queries) if q.id == query_id), None)
+            if index is not None:
+                del collection.queries[index]
             collection.updated_at = datetime.now(UTC)
 
         # Delete from database
@@ -394,8 +614,7 @@ class QueryCollectionManager:
         await self.db_session.commit()
 
         # Remove from cache
-        if query_id in self._query_cache:
-            del self._query_cache[query_id]
+        self._query_cache.pop(query_id, None)
 
         return True
 
@@ -403,83 +622,13 @@ class QueryCollectionManager:
 
     async def search_queries(self, filter_params: QuerySearchFilter) -> list[Query]:
         """Advanced query search with multiple filter criteria."""
-        query_parts = ["SELECT * FROM queries WHERE 1=1"]
-        params = []
-        param_counter = 0
-
-        # Text search in name, description, or content
-        if filter_params.text:
-            param_counter += 1
-            query_parts.append(
-                f"""
-                AND (
-                    name ILIKE ${param_counter} OR
-                    description ILIKE ${param_counter} OR
-                    content ILIKE ${param_counter}
-                )
-            """
-            )
-            params.append(f"%{filter_params.text}%")
-
-        # Status filter
-        if filter_params.status:
-            param_counter += 1
-            query_parts.append(f"AND status = ${param_counter}")
-            params.append(filter_params.status.value)
-
-        # Priority filter
-        if filter_params.priority:
-            param_counter += 1
-            query_parts.append(f"AND priority = ${param_counter}")
-            params.append(filter_params.priority.value)
-
-        # Collection filter
-        if filter_params.collection_ids:
-            param_counter += 1
-            query_parts.append(f"AND collection_id = ANY(${param_counter})")
-            params.append(filter_params.collection_ids)
-
-        # Complexity range
-        if filter_params.complexity_min is not None:
-            param_counter += 1
-            query_parts.append(f"AND metadata->>'complexity_score' >= ${param_counter}")
-            params.append(str(filter_params.complexity_min))
-
-        if filter_params.complexity_max is not None:
-            param_counter += 1
-            query_parts.append(f"AND metadata->>'complexity_score' <= ${param_counter}")
-            params.append(str(filter_params.complexity_max))
-
-        # Date range
-        if filter_params.created_after:
-            param_counter += 1
-            query_parts.append(f"AND created_at >= ${param_counter}")
-            params.append(filter_params.created_after)
-
-        if filter_params.created_before:
-            param_counter += 1
-            query_parts.append(f"AND created_at <= ${param_counter}")
-            params.append(filter_params.created_before)
-
-        # Tags filter (PostgreSQL array contains)
-        if filter_params.tags:
-            param_counter += 1
-            query_parts.append(f"AND tags @> ${param_counter}")
-            params.append(list(filter_params.tags))
-
-        # Pagination
-        query_parts.append("ORDER BY created_at DESC")
-
-        param_counter += 1
-        query_parts.append(f"LIMIT ${param_counter}")
-        params.append(filter_params.limit)
-
-        param_counter += 1
-        query_parts.append(f"OFFSET ${param_counter}")
-        params.append(filter_params.offset)
-
-        final_query = " ".join(query_parts)
-        results = await self.db_session.execute(final_query, params)
+        values = {name: getattr(filter_params, name) for name in _SEARCH_CLAUSES}
+        active = tuple(name for name, value in values.items() if _filter_is_set(value))
+        params = [_SEARCH_CLAUSES[name][1](values[name]) for name in active]
+        params += [filter_params.limit, filter_params.offset]
+
+        final_query = _search_sql(active)
+        results = await self._execute(final_query, params)
 
         return [Query.from_dict(row) for row in results]
 
@@ -491,63 +640,78 @@ class QueryCollectionManager:
         if not collection:
             return QueryCollectionMetrics()
 
-        # Query database for queries in this collection
-        query_results = await self.db_session.execute(
-            """SELECT * FROM queries WHERE collection_id = $1""", [collection_id]
-        )
-        queries = query_results if query_results else []
-
-        total_queries = len(queries)
-        active_queries = len([q for q in queries if q.get("is_active", True)])
+        metrics = await self._calculate_metrics_bulk([collection_id])
+        return metrics[collection_id]
 
-        if total_queries == 0:
-            return QueryCollectionMetrics(
-                total_queries=0, active_queries=0, avg_complexity_score=0.0
-            )
+    async def _calculate_metrics_bulk(
+        self, collection_ids: list[UUID]
+    ) -> dict[UUID, QueryCollectionMetrics]:
+        """Calculate performance metrics for several collections in one query.
 
-        # Calculate average complexity
-        complexity_scores = [
-            q.get("complexity_score", 0.0) for q in queries if q.get("complexity_score", 0.0) > 0
-        ]
-        avg_complexity = (
-            sum(complexity_scores) / len(complexity_scores) if complexity_scores else 0.0
-        )
+        Query counts and execution statistics are aggregated separately before
+        being joined, so a query's executions don't weight its complexity.
+        Collections without queries get empty metrics.
+        """
+        metrics = {collection_id: QueryCollectionMetrics() for collection_id in collection_ids}
+        if not collection_ids:
+            return metrics
 
-        # Get execution stats from database using the query IDs from our results
-        query_ids = [q.get("id") for q in queries if q.get("id")]
-        if query_ids:
-            exec_stats = await self.db_session.execute(
-                """
+        results = await self._execute(
+            """
+            WITH collection_queries AS (
+                SELECT id, collection_id, is_active, complexity_score
+                FROM queries
+                WHERE collection_id = ANY($1)
+            ),
+            query_stats AS (
                 SELECT
+                    collection_id,
+                    COUNT(*) as total_queries,
+                    COUNT(*) FILTER (WHERE COALESCE(is_active, TRUE)) as active_queries,
+                    AVG(complexity_score) FILTER (WHERE complexity_score > 0)
+                        as avg_complexity_score
+                FROM collection_queries
+                GROUP BY collection_id
+            ),
+            execution_stats AS (
+                SELECT
+                    q.collection_id,
                     COUNT(*) as total_executions,
-                    AVG(CASE WHEN success THEN 1.0 ELSE 0.0 END) as success_rate,
-                    AVG(execution_time) as avg_execution_time,
-                    MAX(executed_at) as last_executed
-                FROM query_executions
-                WHERE query_id = ANY($1)
-            """,
-                [query_ids],
+                    AVG(CASE WHEN e.success THEN 1.0 ELSE 0.0 END) as success_rate,
+                    AVG(e.execution_time) as avg_execution_time,
+                    MAX(e.executed_at) as last_executed
+                FROM query_executions e
+                JOIN collection_queries q ON q.id = e.query_id
+                GROUP BY q.collection_id
             )
-        else:
-            exec_stats = []
-
-        if exec_stats and len(exec_stats) > 0:
-            stats = exec_stats[0]
-            return QueryCollectionMetrics(
-                total_queries=total_queries,
-                active_queries=active_queries,
-                avg_complexity_score=avg_complexity,
-                total_executions=stats.get("total_executions", 0) or 0,
-                success_rate=float(stats.get("success_rate", 0.0) or 0.0),
-                avg_execution_time=float(stats.get("avg_execution_time", 0.0) or 0.0),
-                last_executed=stats.get("last_executed"),
+            SELECT
+                collection_id,
+                total_queries,
+                active_queries,
+                COALESCE(avg_complexity_score, 0.0) as avg_complexity_score,
+                COALESCE(total_executions, 0) as total_executions,
+                COALESCE(success_rate, 0.0) as success_rate,
+                COALESCE(avg_execution_time, 0.0) as avg_execution_time,
+                last_executed
+            FROM query_stats
+            LEFT JOIN execution_stats USING (collection_id)
+        """,
+            [collection_ids],
+        )
+
+        # Defaults are applied in SQL, so only last_executed can be NULL
+        for stats in results or []:
+            metrics[stats["collection_id"]] = QueryCollectionMetrics(
+                total_queries=stats["total_queries"],
+                active_queries=stats["active_queries"],
+                avg_complexity_score=float(stats["avg_complexity_score"]),
+                total_executions=stats["total_executions"],
+                success_rate=float(stats["success_rate"]),
+                avg_execution_time=float(stats["avg_execution_time"]),
+                last_executed=stats["last_executed"],
             )
 
-        return QueryCollectionMetrics(
-            total_queries=total_queries,
-            active_queries=active_queries,
-            avg_complexity_score=avg_complexity,
-        )
+        return metrics
 
     async def get_collection_metrics(self, collection_id: UUID) -> Optional[QueryCollectionMetrics]:
         """Get metrics for a specific collection."""
@@ -555,7 +719,8 @@ class QueryCollectionManager:
         if not collection:
             return None
 
-        return await self._calculate_collection_metrics(collection_id)
+        metrics = await self._calculate_metrics_bulk([collection_id])
+        return metrics[collection_id]
 
     # Bulk Operations
 
@@ -564,18 +729,21 @@ class QueryCollectionManager:
         if not query_ids:
             return 0
 
-        result = await self.db_session.execute(
+        now = datetime.now(UTC)
+        result = await self._execute(
             "UPDATE queries SET status = $1, updated_at = $2 WHERE id = ANY($3)",
-            [status.value, datetime.now(UTC), query_ids],
+            [status.value, now, query_ids],
         )
 
         await self.db_session.commit()
 
-        # Update cache
-        for query_id in query_ids:
-            if query_id in self._query_cache:
-                self._query_cache[query_id].status = status
-                self._query_cache[query_id].updated_at = datetime.now(UTC)
+        # Update cached queries; intersecting from the bounded cache's side touches at most
+        # cache-size entries however many rows were updated
+        for query_id in set(query_ids).intersection(self._query_cache):
+            query = self._query_cache.get(query_id)
+            if query is not None:
+                query.status = status
+                query.updated_at = now
 
         return result.rowcount if hasattr(result, "rowcount") else len(query_ids)
 
@@ -586,23 +754,27 @@ class QueryCollectionManager:
             return {"error": "Collection not found"}
 
         results = {"total": len(collection.queries), "valid": 0, "invalid": 0, "errors": []}
+        now = datetime.now(UTC)
 
+        # A failing query doesn't stop the others; every query gets validated
         for query in collection.queries:
             try:
-                analysis = await self.complexity_analyzer.analyze_query(query.query_text)
-                query.metadata.complexity_score = analysis.complexity_score
-                query.metadata.estimated_cost = analysis.estimated_execution_time
-                query.metadata.field_count = analysis.field_count
-                query.metadata.depth = analysis.depth
-                query.metadata.last_validated = datetime.now(UTC)
-                query.status = QueryStatus.VALIDATED
-                results["valid"] += 1
+                analysis = self._analyze(query.query_text)
             except Exception as e:
                 query.status = QueryStatus.ERROR
                 results["invalid"] += 1
                 results["errors"].append(
                     {"query_id": str(query.pk_query), "query_name": query.name, "error": str(e)}
                 )
+                continue
+
+            query.metadata.complexity_score = analysis.complexity_score
+            query.metadata.estimated_cost = _estimated_cost(analysis)
+            query.metadata.field_count = analysis.field_count
+            query.metadata.depth = analysis.depth
+            query.metadata.last_validated = now
+            query.status = QueryStatus.VALIDATED
+            results["valid"] += 1
 
         await self.db_session.commit()
         return results
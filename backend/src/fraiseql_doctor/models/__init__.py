@@ -1,6 +1,7 @@
 """Database models package."""
 
-# Import all models to ensure they're registered with SQLAlchemy
+# Import the models linked by relationship() so SQLAlchemy can resolve their
+# string targets when it configures the mappers
 from .base import Base
 from .endpoint import Endpoint
 from .execution import Execution
@@ -8,4 +9,13 @@ from .health_check import HealthCheck
 from .query import Query
 from .schedule import Schedule
 
-__all__ = ["Base", "Query", "Endpoint", "Execution", "HealthCheck", "Schedule"]
+__all__ = ["Base", "Query", "Endpoint", "Execution", "HealthCheck", "Schedule", "load_all_models"]
+
+
+def load_all_models() -> None:
+    """Import every model module so ``Base.metadata`` describes the full schema.
+
+    Only migrations and schema creation need the standalone collection and
+    result tables; everything else imports the model it uses.
+    """
+    from . import query_collection, result  # noqa: F401
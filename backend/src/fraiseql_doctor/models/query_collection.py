@@ -17,7 +17,7 @@ class QueryCollection(Base, TimestampMixin):
     pk_query_collection: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     description: Mapped[str | None] = mapped_column(Text)
-    tags: Mapped[dict[str, Any]] = mapped_column(default=dict)
+    tags: Mapped[list[str]] = mapped_column(default=list)
     created_by: Mapped[str] = mapped_column(String(255), nullable=False)
     collection_metadata: Mapped[dict[str, Any]] = mapped_column(default=dict)
     is_active: Mapped[bool] = mapped_column(default=True)
@@ -32,7 +32,8 @@ class QueryCollection(Base, TimestampMixin):
             pk_query_collection=data.get("pk_query_collection"),
             name=data["name"],
             description=data.get("description"),
-            tags=data.get("tags", {}),
+            # list() also reads rows stored in the old {tag: true} layout
+            tags=list(data.get("tags") or []),
             created_by=data["created_by"],
             collection_metadata=data.get("collection_metadata", {}),
             is_active=data.get("is_active", True),
@@ -5,6 +5,11 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# Validator constants, built once at import instead of on every validation
+_URL_SCHEMES = ("http://", "https://")
+_AUTH_TYPES = frozenset(("none", "bearer", "basic", "api_key", "oauth2"))
+_AUTH_TYPE_ERROR = "Auth type must be one of: none, bearer, basic, api_key, oauth2"
+
 
 class EndpointCreate(BaseModel):
     """Schema for creating a new endpoint."""
@@ -37,7 +42,7 @@ class EndpointCreate(BaseModel):
 
         # Basic URL validation
         v = v.strip()
-        if not (v.startswith("http://") or v.startswith("https://")):
+        if not v.startswith(_URL_SCHEMES):
             raise ValueError("URL must start with http:// or https://")
 
         return v
@@ -46,9 +51,8 @@ class EndpointCreate(BaseModel):
     @classmethod
     def validate_auth_type(cls, v):
         """Validate authentication type."""
-        allowed_types = ["none", "bearer", "basic", "api_key", "oauth2"]
-        if v not in allowed_types:
-            raise ValueError(f'Auth type must be one of: {", ".join(allowed_types)}')
+        if v not in _AUTH_TYPES:
+            raise ValueError(_AUTH_TYPE_ERROR)
         return v
 
 
@@ -82,7 +86,7 @@ class EndpointUpdate(BaseModel):
                 raise ValueError("URL cannot be empty")
 
             v = v.strip()
-            if not (v.startswith("http://") or v.startswith("https://")):
+            if not v.startswith(_URL_SCHEMES):
                 raise ValueError("URL must start with http:// or https://")
 
             return v
@@ -92,10 +96,8 @@ class EndpointUpdate(BaseModel):
     @classmethod
     def validate_auth_type(cls, v):
         """Validate authentication type."""
-        if v is not None:
-            allowed_types = ["none", "bearer", "basic", "api_key", "oauth2"]
-            if v not in allowed_types:
-                raise ValueError(f'Auth type must be one of: {", ".join(allowed_types)}')
+        if v is not None and v not in _AUTH_TYPES:
+            raise ValueError(_AUTH_TYPE_ERROR)
         return v
 
 
@@ -35,7 +35,8 @@ class QueryCreate(BaseModel):
         if not v or not v.strip():
             raise ValueError("Query text cannot be empty")
         # Basic GraphQL validation - should contain 'query' or 'mutation'
-        if "query" not in v.lower() and "mutation" not in v.lower():
+        lowered = v.lower()
+        if "query" not in lowered and "mutation" not in lowered:
             raise ValueError("Query text must contain a valid GraphQL operation")
         return v.strip()
 
@@ -73,7 +74,8 @@ class QueryUpdate(BaseModel):
         if v is not None:
             if not v or not v.strip():
                 raise ValueError("Query text cannot be empty")
-            if "query" not in v.lower() and "mutation" not in v.lower():
+            lowered = v.lower()
+            if "query" not in lowered and "mutation" not in lowered:
                 raise ValueError("Query text must contain a valid GraphQL operation")
             return v.strip()
         return v
@@ -0,0 +1,161 @@
+"""GraphQL Query Batching.
+
+Merges several GraphQL queries bound for the same endpoint into one
+operation, so they cost a single HTTP round trip, and splits the response
+back into one response per query.
+
+Each query gets a ``q{index}_`` namespace: its top-level fields are aliased
+``q{index}_<response key>`` and its variables and fragments are renamed the
+same way, so the merged selections can't collide.
+
+Merging needs graphql-core, which is imported on first use. Without it,
+``merge_queries`` returns None and callers send the queries one by one.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+
+@lru_cache(maxsize=1)
+def _graphql():
+    """Import graphql-core, or return None if it is not installed."""
+    try:
+        import graphql
+    except ImportError:
+        return None
+    return graphql
+
+
+@dataclass
+class MergedQuery:
+    """Several queries merged into a single GraphQL operation."""
+
+    query: str
+    variables: dict[str, Any]
+    # Per merged query: alias in the merged operation -> its original response key
+    aliases: list[dict[str, str]]
+
+
+def _replace(node, **changes):
+    """Return a copy of AST ``node`` with ``changes`` applied (nodes may be frozen)."""
+    return type(node)(**{**{key: getattr(node, key) for key in node.keys}, **changes})
+
+
+def _namespace(graphql, document, prefix: str):
+    """Return ``document`` with its variable and fragment names prefixed."""
+
+    def rename(node, *_):
+        return _replace(node, name=graphql.NameNode(value=prefix + node.name.value))
+
+    visitor = graphql.Visitor()
+    visitor.enter_variable = rename
+    visitor.enter_fragment_spread = rename
+    visitor.enter_fragment_definition = rename
+    return graphql.visit(document, visitor)
+
+
+def merge_queries(queries: list[tuple[str, Optional[dict[str, Any]]]]) -> Optional[MergedQuery]:
+    """Merge ``(query_text, variables)`` pairs into one query operation.
+
+    Args:
+    ----
+        queries: Query documents with their variables
+
+    Returns:
+    -------
+        The merged query, or None when graphql-core isn't installed or a
+        document can't be merged: it doesn't parse, holds anything but a
+        single query operation and its fragments, has operation directives or
+        selects fragments at the top level.
+    """
+    graphql = _graphql()
+    if graphql is None:
+        return None
+
+    variable_definitions = []
+    selections = []
+    fragments = []
+    merged_variables: dict[str, Any] = {}
+    aliases = []
+
+    for index, (query_text, variables) in enumerate(queries):
+        prefix = f"q{index}_"
+        try:
+            document = graphql.parse(query_text, no_location=True)
+        except (graphql.GraphQLError, TypeError):
+            return None
+        document = _namespace(graphql, document, prefix)
+
+        operations = []
+        for definition in document.definitions:
+            if isinstance(definition, graphql.OperationDefinitionNode):
+                operations.append(definition)
+            elif isinstance(definition, graphql.FragmentDefinitionNode):
+                fragments.append(definition)
+            else:
+                return None
+
+        if len(operations) != 1:
+            return None
+        operation = operations[0]
+        if operation.operation != graphql.OperationType.QUERY or operation.directives:
+            return None
+
+        query_aliases = {}
+        for selection in operation.selection_set.selections:
+            if not isinstance(selection, graphql.FieldNode):
+                return None
+            response_key = (selection.alias or selection.name).value
+            alias = prefix + response_key
+            selections.append(_replace(selection, alias=graphql.NameNode(value=alias)))
+            query_aliases[alias] = response_key
+        aliases.append(query_aliases)
+
+        variable_definitions.extend(operation.variable_definitions or ())
+        merged_variables.update({prefix + name: value for name, value in (variables or {}).items()})
+
+    operation = graphql.OperationDefinitionNode(
+        operation=graphql.OperationType.QUERY,
+        name=graphql.NameNode(value="Batch"),
+        variable_definitions=tuple(variable_definitions),
+        directives=(),
+        selection_set=graphql.SelectionSetNode(selections=tuple(selections)),
+    )
+    document = graphql.DocumentNode(definitions=(operation, *fragments))
+    return MergedQuery(graphql.print_ast(document), merged_variables, aliases)
+
+
+def split_response(merged: MergedQuery, response: dict[str, Any]) -> Optional[list[dict[str, Any]]]:
+    """Split the response to a merged query into one response per query.
+
+    Errors are assigned to a query by the alias their path starts with, and
+    their path is rewritten to the query's own response key.
+
+    Returns:
+    -------
+        The responses in merge order, or None when the response can't be
+        attributed: it has no data or an error without a field path (such as
+        a validation error for the whole document).
+    """
+    data = response.get("data")
+    if not isinstance(data, dict):
+        return None
+
+    owner = {alias: index for index, aliases in enumerate(merged.aliases) for alias in aliases}
+
+    errors: list[list[dict[str, Any]]] = [[] for _ in merged.aliases]
+    for error in response.get("errors") or ():
+        path = error.get("path")
+        if not path or path[0] not in owner:
+            return None
+        index = owner[path[0]]
+        errors[index].append({**error, "path": [merged.aliases[index][path[0]], *path[1:]]})
+
+    responses = []
+    for aliases, query_errors in zip(merged.aliases, errors):
+        split = {"data": {key: data.get(alias) for alias, key in aliases.items()}}
+        if query_errors:
+            split["errors"] = query_errors
+        responses.append(split)
+    return responses
@@ -3,6 +3,7 @@
 High-performance async GraphQL client with comprehensive error handling,
 authentication support, and connection management.
 """
+
 import asyncio
 import base64
 import time
@@ -12,6 +13,7 @@ import aiohttp
 from pydantic import BaseModel
 
 from fraiseql_doctor.models.endpoint import Endpoint
+from fraiseql_doctor.utils.serialization import loads
 
 
 class GraphQLResponse(BaseModel):
@@ -22,6 +24,8 @@ class GraphQLResponse(BaseModel):
     response_time_ms: int
     complexity_score: Optional[int] = None
     cached: bool = False
+    # Size of the response body as received
+    response_size_bytes: Optional[int] = None
 
 
 class GraphQLClientError(Exception):
@@ -185,7 +189,8 @@ class FraiseQLClient:
                         )
 
                     # Parse response
-                    response_data = await response.json()
+                    body = await response.read()
+                    response_data = loads(body)
 
                     # Extract complexity score from extensions
                     complexity_score = None
@@ -213,6 +218,7 @@ class FraiseQLClient:
                         response_time_ms=response_time_ms,
                         complexity_score=complexity_score,
                         cached=cached,
+                        response_size_bytes=len(body),
                     )
 
             finally:
@@ -0,0 +1,54 @@
+"""Size- and time-bounded in-memory cache.
+
+``TTLCache`` is a mutable mapping whose entries expire a fixed number of
+seconds after they were stored and which keeps at most ``maxsize`` entries,
+evicting the least recently used one first. Expired entries are dropped when
+they are looked up; until then they still count towards ``len()`` and show up
+when iterating.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, MutableMapping
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(MutableMapping[K, V], Generic[K, V]):
+    """LRU mapping whose entries expire ``ttl`` seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (value, monotonic expiry time), least recently used first
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def __getitem__(self, key: K) -> V:
+        value, expires_at = self._entries[key]
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            raise KeyError(key)
+        self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __delitem__(self, key: K) -> None:
+        del self._entries[key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
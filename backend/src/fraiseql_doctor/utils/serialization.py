@@ -0,0 +1,123 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is installed (``pip install fraiseql-doctor[fast]``) and
+falls back to the standard library otherwise. Values JSON can't represent natively (UUIDs, datetimes, enums...)
+are serialized with ``str`` in the fallback path; orjson handles UUIDs and
+datetimes itself and uses ``str`` for anything else.
+
+Decoding errors are always raised as ``json.JSONDecodeError`` (orjson's
+error type subclasses it), so callers can catch the stdlib exception.
+"""
+
+import io
+import json
+from typing import Any, BinaryIO, TextIO, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode()
+
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes, as orjson writes them."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+
+
+def canonical_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact JSON bytes with sorted keys.
+
+    Equal values always produce equal bytes, so the result can be used as (part
+    of) a cache key.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+
+def dumps_head(obj: Any, limit: int, *, indent: bool = False) -> tuple[str, bool]:
+    """Serialize ``obj`` but keep at most ``limit`` characters of the result.
+
+    Returns the (possibly cut) text and whether anything was dropped. The
+    stdlib fallback stops encoding once the limit is reached; with orjson the
+    whole document is encoded but only the kept prefix is decoded.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        encoded = orjson.dumps(obj, default=str, option=option)
+        if len(encoded) <= limit:
+            return encoded.decode(), False
+        # A UTF-8 character is at most 4 bytes, so this prefix always covers
+        # ``limit`` characters; a sequence split at the end is dropped.
+        text = encoded[: limit * 4].decode(errors="ignore")
+        return text[:limit], len(text) > limit or limit * 4 < len(encoded)
+
+    encoder = json.JSONEncoder(indent=2 if indent else None, default=str)
+    chunks = []
+    size = 0
+    for chunk in encoder.iterencode(obj):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            return "".join(chunks)[:limit], True
+    return "".join(chunks), False
+
+
+def dump(obj: Any, fp: TextIO, *, indent: bool = False) -> None:
+    """Write ``obj`` as JSON plus a trailing newline to the text stream ``fp``.
+
+    The stdlib fallback streams the encoded chunks instead of building the
+    whole document first.
+    """
+    if orjson is not None:
+        fp.write(dumps(obj, indent=indent))
+    else:
+        json.dump(obj, fp, indent=2 if indent else None, default=str)
+    fp.write("\n")
+
+
+def dump_bytes(obj: Any, fp: BinaryIO, *, indent: bool = False) -> None:
+    """Write ``obj`` as UTF-8 JSON plus a trailing newline to the binary stream ``fp``.
+
+    orjson's output is already UTF-8 and is written as is, skipping a decode
+    and re-encode through a text stream; the stdlib fallback streams through
+    a UTF-8 text wrapper.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        fp.write(orjson.dumps(obj, default=str, option=option))
+        return
+
+    stream = io.TextIOWrapper(fp, encoding="utf-8")
+    try:
+        dump(obj, stream, indent=indent)
+    finally:
+        # Flushes the wrapper without closing the caller's stream
+        stream.detach()
@@ -22,6 +22,17 @@ def temp_dir():
         yield Path(td)
 
 
+@pytest.fixture(autouse=True)
+def validation_cache(tmp_path):
+    """Keep the persistent validation cache out of the user's cache directory."""
+    from fraiseql_doctor.cli.commands import query as query_module
+    from fraiseql_doctor.cli.utils.validation_cache import ValidationCache
+
+    cache = ValidationCache(tmp_path / "validation.db")
+    with patch.object(query_module, "_validation_cache", cache):
+        yield cache
+
+
 class TestMainCLI:
     """Test main CLI functionality."""
 
@@ -45,6 +56,18 @@ class TestMainCLI:
         assert "FraiseQL Doctor" in result.output
         assert "0.1.0" in result.output
 
+    def test_version_does_not_import_command_modules(self, modules_loaded_by):
+        """Test --version leaves command group modules unloaded."""
+        script = (
+            "from fraiseql_doctor.cli.main import app\n"
+            "try:\n"
+            "    app(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+        )
+
+        assert modules_loaded_by(script, ["fraiseql_doctor.cli.commands"]) == []
+
 
 class TestQueryCommands:
     """Test query management commands."""
@@ -84,6 +107,29 @@ class TestQueryCommands:
         # In real implementation, this would validate and fail
         assert result.exit_code in [0, 1]  # Allow both for mock
 
+    def test_interactive_input_reopens_editor_on_syntax_error(self):
+        """Test a query with a syntax error is sent back to the editor."""
+        from fraiseql_doctor.cli.commands import query as query_module
+
+        edits = iter(["query { user { id }", "query { user { id } }"])
+        stdin = Mock()
+        stdin.isatty.return_value = True
+
+        with (
+            patch.object(query_module.sys, "stdin", stdin),
+            patch.object(query_module.click, "edit", side_effect=lambda *a, **k: next(edits)),
+            patch.object(query_module.typer, "confirm", return_value=True) as confirm,
+            patch.object(
+                query_module.GraphQLFileHandler,
+                "validate_query_syntax",
+                side_effect=[ValueError("GraphQL syntax error"), True],
+            ),
+        ):
+            query_text = query_module._interactive_query_input(validate=True)
+
+        assert query_text == "query { user { id } }"
+        confirm.assert_called_once()
+
     def test_query_create_with_file(self, cli_runner, temp_dir):
         """Test query creation with file input."""
         # Create test GraphQL file
@@ -117,6 +163,190 @@ class TestQueryCommands:
             # (actual DB operations are mocked out)
             assert "test-query" in result.output
 
+    @patch("fraiseql_doctor.cli.commands.query.get_query_manager")
+    def test_query_create_skips_validation_for_unchanged_file(
+        self, mock_manager, cli_runner, temp_dir, validation_cache
+    ):
+        """Test re-creating a query from an unchanged file reuses the cached analysis."""
+        query_file = temp_dir / "users.graphql"
+        query_file.write_text("query Users { users { id } }")
+        mock_instance = Mock()
+        mock_instance.add_query.return_value.query_metadata = {"complexity_score": 3.0}
+        mock_manager.return_value = mock_instance
+
+        for _ in range(2):
+            result = cli_runner.invoke(
+                app, ["query", "create", "--name", "users", "--file", str(query_file)]
+            )
+            assert result.exit_code == 0
+
+        first, second = mock_instance.add_query.call_args_list
+        assert first.kwargs["validate"] is True
+        assert second.kwargs["validate"] is False
+        # The cached analysis goes into the stored query rather than being patched on afterwards
+        _, schema = second.args
+        assert schema.expected_complexity_score == 3
+        assert schema.query_metadata["complexity_score"] == 3.0
+        assert schema.query_metadata["last_validated"] is not None
+        assert "Complexity Score: 3.00" in result.output
+
+    def test_query_show_rejects_malformed_id(self, cli_runner):
+        """Test a malformed --id is rejected while parsing options."""
+        result = cli_runner.invoke(app, ["query", "show", "--id", "not-a-uuid"])
+
+        assert result.exit_code == 2
+        assert "--id" in result.output
+
+    def test_query_manager_is_shared(self):
+        """Test commands in one process reuse a single query manager."""
+        from fraiseql_doctor.cli.commands.query import get_query_manager
+
+        assert get_query_manager() is get_query_manager()
+
+    @patch("fraiseql_doctor.cli.commands.query.get_query_manager")
+    def test_query_list_filters(self, mock_manager, cli_runner):
+        """Test --status/--priority/--tag values are resolved into the search filter."""
+        mock_instance = Mock()
+        mock_instance.search_queries.return_value = []
+        mock_manager.return_value = mock_instance
+
+        result = cli_runner.invoke(
+            app, ["query", "list", "--status", "active", "--priority", "high"]
+        )
+
+        assert result.exit_code == 0
+        filter_params = mock_instance.search_queries.call_args.args[0]
+        assert filter_params.status == "active"
+        assert filter_params.priority == "high"
+
+        assert filter_params.tags is None
+
+        result = cli_runner.invoke(app, ["query", "list", "--tag", "users", "--tag", "admin"])
+
+        assert result.exit_code == 0
+        tags = mock_instance.search_queries.call_args.args[0].tags
+        assert tags == frozenset({"users", "admin"})
+
+        result = cli_runner.invoke(app, ["query", "list", "--tag", "users", "--tag", "admin"])
+
+        assert mock_instance.search_queries.call_args.args[0].tags is tags
+        mock_instance.search_queries.reset_mock()
+
+        result = cli_runner.invoke(app, ["query", "list", "--status", "bogus"])
+
+        assert result.exit_code == 1
+        mock_instance.search_queries.assert_not_called()
+
+    def test_query_list_json_output(self, cli_runner):
+        """Test JSON list output is a single well-formed array."""
+        import json
+
+        result = cli_runner.invoke(app, ["query", "list", "--format", "json"])
+
+        assert result.exit_code == 0
+        document, _, footer = result.output.partition("\n]\n")
+        queries = json.loads(document + "\n]")
+        assert [q["name"] for q in queries] == ["Sample Query 1", "Sample Query 2"]
+        assert "Showing 2 queries" in footer
+
+    def test_query_list_csv_output(self, cli_runner):
+        """Test CSV list output has a header and one row per query."""
+        import csv
+        import io
+
+        result = cli_runner.invoke(app, ["query", "list", "--format", "csv"])
+
+        assert result.exit_code == 0
+        rows = list(csv.reader(io.StringIO(result.output)))
+        assert rows[0] == ["ID", "Name", "Description", "Status", "Created", "Tags"]
+        assert [row[1] for row in rows[1:3]] == ["Sample Query 1", "Sample Query 2"]
+
+    @patch("fraiseql_doctor.cli.commands.query.get_query_manager")
+    def test_query_show_by_name_uses_point_lookup(self, mock_manager, cli_runner):
+        """Test --name resolves the query with a single by-name lookup."""
+        mock_instance = Mock()
+        mock_instance.get_query_by_name.return_value.query_text = "query { user { id } }"
+        mock_manager.return_value = mock_instance
+
+        result = cli_runner.invoke(app, ["query", "show", "--name", "users", "--format", "raw"])
+
+        assert result.exit_code == 0
+        assert "query { user { id } }" in result.output
+        mock_instance.get_query_by_name.assert_called_once_with("users")
+        mock_instance.search_queries.assert_not_called()
+
+    def test_query_validate_reuses_analysis(self, cli_runner):
+        """Test repeated validation of the same query text hits the analysis cache."""
+        from fraiseql_doctor.cli.commands.query import _analyze_cached
+
+        _analyze_cached.cache_clear()
+        query_id = "12345678-1234-5678-1234-567812345678"
+
+        for _ in range(2):
+            result = cli_runner.invoke(app, ["query", "validate", "--id", query_id])
+            assert result.exit_code == 0
+            assert "is valid" in result.output
+
+        assert _analyze_cached.cache_info().hits == 1
+
+    def test_query_validate_collection_reports_errors(self, cli_runner):
+        """Test collection validation counts valid and invalid queries."""
+        from fraiseql_doctor.cli.commands import query as query_module
+
+        good = Mock(pk_query="1", query_text="query { ok }")
+        good.name = "good"
+        bad = Mock(pk_query="2", query_text="query { broken")
+        bad.name = "bad"
+        manager = Mock()
+        manager.search_queries.return_value = [good, bad, good]
+
+        def analyze(text):
+            if "broken" in text:
+                raise ValueError("unbalanced braces")
+
+        analyzer = Mock()
+        analyzer.analyze_query.side_effect = analyze
+        query_module._analyze_cached.cache_clear()
+
+        with (
+            patch.object(query_module, "get_query_manager", return_value=manager),
+            patch.object(query_module, "_ANALYZER", analyzer),
+        ):
+            result = cli_runner.invoke(
+                app,
+                ["query", "validate", "--collection", "12345678-1234-5678-1234-567812345678"],
+            )
+        query_module._analyze_cached.cache_clear()
+
+        assert result.exit_code == 0
+        assert "Total queries: 3" in result.output
+        assert "Valid: 2" in result.output
+        assert "Invalid: 1" in result.output
+        assert "bad: unbalanced braces" in result.output
+        assert analyzer.analyze_query.call_count == 2
+
+    def test_query_validate_collection_fetches_every_page(self, cli_runner):
+        """Test collection validation pages through queries instead of stopping at one fetch."""
+        from fraiseql_doctor.cli.commands import query as query_module
+
+        queries = [Mock(pk_query=str(i), query_text="query { ok }") for i in range(5)]
+        manager = Mock()
+        manager.search_queries.side_effect = [queries[:2], queries[2:4], queries[4:]]
+
+        with (
+            patch.object(query_module, "get_query_manager", return_value=manager),
+            patch.object(query_module, "_COLLECTION_PAGE_SIZE", 2),
+        ):
+            result = cli_runner.invoke(
+                app,
+                ["query", "validate", "--collection", "12345678-1234-5678-1234-567812345678"],
+            )
+
+        assert result.exit_code == 0
+        assert "Total queries: 5" in result.output
+        offsets = [call.args[0].offset for call in manager.search_queries.call_args_list]
+        assert offsets == [0, 2, 4]
+
 
 class TestEndpointCommands:
     """Test endpoint management commands."""
@@ -308,6 +538,189 @@ class TestFileHandlers:
         with pytest.raises(ValueError, match="Invalid file extension"):
             GraphQLFileHandler.parse_graphql_file(invalid_file)
 
+    def test_graphql_file_handler_rereads_modified_file(self, temp_dir):
+        """Test cached file contents are refreshed when the file changes."""
+        from fraiseql_doctor.cli.utils.file_handlers import GraphQLFileHandler
+
+        query_file = temp_dir / "cached.graphql"
+        query_file.write_text("query First { user { name } }")
+        assert "First" in GraphQLFileHandler.parse_graphql_file(query_file)
+        assert "First" in GraphQLFileHandler.parse_graphql_file(query_file)
+
+        query_file.write_text("query SecondQuery { user { name email } }")
+        assert "SecondQuery" in GraphQLFileHandler.parse_graphql_file(query_file)
+
+    def test_graphql_file_ast_is_cached_until_file_changes(self, temp_dir):
+        """Test an unchanged file yields the same document without re-parsing."""
+        from fraiseql_doctor.cli.utils.file_handlers import GraphQLFileHandler
+
+        query_file = temp_dir / "users.graphql"
+        query_file.write_text("query Users { users { id } }")
+
+        document = GraphQLFileHandler.parse_graphql_file_ast(query_file)
+        assert GraphQLFileHandler.parse_graphql_file_ast(query_file) is document
+        assert GraphQLFileHandler.extract_query_info(document)["operations"][0]["name"] == "Users"
+
+        query_file.write_text("query UsersWithEmail { users { id email } }")
+        assert GraphQLFileHandler.parse_graphql_file_ast(query_file) is not document
+
+    def test_extract_query_info_operations_and_fragments(self):
+        """Test query info lists every operation and fragment definition."""
+        from fraiseql_doctor.cli.utils.file_handlers import GraphQLFileHandler
+
+        info = GraphQLFileHandler.extract_query_info(
+            "query Users { users { ...UserFields } count } "
+            "fragment UserFields on User { id name } "
+            "mutation { logout }"
+        )
+
+        assert info["operations"] == [
+            {"operation": "query", "name": "Users", "selection_count": 2},
+            {"operation": "mutation", "name": None, "selection_count": 1},
+        ]
+        assert info["fragments"] == [{"name": "UserFields", "type": "User"}]
+        assert (info["operation_count"], info["fragment_count"]) == (2, 1)
+
+    def test_query_helpers_share_one_parse(self):
+        """Test validation, info extraction and variable checks reuse one AST."""
+        from fraiseql_doctor.cli.utils import file_handlers
+
+        query = "query GetUser($id: ID!) { user(id: $id) { name } }"
+        file_handlers._cached_parse.cache_clear()
+
+        assert file_handlers.GraphQLFileHandler.validate_query_syntax(query)
+        info = file_handlers.GraphQLFileHandler.extract_query_info(query)
+        errors = file_handlers.VariableFileHandler.validate_variables({"id": "1"}, query)
+
+        assert info["operation_count"] == 1
+        assert errors == []
+        assert file_handlers._cached_parse.cache_info().misses == 1
+
+    def test_validate_variables_accepts_parsed_document(self, temp_dir):
+        """Test variable checks run on a pre-parsed document without re-parsing."""
+        from fraiseql_doctor.cli.utils import file_handlers
+
+        query_file = temp_dir / "user.graphql"
+        query_file.write_text("query GetUser($id: ID!, $full: Boolean) { user(id: $id) { name } }")
+        document = file_handlers.GraphQLFileHandler.parse_graphql_file_ast(query_file)
+        misses = file_handlers._cached_parse.cache_info().misses
+
+        errors = file_handlers.VariableFileHandler.validate_variables({"extra": 1}, document)
+
+        assert errors == ["Missing required variables: id", "Unknown variables: extra"]
+        assert file_handlers._cached_parse.cache_info().misses == misses
+
+    def test_export_queries_yaml_round_trip(self, temp_dir):
+        """Test YAML export writes non-YAML values as strings and imports back."""
+        from uuid import UUID
+
+        from fraiseql_doctor.cli.utils.file_handlers import ExportHandler
+
+        query_id = UUID("12345678-1234-5678-1234-567812345678")
+        queries = [{"pk_query": query_id, "name": "users", "tags": ["a", "b"]}]
+
+        ExportHandler.export_queries(queries, temp_dir / "export", format="yaml")
+        imported = ExportHandler.import_queries(temp_dir / "export.yaml")
+
+        assert imported == [{"pk_query": str(query_id), "name": "users", "tags": ["a", "b"]}]
+
+    def test_export_queries_csv(self, temp_dir):
+        """Test CSV export orders fields as first seen and encodes nested or missing values."""
+        import csv
+        import json
+
+        from fraiseql_doctor.cli.utils.file_handlers import ExportHandler
+
+        queries = [
+            {"name": "users", "tags": ["a", "b"], "description": None},
+            {"name": "posts", "variables": {"limit": 10}},
+        ]
+
+        ExportHandler.export_queries(queries, temp_dir / "export", format="csv")
+
+        with (temp_dir / "export.csv").open(newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["name", "tags", "description", "variables"]
+        assert rows[1][0] == "users"
+        assert json.loads(rows[1][1]) == ["a", "b"]
+        assert rows[1][2:] == ["", ""]
+        assert rows[2][:3] == ["posts", "", ""]
+        assert json.loads(rows[2][3]) == {"limit": 10}
+
+    def test_export_queries_csv_encodes_container_subclasses(self, temp_dir):
+        """Test dict and list subclasses are JSON-encoded like plain containers."""
+        import csv
+        import json
+        from collections import OrderedDict, defaultdict
+
+        from fraiseql_doctor.cli.utils.file_handlers import ExportHandler
+
+        tags = defaultdict(list, {"team": ["api"]})
+        queries = [{"name": "users", "variables": OrderedDict(limit=10), "tags": tags}]
+
+        ExportHandler.export_queries(queries, temp_dir / "export", format="csv")
+
+        with (temp_dir / "export.csv").open(newline="") as f:
+            rows = list(csv.reader(f))
+        assert json.loads(rows[1][1]) == {"limit": 10}
+        assert json.loads(rows[1][2]) == {"team": ["api"]}
+
+    def test_export_queries_csv_empty(self, temp_dir):
+        """Test exporting no queries to CSV leaves an empty file."""
+        from fraiseql_doctor.cli.utils.file_handlers import ExportHandler
+
+        ExportHandler.export_queries([], temp_dir / "export", format="csv")
+
+        assert (temp_dir / "export.csv").read_text() == ""
+
+    def test_failed_export_keeps_the_existing_file(self, temp_dir):
+        """Test an export that fails while serializing leaves the previous export intact."""
+        from fraiseql_doctor.cli.utils import file_handlers
+
+        output = temp_dir / "export.json"
+        output.write_text('[{"name": "users"}]')
+
+        def dump_bytes(queries, f, indent):
+            f.write(b'[{"name": ')
+            raise TypeError("Type is not JSON serializable")
+
+        with (
+            patch.object(file_handlers, "dump_bytes", dump_bytes),
+            pytest.raises(TypeError),
+        ):
+            file_handlers.ExportHandler.export_queries([{"name": "posts"}], output)
+
+        assert output.read_text() == '[{"name": "users"}]'
+        assert [path.name for path in temp_dir.iterdir()] == ["export.json"]
+
+    def test_utils_defer_heavy_imports(self, modules_loaded_by):
+        """Test importing the CLI helpers leaves YAML, graphql-core and the models unloaded."""
+        script = (
+            "import fraiseql_doctor.cli.utils.file_handlers\n"
+            "import fraiseql_doctor.cli.utils.formatters\n"
+        )
+
+        assert modules_loaded_by(script, ["yaml", "graphql", "fraiseql_doctor.models"]) == []
+
+    def test_import_queries_csv_decodes_json_cells(self, temp_dir):
+        """Test CSV import decodes JSON-looking cells and keeps everything else as text."""
+        from fraiseql_doctor.cli.utils.file_handlers import ExportHandler
+
+        csv_file = temp_dir / "queries.csv"
+        csv_file.write_text(
+            'name,tags,variables,note\nusers,"[""a""]"," {""limit"": 10}",[draft\nposts,,,\n'
+        )
+
+        users, posts = ExportHandler.import_queries(csv_file)
+
+        assert users == {
+            "name": "users",
+            "tags": ["a"],
+            "variables": {"limit": 10},
+            "note": "[draft",
+        }
+        assert posts == {"name": "posts", "tags": "", "variables": "", "note": ""}
+
     def test_variable_file_handler(self, temp_dir):
         """Test variable file loading."""
         from fraiseql_doctor.cli.utils.file_handlers import VariableFileHandler
@@ -353,6 +766,27 @@ class TestRichFormatting:
             task = progress.add_task("Processing...", total=10)
             assert task is not None
 
+    def test_format_health_summary_status_cells(self):
+        """Test health rows render their status, falling back to UNKNOWN."""
+        from io import StringIO
+
+        from fraiseql_doctor.cli.utils.formatters import format_health_summary
+        from rich.console import Console
+
+        table = format_health_summary(
+            {
+                "api": {"status": "healthy", "response_time_ms": 12},
+                "auth": {"status": "healthy", "response_time_ms": 8},
+                "legacy": {"status": "bogus"},
+            }
+        )
+        console = Console(file=StringIO(), width=120)
+        console.print(table)
+
+        output = console.file.getvalue()
+        assert output.count("HEALTHY") == 2
+        assert "UNKNOWN" in output
+
 
 @pytest.mark.integration()
 class TestCLIIntegration:
@@ -1,5 +1,9 @@
 """Test configuration and shared fixtures."""
 
+import subprocess
+import sys
+from collections.abc import Iterable
+
 import pytest
 
 # Import all database fixtures
@@ -13,3 +17,32 @@ pytestmark = pytest.mark.asyncio
 def ensure_test_database(setup_test_database):
     """Automatically ensure test database is ready before running tests."""
     return setup_test_database
+
+
+def _modules_loaded_by(code: str, modules: Iterable[str]) -> list[str]:
+    """Run ``code`` in a fresh interpreter; return which of ``modules`` (or submodules) it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # "import time: <self [us]> | <cumulative> | <indented module name>"
+    imported = {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert imported, "python -X importtime produced no import trace"
+
+    return sorted(
+        name
+        for name in imported
+        if any(name == module or name.startswith(f"{module}.") for module in modules)
+    )
+
+
+@pytest.fixture(scope="session")
+def modules_loaded_by():
+    """Check which modules a snippet imports, in a fresh interpreter (see ``_modules_loaded_by``)."""
+    return _modules_loaded_by
@@ -187,7 +187,7 @@ def created_collection(real_query_collection_manager, sample_collection_data):
 @pytest.fixture()
 async def created_collection_with_queries(real_query_collection_manager, sample_queries):
     """Create a real collection with queries for testing."""
-    from src.fraiseql_doctor.core.database.schemas import QueryCollectionCreate, QueryCreate
+    from src.fraiseql_doctor.schemas.query import QueryCollectionCreate, QueryCreate
 
     # Configure analyzer to not fail
     real_query_collection_manager.complexity_analyzer.set_custom_score(5.0)
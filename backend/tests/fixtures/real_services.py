@@ -140,7 +140,7 @@ class TestComplexityAnalyzer(QueryComplexityAnalyzer):
         self.should_fail = False
         self.custom_score = None
 
-    async def analyze_query(self, query: str, variables: Optional[dict[str, Any]] = None):
+    def analyze_query(self, query: str, variables: Optional[dict[str, Any]] = None):
         """Analyze query complexity with predictable test results."""
         if self.should_fail:
             if "invalid" in query.lower():
@@ -17,7 +17,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
-from fraiseql_doctor.core.database.schemas import QueryCollectionCreate, QueryCreate
+
 from fraiseql_doctor.core.execution_manager import (
     BatchMode,
     ExecutionConfig,
@@ -33,6 +33,7 @@ from fraiseql_doctor.core.result_storage import (
     StorageBackend,
     StorageConfig,
 )
+from fraiseql_doctor.schemas.query import QueryCollectionCreate, QueryCreate
 
 
 @pytest.fixture()
@@ -140,7 +141,7 @@ class TestRealisticWorkloadStress:
         collection_manager = realistic_test_environment["collection_manager"]
 
         # Mock successful analysis
-        collection_manager.complexity_analyzer.analyze_query = AsyncMock(
+        collection_manager.complexity_analyzer.analyze_query = MagicMock(
             return_value=MagicMock(
                 complexity_score=5.0, estimated_execution_time=0.1, field_count=10, depth=3
             )
@@ -407,7 +408,7 @@ class TestIntegrationStabilityUnderLoad:
         storage_manager = realistic_test_environment["storage_manager"]
 
         # Setup mock data
-        collection_manager.complexity_analyzer.analyze_query = AsyncMock(
+        collection_manager.complexity_analyzer.analyze_query = MagicMock(
             return_value=MagicMock(
                 complexity_score=2.0, estimated_execution_time=0.1, field_count=5, depth=2
             )
@@ -530,7 +531,7 @@ class TestPerformanceRegressionDetection:
         execution_manager = realistic_test_environment["execution_manager"]
 
         # Benchmark: Collection creation
-        collection_manager.complexity_analyzer.analyze_query = AsyncMock(
+        collection_manager.complexity_analyzer.analyze_query = MagicMock(
             return_value=MagicMock(
                 complexity_score=1.0, estimated_execution_time=0.1, field_count=1, depth=1
             )
@@ -648,7 +649,7 @@ class TestEndToEndReverseScenarios:
                         # Quick collection operations
                         components[
                             "collection_manager"
-                        ].complexity_analyzer.analyze_query = AsyncMock(
+                        ].complexity_analyzer.analyze_query = MagicMock(
                             return_value=MagicMock(
                                 complexity_score=1.0,
                                 estimated_execution_time=0.01,
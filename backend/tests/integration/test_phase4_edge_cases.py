@@ -19,7 +19,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
-from fraiseql_doctor.core.database.schemas import QueryCollectionCreate, QueryCreate
+
 from fraiseql_doctor.core.query_collection import (
     QueryCollectionManager,
     QuerySearchFilter,
@@ -30,6 +30,7 @@ from fraiseql_doctor.core.result_storage import (
     StorageBackend,
     StorageConfig,
 )
+from fraiseql_doctor.schemas.query import QueryCollectionCreate, QueryCreate
 
 
 @pytest.fixture()
@@ -69,7 +70,7 @@ class TestUnicodeAndSpecialCharacters:
         ]
 
         collection_manager.get_collection_by_name = AsyncMock(return_value=None)
-        collection_manager.complexity_analyzer.analyze_query = AsyncMock(
+        collection_manager.complexity_analyzer.analyze_query = MagicMock(
             return_value=MagicMock(
                 complexity_score=1.0, estimated_execution_time=0.1, field_count=1, depth=1
             )
@@ -112,7 +113,7 @@ class TestUnicodeAndSpecialCharacters:
         ]
 
         collection_manager.get_collection_by_name = AsyncMock(return_value=None)
-        collection_manager.complexity_analyzer.analyze_query = AsyncMock(
+        collection_manager.complexity_analyzer.analyze_query = MagicMock(
             return_value=MagicMock(
                 complexity_score=1.0, estimated_execution_time=0.1, field_count=1, depth=1
             )
@@ -204,7 +205,7 @@ class TestFloatingPointPrecision:
             2.2250738585072014e-308,  # Near min positive float
         ]
 
-        collection_manager.complexity_analyzer.analyze_query = AsyncMock()
+        collection_manager.complexity_analyzer.analyze_query = MagicMock()
 
         for score in precision_test_cases:
             collection_manager.complexity_analyzer.analyze_query.return_value = MagicMock(
@@ -19,7 +19,7 @@ from uuid import uuid4
 
 import psutil
 import pytest
-from fraiseql_doctor.core.database.schemas import QueryCreate
+
 from fraiseql_doctor.core.execution_manager import (
     BatchMode,
     QueryExecutionManager,
@@ -30,6 +30,7 @@ from fraiseql_doctor.core.query_collection import (
     QueryStatus,
 )
 from fraiseql_doctor.core.result_storage import ResultStorageManager, StorageBackend, StorageConfig
+from fraiseql_doctor.schemas.query import QueryCreate
 from fraiseql_doctor.services.complexity import QueryComplexityAnalyzer
 
 
@@ -223,7 +224,7 @@ class TestCascadingFailures:
         collection_manager = QueryCollectionManager(test_db, complexity_analyzer)
 
         # Try to create collection with invalid queries
-        from fraiseql_doctor.core.database.schemas import QueryCollectionCreate
+        from fraiseql_doctor.schemas.query import QueryCollectionCreate
 
         # Test that invalid GraphQL syntax is caught during schema validation
         with pytest.raises(Exception) as exc_info:
@@ -492,7 +493,7 @@ class TestDeadlockPrevention:
                 await asyncio.sleep(0.01)
 
         async def operation_b():
-            from fraiseql_doctor.core.database.schemas import QueryCollectionUpdate
+            from fraiseql_doctor.schemas.query import QueryCollectionUpdate
 
             for i in range(10):
                 update_schema = QueryCollectionUpdate(name=f"Updated {i}")
@@ -19,7 +19,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
-from fraiseql_doctor.core.database.schemas import QueryCollectionCreate, QueryCreate
+
 from fraiseql_doctor.core.execution_manager import (
     BatchMode,
     ExecutionConfig,
@@ -37,6 +37,7 @@ from fraiseql_doctor.core.result_storage import (
     StorageBackend,
     StorageConfig,
 )
+from fraiseql_doctor.schemas.query import QueryCollectionCreate, QueryCreate
 
 
 @pytest.fixture()
@@ -374,7 +375,7 @@ class TestRaceConditions:
             mock_collection.id = collection_id
             collection_manager._cache[collection_id] = mock_collection
 
-            from fraiseql_doctor.core.database.schemas import QueryCollectionUpdate
+            from fraiseql_doctor.schemas.query import QueryCollectionUpdate
 
             update_schema = QueryCollectionUpdate(name=f"Updated {time.time()}")
 
@@ -650,7 +651,7 @@ class TestStateTransitions:
         collection_manager._query_cache[query_id] = mock_query
 
         # Try to transition from ERROR to ACTIVE (might be invalid in some contexts)
-        from fraiseql_doctor.core.database.schemas import QueryUpdate
+        from fraiseql_doctor.schemas.query import QueryUpdate
 
         update_schema = QueryUpdate(status="active")
 
@@ -12,12 +12,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
-from fraiseql_doctor.core.database.models import Endpoint
-from fraiseql_doctor.core.database.schemas import (
-    QueryCollectionCreate,
-    QueryCreate,
-    ResultSearchFilter,
-)
+
 from fraiseql_doctor.core.execution_manager import (
     BatchMode,
     ExecutionConfig,
@@ -32,10 +27,13 @@ from fraiseql_doctor.core.query_collection import (
 )
 from fraiseql_doctor.core.result_storage import (
     CompressionType,
+    ResultSearchFilter,
     ResultStorageManager,
     StorageBackend,
     StorageConfig,
 )
+from fraiseql_doctor.models.endpoint import Endpoint
+from fraiseql_doctor.schemas.query import QueryCollectionCreate, QueryCreate
 
 
 @pytest.fixture()
@@ -192,7 +190,7 @@ class TestQueryCollectionIntegration:
     async def test_create_collection_with_queries(self, query_collection_manager, sample_queries):
         """Test creating a collection with initial queries."""
         # Mock successful query validation
-        query_collection_manager.complexity_analyzer.analyze_query = AsyncMock(
+        query_collection_manager.complexity_analyzer.analyze_query = MagicMock(
             return_value=MagicMock(
                 complexity_score=5.0, estimated_execution_time=0.1, field_count=8, depth=3
             )
@@ -486,7 +484,7 @@ class TestEndToEndIntegration:
     ):
         """Test complete query lifecycle from creation to result storage."""
         # Step 1: Create collection and add queries
-        query_collection_manager.complexity_analyzer.analyze_query = AsyncMock(
+        query_collection_manager.complexity_analyzer.analyze_query = MagicMock(
             return_value=MagicMock(
                 complexity_score=5.0, estimated_execution_time=0.1, field_count=8, depth=3
             )
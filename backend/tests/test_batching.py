@@ -0,0 +1,99 @@
+"""Tests for merging GraphQL queries into one batched request."""
+
+import pytest
+from fraiseql_doctor.services import batching
+from fraiseql_doctor.services.batching import merge_queries, split_response
+
+graphql = pytest.importorskip("graphql")
+
+
+def test_merge_namespaces_fields_variables_and_fragments():
+    """Test each query's fields, variables and fragments get their own prefix."""
+    merged = merge_queries(
+        [
+            (
+                "query User($id: ID!) { user(id: $id) { ...UserFields } }\n"
+                "fragment UserFields on User { id name }",
+                {"id": 1},
+            ),
+            ("{ users { id } me: viewer { id } }", None),
+            ("query User($id: ID!) { user(id: $id) { id } }", {"id": 2}),
+        ]
+    )
+
+    assert merged.variables == {"q0_id": 1, "q2_id": 2}
+    assert merged.aliases == [
+        {"q0_user": "user"},
+        {"q1_users": "users", "q1_me": "me"},
+        {"q2_user": "user"},
+    ]
+    expected = graphql.parse(
+        """
+        query Batch($q0_id: ID!, $q2_id: ID!) {
+          q0_user: user(id: $q0_id) { ...q0_UserFields }
+          q1_users: users { id }
+          q1_me: viewer { id }
+          q2_user: user(id: $q2_id) { id }
+        }
+        fragment q0_UserFields on User { id name }
+        """
+    )
+    assert merged.query == graphql.print_ast(expected)
+
+
+@pytest.mark.parametrize(
+    "query_text",
+    [
+        "{ users { id ",
+        "mutation { deleteUser(id: 1) }",
+        "subscription { events { id } }",
+        "query A { a } query B { b }",
+        "query @cached { users { id } }",
+        "{ ... on Query { users { id } } }",
+        "{ ...Root } fragment Root on Query { users { id } }",
+    ],
+)
+def test_merge_refuses_documents_it_cannot_namespace(query_text):
+    """Test unparsable documents and anything but one plain query are not merged."""
+    assert merge_queries([("{ ping }", None), (query_text, None)]) is None
+
+
+def test_merge_without_graphql_core(monkeypatch):
+    """Test merging is skipped when graphql-core isn't installed."""
+    monkeypatch.setattr(batching, "_graphql", lambda: None)
+
+    assert merge_queries([("{ ping }", None)]) is None
+
+
+def test_split_response_routes_data_and_errors_per_query():
+    """Test data and field errors go back to the query that selected them."""
+    merged = merge_queries(
+        [("{ user { id } }", None), ("{ users { id } me: viewer { id } }", None)]
+    )
+    response = {
+        "data": {"q0_user": {"id": 1}, "q1_users": [], "q1_me": None},
+        "errors": [{"message": "Not allowed", "path": ["q1_me", "id"]}],
+    }
+
+    assert split_response(merged, response) == [
+        {"data": {"user": {"id": 1}}},
+        {
+            "data": {"users": [], "me": None},
+            "errors": [{"message": "Not allowed", "path": ["me", "id"]}],
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"errors": [{"message": "Cannot query field 'nope' on type 'Query'."}]},
+        {"data": None, "errors": [{"message": "boom", "path": ["q0_user"]}]},
+        {"data": {"q0_user": None}, "errors": [{"message": "boom", "path": ["elsewhere"]}]},
+    ],
+)
+def test_split_response_gives_up_on_unattributable_responses(response):
+    """Test responses that can't be assigned to single queries are not split."""
+    merged = merge_queries([("{ user { id } }", None)])
+
+    assert split_response(merged, response) is None
@@ -0,0 +1,57 @@
+"""Tests for the size- and time-bounded cache."""
+
+import pytest
+from fraiseql_doctor.utils import cache
+from fraiseql_doctor.utils.cache import TTLCache
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    """Monotonic clock the test advances by hand."""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    """Test entries are served until their TTL passes and then dropped."""
+    entries = TTLCache(maxsize=10, ttl=60)
+    entries["a"] = 1
+
+    clock[0] += 59
+    assert entries["a"] == 1
+    clock[0] += 1
+    assert "a" not in entries
+    assert entries.get("a") is None
+    assert len(entries) == 0
+
+
+def test_setting_again_restarts_the_ttl(clock):
+    """Test storing a key again gives it a fresh lifetime."""
+    entries = TTLCache(maxsize=10, ttl=60)
+    entries["a"] = 1
+    clock[0] += 50
+    entries["a"] = 2
+    clock[0] += 50
+
+    assert entries["a"] == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    """Test the cache stays within maxsize by evicting the least recently used key."""
+    entries = TTLCache(maxsize=2, ttl=60)
+    entries["a"] = 1
+    entries["b"] = 2
+    assert entries["a"] == 1
+
+    entries["c"] = 3
+
+    assert list(entries) == ["a", "c"]
+    assert entries.pop("a") == 1
+    assert entries.pop("a", None) is None
+
+
+def test_maxsize_must_be_positive():
+    """Test a cache that could hold nothing is rejected."""
+    with pytest.raises(ValueError, match="maxsize"):
+        TTLCache(maxsize=0, ttl=60)
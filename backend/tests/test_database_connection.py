@@ -1,5 +1,7 @@
 """Test database connectivity and basic operations."""
 
+from fraiseql_doctor.core.database.session import DatabaseConfig, _create_async_engine
+from fraiseql_doctor.utils import serialization
 from sqlalchemy import text
 
 
@@ -18,3 +20,11 @@ async def test_database_session_creation(db_session):
     result = await db_session.execute(text("SELECT 1 as test_value"))
     row = result.fetchone()
     assert row[0] == 1
+
+
+def test_engine_serializes_json_columns_with_shared_helpers():
+    """Test JSON columns are encoded and decoded by the serialization helpers."""
+    engine = _create_async_engine(DatabaseConfig(url="postgresql+asyncpg://user@localhost/db"))
+
+    assert engine.dialect._json_serializer is serialization.dumps
+    assert engine.dialect._json_deserializer is serialization.loads
@@ -0,0 +1,891 @@
+"""Unit tests for the query execution manager."""
+
+import asyncio
+import json
+import threading
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fraiseql_doctor.core.execution_manager import (
+    _DELETE_SCHEDULED_EXECUTION,
+    _EAGER_TASKS,
+    _ENDPOINT_CACHE_TTL_SECONDS,
+    _EXECUTION_FLUSH_SIZE,
+    _INSERT_SCHEDULED_EXECUTION,
+    _OFFLOAD_THRESHOLD_BYTES,
+    BatchMode,
+    ExecutionConfig,
+    ExecutionResult,
+    ExecutionStatus,
+    QueryExecutionManager,
+    ScheduledExecution,
+    _Start,
+    _eager_task,
+    _map_bounded,
+    _response_size,
+)
+from fraiseql_doctor.core.query_collection import QueryPriority
+from fraiseql_doctor.services.fraiseql_client import (
+    FraiseQLClient,
+    GraphQLExecutionError,
+    GraphQLResponse,
+    NetworkError,
+)
+from fraiseql_doctor.utils import cache
+
+
+def make_query(query_text="query { users { id } }", variables=None, complexity=None):
+    """Build a stand-in for a stored query."""
+    return SimpleNamespace(
+        id=uuid4(),
+        name="users",
+        query_text=query_text,
+        variables=variables or {},
+        expected_complexity_score=complexity,
+    )
+
+
+@pytest.fixture()
+def client():
+    """GraphQL client returning a fixed successful response."""
+    client = MagicMock()
+    client.execute_query = AsyncMock(return_value={"data": {"users": [{"id": 1}]}})
+    return client
+
+
+@pytest.fixture()
+def make_manager(client):
+    """Build an execution manager serving ``query`` with storage stubbed out."""
+
+    def factory(query, config=None):
+        db_session = MagicMock()
+        db_session.get = AsyncMock(return_value=MagicMock())
+        collection_manager = MagicMock()
+        collection_manager.get_query = AsyncMock(return_value=query)
+        collection_manager.get_queries = AsyncMock(side_effect=lambda ids: [query] * len(ids))
+
+        # The stub client answers instantly, so admit every result unless told otherwise
+        config = config or ExecutionConfig(cache_min_execution_seconds=0)
+        manager = QueryExecutionManager(
+            db_session, lambda endpoint: client, collection_manager, config
+        )
+        manager._store_execution_result = AsyncMock()
+        return manager
+
+    return factory
+
+
+def test_response_size_prefers_client_measurement():
+    """Test the body size reported by the client is used instead of re-serializing."""
+    response = GraphQLResponse(data={"users": []}, response_time_ms=5, response_size_bytes=512)
+
+    assert _response_size(response) == 512
+    assert _response_size({"data": {"name": "café"}}) == len('{"data":{"name":"café"}}'.encode())
+    assert _response_size({}) == 0
+
+
+class TestResultCache:
+    """Test the in-process result cache of execute_query."""
+
+    async def test_repeat_execution_is_served_from_cache(self, make_manager, client):
+        """Test an identical execution skips the client and is marked as a cache hit."""
+        query = make_query()
+        manager = make_manager(query)
+        endpoint_id = uuid4()
+
+        first = await manager.execute_query(query.id, endpoint_id)
+        second = await manager.execute_query(query.id, endpoint_id)
+
+        assert client.execute_query.await_count == 1
+        assert first.success and not first.cache_hit
+        assert second.success and second.cache_hit
+        assert second.result_data == first.result_data
+        assert second.execution_id != first.execution_id
+        assert second.started_at >= first.completed_at
+        assert manager._store_execution_result.await_count == 2
+
+    async def test_key_covers_endpoint_and_variables(self, make_manager, client):
+        """Test other endpoints or variables miss the cache; key order doesn't matter."""
+        query = make_query()
+        manager = make_manager(query)
+        endpoint_id = uuid4()
+
+        await manager.execute_query(query.id, endpoint_id, {"a": 1, "b": 2})
+        await manager.execute_query(query.id, endpoint_id, {"b": 2, "a": 1})
+        assert client.execute_query.await_count == 1
+
+        await manager.execute_query(query.id, endpoint_id, {"a": 2, "b": 2})
+        await manager.execute_query(query.id, uuid4(), {"a": 1, "b": 2})
+        assert client.execute_query.await_count == 3
+
+    async def test_graphql_errors_are_not_cached(self, make_manager, client):
+        """Test responses with GraphQL errors are re-executed."""
+        client.execute_query.return_value = {"errors": [{"message": "boom"}]}
+        query = make_query()
+        manager = make_manager(query)
+        endpoint_id = uuid4()
+
+        for _ in range(2):
+            result = await manager.execute_query(query.id, endpoint_id)
+            assert result.status == ExecutionStatus.FAILED
+
+        assert client.execute_query.await_count == 2
+        assert not manager._result_cache
+
+    async def test_caching_can_be_disabled(self, make_manager, client):
+        """Test enable_caching=False always executes the query."""
+        query = make_query()
+        manager = make_manager(
+            query, ExecutionConfig(enable_caching=False, cache_min_execution_seconds=0)
+        )
+        endpoint_id = uuid4()
+
+        await manager.execute_query(query.id, endpoint_id)
+        await manager.execute_query(query.id, endpoint_id)
+
+        assert client.execute_query.await_count == 2
+        assert not manager._result_cache
+
+    @pytest.mark.parametrize(
+        "query_text",
+        [
+            "mutation { deleteUser(id: 1) { id } }",
+            "subscription OnUser { userAdded { id } }",
+            "fragment F on User { id }\nmutation Reset { reset { ...F } }",
+        ],
+    )
+    async def test_writes_and_subscriptions_are_not_cached(self, make_manager, client, query_text):
+        """Test operations other than queries always reach the endpoint."""
+        query = make_query(query_text)
+        manager = make_manager(query)
+        endpoint_id = uuid4()
+
+        await manager.execute_query(query.id, endpoint_id)
+        second = await manager.execute_query(query.id, endpoint_id)
+
+        assert client.execute_query.await_count == 2
+        assert not second.cache_hit
+        assert not manager._result_cache
+
+    async def test_fields_containing_operation_keywords_are_cached(self, make_manager, client):
+        """Test only the bare keywords disqualify a query, not field names containing them."""
+        query = make_query("{ mutationLog { id } subscriptions { id } }")
+        manager = make_manager(query)
+        endpoint_id = uuid4()
+
+        await manager.execute_query(query.id, endpoint_id)
+        second = await manager.execute_query(query.id, endpoint_id)
+
+        assert client.execute_query.await_count == 1
+        assert second.cache_hit
+
+    async def test_expired_entries_are_re_executed(self, make_manager, client):
+        """Test entries older than cache_ttl_seconds are dropped."""
+        query = make_query()
+        manager = make_manager(
+            query, ExecutionConfig(cache_ttl_seconds=0, cache_min_execution_seconds=0)
+        )
+        endpoint_id = uuid4()
+
+        await manager.execute_query(query.id, endpoint_id)
+        second = await manager.execute_query(query.id, endpoint_id)
+
+        assert client.execute_query.await_count == 2
+        assert not second.cache_hit
+
+    async def test_cache_evicts_least_recently_used(self, make_manager, monkeypatch):
+        """Test the cache stays bounded and evicts the least recently used entry."""
+        from fraiseql_doctor.core import execution_manager
+
+        monkeypatch.setattr(execution_manager, "_RESULT_CACHE_SIZE", 2)
+        query = make_query()
+        manager = make_manager(query)
+        endpoints = [uuid4() for _ in range(3)]
+
+        await manager.execute_query(query.id, endpoints[0])
+        await manager.execute_query(query.id, endpoints[1])
+        # Touch the first entry so the second becomes the least recently used
+        await manager.execute_query(query.id, endpoints[0])
+        await manager.execute_query(query.id, endpoints[2])
+
+        cached_endpoints = {key[:16] for key in manager._result_cache}
+        assert cached_endpoints == {endpoints[0].bytes, endpoints[2].bytes}
+
+    async def test_only_slow_or_complex_queries_are_cached(self, make_manager, client):
+        """Test fast, simple queries bypass the cache while complex ones are admitted."""
+        config = ExecutionConfig(cache_min_execution_seconds=60, cache_min_complexity_score=10)
+        endpoint_id = uuid4()
+
+        simple = make_query(complexity=2.0)
+        manager = make_manager(simple, config)
+        await manager.execute_query(simple.id, endpoint_id)
+        await manager.execute_query(simple.id, endpoint_id)
+        assert client.execute_query.await_count == 2
+
+        complex_query = make_query(complexity=25.0)
+        manager = make_manager(complex_query, config)
+        await manager.execute_query(complex_query.id, endpoint_id)
+        result = await manager.execute_query(complex_query.id, endpoint_id)
+        assert client.execute_query.await_count == 3
+        assert result.cache_hit
+
+
+async def test_endpoint_lookups_are_cached_briefly(make_manager, monkeypatch):
+    """Test repeat executions reuse the endpoint until its cache entry expires."""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    manager = make_manager(make_query(), ExecutionConfig(enable_caching=False))
+    endpoint_id = uuid4()
+
+    await manager.execute_query(uuid4(), endpoint_id)
+    await manager.execute_query(uuid4(), endpoint_id)
+    assert manager.db_session.get.await_count == 1
+
+    now[0] += _ENDPOINT_CACHE_TTL_SECONDS
+    await manager.execute_query(uuid4(), endpoint_id)
+    assert manager.db_session.get.await_count == 2
+
+
+async def test_missing_endpoint_is_not_cached(make_manager):
+    """Test an endpoint that wasn't found is looked up again next time."""
+    manager = make_manager(make_query())
+    manager.db_session.get = AsyncMock(return_value=None)
+    endpoint_id = uuid4()
+
+    for _ in range(2):
+        result = await manager.execute_query(uuid4(), endpoint_id)
+        assert result.error_code == "ENDPOINT_NOT_FOUND"
+    assert manager.db_session.get.await_count == 2
+
+
+class TestBatchedParallelExecution:
+    """Test parallel batches are sent as merged GraphQL documents."""
+
+    def make_batch_manager(self, client, queries, config):
+        db_session = MagicMock()
+        db_session.get = AsyncMock(return_value=MagicMock())
+        collection_manager = MagicMock()
+        collection_manager.get_query = AsyncMock(side_effect=queries.get)
+        collection_manager.get_queries = AsyncMock(
+            side_effect=lambda ids: list(map(queries.get, ids))
+        )
+
+        manager = QueryExecutionManager(
+            db_session, lambda endpoint: client, collection_manager, config
+        )
+        manager._store_execution_result = AsyncMock()
+        return manager
+
+    async def test_window_is_sent_as_one_request(self, client):
+        """Test a window of queries costs one request and keeps per-query results."""
+        pytest.importorskip("graphql")
+        first, second = make_query("{ users { id } }"), make_query("{ posts { id } }")
+        queries = {first.id: first, second.id: second}
+        client.execute_query.return_value = {
+            "data": {"q0_users": [{"id": 1}], "q1_posts": None},
+            "errors": [{"message": "Forbidden", "path": ["q1_posts"]}],
+        }
+        manager = self.make_batch_manager(client, queries, ExecutionConfig(enable_caching=False))
+
+        results = await manager._execute_parallel(list(queries), uuid4(), {}, manager.config)
+
+        assert client.execute_query.await_count == 1
+        assert [result.query_id for result in results] == [first.id, second.id]
+        assert results[0].success
+        assert results[0].result_data == {"data": {"users": [{"id": 1}]}}
+        assert results[0].response_size == len(b'{"data":{"users":[{"id":1}]}}')
+        assert results[1].error_code == "GRAPHQL_ERROR"
+        assert results[1].error_message == "Forbidden"
+
+    async def test_window_is_merged_once_when_nothing_is_cached(self, client, monkeypatch):
+        """Test the document built to check mergeability is the one sent."""
+        pytest.importorskip("graphql")
+        from fraiseql_doctor.core import execution_manager
+
+        merge = MagicMock(wraps=execution_manager.merge_queries)
+        monkeypatch.setattr(execution_manager, "merge_queries", merge)
+        first, second = make_query("{ users { id } }"), make_query("{ posts { id } }")
+        queries = {first.id: first, second.id: second}
+        client.execute_query.return_value = {"data": {"q0_users": [], "q1_posts": []}}
+        manager = self.make_batch_manager(client, queries, ExecutionConfig(enable_caching=False))
+
+        results = await manager._execute_parallel(list(queries), uuid4(), {}, manager.config)
+
+        assert all(result.success for result in results)
+        assert merge.call_count == 1
+
+    async def test_cached_queries_are_left_out_of_the_request(self, client):
+        """Test a window re-merges only the queries the cache couldn't serve."""
+        pytest.importorskip("graphql")
+        first, second = make_query("{ users { id } }"), make_query("{ posts { id } }")
+        queries = {first.id: first, second.id: second}
+        config = ExecutionConfig(cache_min_execution_seconds=0)
+        manager = self.make_batch_manager(client, queries, config)
+        client.execute_query.return_value = {"data": {"users": []}}
+        await manager.execute_query(first.id, endpoint_id := uuid4())
+        client.execute_query.return_value = {"data": {"q0_posts": []}}
+
+        results = await manager._execute_parallel(list(queries), endpoint_id, {}, config)
+
+        assert results[0].cache_hit
+        assert results[1].result_data == {"data": {"posts": []}}
+        assert "users" not in client.execute_query.await_args.args[0]
+
+    async def test_windows_follow_batch_size(self, client):
+        """Test batch_size caps the number of queries merged into one request."""
+        pytest.importorskip("graphql")
+        queries = {query.id: query for query in (make_query("{ users { id } }") for _ in range(5))}
+        client.execute_query.return_value = {"data": {}}
+        config = ExecutionConfig(enable_caching=False, batch_size=2)
+        manager = self.make_batch_manager(client, queries, config)
+
+        results = await manager._execute_parallel(list(queries), uuid4(), {}, config)
+
+        assert client.execute_query.await_count == 3
+        assert len(results) == 5
+
+    async def test_unmergeable_queries_run_individually(self, client):
+        """Test a window falls back to one request per query when it can't be merged."""
+        query, mutation = make_query(), make_query("mutation { ping }")
+        queries = {query.id: query, mutation.id: mutation}
+        manager = self.make_batch_manager(client, queries, ExecutionConfig(enable_caching=False))
+
+        results = await manager._execute_parallel(list(queries), uuid4(), {}, manager.config)
+
+        assert client.execute_query.await_count == 2
+        assert all(result.success for result in results)
+
+
+class FakeSession:
+    """aiohttp session stand-in answering posts with queued replies."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.posted = []
+
+    @asynccontextmanager
+    async def post(self, url, json, **kwargs):
+        self.posted.append(json)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        status, body = reply
+        yield SimpleNamespace(
+            status=status,
+            read=AsyncMock(return_value=body.encode()),
+            text=AsyncMock(return_value=body),
+        )
+
+
+class TestBatchedClientErrors:
+    """Test batched requests through FraiseQLClient, which raises on errors."""
+
+    async def run(self, *replies):
+        pytest.importorskip("graphql")
+        session = FakeSession(*replies)
+        endpoint = SimpleNamespace(
+            url="https://api.example.com/graphql",
+            auth_type="none",
+            auth_config={},
+            timeout_seconds=30,
+        )
+        users, posts = make_query("{ users { id } }"), make_query("{ posts { id } }")
+        queries = {users.id: users, posts.id: posts}
+        manager = TestBatchedParallelExecution().make_batch_manager(
+            FraiseQLClient(endpoint, session), queries, ExecutionConfig(enable_caching=False)
+        )
+        results = await manager._execute_parallel(list(queries), uuid4(), {}, manager.config)
+        return results, session.posted
+
+    async def test_errors_fail_their_queries_and_the_others_run_again(self):
+        """Test the queries without errors, whose data the client dropped, are re-run."""
+        batched = {
+            "data": {"q0_users": [{"id": 1}], "q1_posts": None},
+            "errors": [{"message": "Forbidden", "path": ["q1_posts"]}],
+        }
+        results, posted = await self.run(
+            (200, json.dumps(batched)), (200, '{"data":{"users":[{"id":1}]}}')
+        )
+
+        assert len(posted) == 2
+        assert posted[1]["query"] == "{ users { id } }"
+        assert results[0].success
+        assert results[0].result_data == {"data": {"users": [{"id": 1}]}}
+        assert results[0].response_size == len(b'{"data":{"users":[{"id":1}]}}')
+        assert results[1].error_code == "GRAPHQL_ERROR"
+        assert results[1].error_message == "Forbidden"
+
+    async def test_http_error_runs_each_query_on_its_own(self):
+        """Test an HTTP error for the merged document falls back to one request per query."""
+        results, posted = await self.run(
+            (400, "Cannot query field"),
+            (200, '{"data":{"users":[]}}'),
+            (200, '{"data":{"posts":[]}}'),
+        )
+
+        assert len(posted) == 3
+        assert all(result.success for result in results)
+
+    async def test_network_error_fails_the_window(self):
+        """Test network failures are not retried query by query."""
+        results, posted = await self.run(OSError("connection refused"))
+
+        assert len(posted) == 1
+        assert [result.error_code for result in results] == ["NETWORK_ERROR"] * 2
+
+
+async def test_batch_counts_results_by_outcome(make_manager):
+    """Test a batch tallies successful, failed and cancelled executions."""
+    manager = make_manager(make_query())
+    manager._store_batch_result = AsyncMock()
+    statuses = [
+        (ExecutionStatus.COMPLETED, True),
+        (ExecutionStatus.FAILED, False),
+        (ExecutionStatus.FAILED, False),
+        (ExecutionStatus.CANCELLED, False),
+        (ExecutionStatus.TIMEOUT, False),
+    ]
+    manager._execute_sequential = AsyncMock(
+        return_value=[
+            ExecutionResult(
+                execution_id=uuid4(),
+                query_id=uuid4(),
+                endpoint_id=uuid4(),
+                status=status,
+                started_at=datetime.now(UTC),
+                success=success,
+            )
+            for status, success in statuses
+        ]
+    )
+
+    batch = await manager.execute_batch([uuid4()] * 5, uuid4(), BatchMode.SEQUENTIAL)
+
+    assert (batch.successful, batch.failed, batch.cancelled) == (1, 2, 1)
+
+
+async def test_batch_fetches_its_queries_once(make_manager):
+    """Test a batch loads its queries in one call instead of one lookup per execution."""
+    manager = make_manager(make_query())
+    manager._store_batch_result = AsyncMock()
+
+    batch = await manager.execute_batch([uuid4() for _ in range(3)], uuid4(), BatchMode.PARALLEL)
+
+    assert batch.successful == 3
+    manager.collection_manager.get_queries.assert_awaited_once()
+    manager.collection_manager.get_query.assert_not_awaited()
+
+
+async def test_batch_runs_when_prefetching_its_queries_fails(make_manager):
+    """Test a failed prefetch falls back to looking each query up."""
+    manager = make_manager(make_query())
+    manager._store_batch_result = AsyncMock()
+    manager.collection_manager.get_queries.side_effect = ConnectionError("db down")
+
+    batch = await manager.execute_batch([uuid4() for _ in range(3)], uuid4(), BatchMode.PARALLEL)
+
+    assert batch.successful == 3
+    assert manager.collection_manager.get_query.await_count == 3
+
+
+async def test_parallel_task_exceptions_become_failed_results(make_manager):
+    """Test a window whose task raises yields a TASK_EXCEPTION result per query."""
+    manager = make_manager(make_query())
+    manager._get_endpoint = AsyncMock(side_effect=RuntimeError("database gone"))
+    query_ids = [uuid4() for _ in range(3)]
+
+    results = await manager._execute_parallel(query_ids, uuid4(), {}, manager.config)
+
+    assert [result.query_id for result in results] == query_ids
+    assert {(result.error_code, result.error_message) for result in results} == {
+        ("TASK_EXCEPTION", "database gone")
+    }
+
+
+@pytest.mark.parametrize(
+    ("error", "status", "code", "message"),
+    [
+        (TimeoutError(), ExecutionStatus.TIMEOUT, "TIMEOUT", "Query timed out after 300s"),
+        (
+            GraphQLExecutionError("Bad {field}", errors=[]),
+            ExecutionStatus.FAILED,
+            "GRAPHQL_EXECUTION_ERROR",
+            "Bad {field}",
+        ),
+        (
+            NetworkError("refused"),
+            ExecutionStatus.FAILED,
+            "NETWORK_ERROR",
+            "Network error: refused",
+        ),
+        (KeyError("x"), ExecutionStatus.FAILED, "UNEXPECTED_ERROR", "Unexpected error: 'x'"),
+    ],
+)
+async def test_execution_errors_map_to_results(make_manager, client, error, status, code, message):
+    """Test each kind of execution error produces its status, code and message."""
+    manager = make_manager(make_query(), ExecutionConfig(enable_caching=False))
+    client.execute_query.side_effect = error
+
+    result = await manager.execute_query(uuid4(), uuid4())
+
+    assert (result.status, result.error_code, result.error_message) == (status, code, message)
+
+
+class TestExecutionStorage:
+    """Test execution records are written once per batch rather than per execution."""
+
+    @pytest.fixture()
+    def storing_manager(self, make_manager, monkeypatch):
+        from fraiseql_doctor.core import execution_manager
+
+        monkeypatch.setattr(execution_manager, "Execution", lambda **columns: columns)
+        manager = make_manager(make_query(), ExecutionConfig(enable_caching=False))
+        # Use the real storage, with the session's writes stubbed
+        del manager._store_execution_result
+        manager.db_session.add_all = MagicMock()
+        manager.db_session.commit = AsyncMock()
+        manager.db_session.execute = AsyncMock()
+        return manager
+
+    async def test_single_execution_is_committed_straight_away(self, storing_manager):
+        """Test an execution outside a batch is stored as soon as it finishes."""
+        await storing_manager.execute_query(uuid4(), uuid4())
+
+        assert len(storing_manager.db_session.add_all.call_args.args[0]) == 1
+        storing_manager.db_session.commit.assert_awaited_once()
+
+    async def test_batch_is_committed_once(self, storing_manager):
+        """Test a batch's execution records and summary share one commit."""
+        batch = await storing_manager.execute_batch(
+            [uuid4() for _ in range(3)], uuid4(), BatchMode.SEQUENTIAL
+        )
+
+        assert batch.successful == 3
+        storing_manager.db_session.add_all.assert_called_once()
+        assert len(storing_manager.db_session.add_all.call_args.args[0]) == 3
+        storing_manager.db_session.commit.assert_awaited_once()
+        assert not storing_manager._pending_executions
+
+    async def test_large_batch_is_written_in_chunks(self, storing_manager):
+        """Test long batches write their records every _EXECUTION_FLUSH_SIZE executions."""
+        await storing_manager.execute_batch(
+            [uuid4() for _ in range(_EXECUTION_FLUSH_SIZE + 1)], uuid4(), BatchMode.PARALLEL
+        )
+
+        written = [call.args[0] for call in storing_manager.db_session.add_all.call_args_list]
+        assert [len(executions) for executions in written] == [_EXECUTION_FLUSH_SIZE, 1]
+        assert storing_manager.db_session.commit.await_count == 2
+
+
+class TestConcurrencyLimits:
+    """Test executions are limited per endpoint and, optionally, in total."""
+
+    async def hold_slot(self, manager, endpoint_id, release):
+        async with manager._execution_slot(endpoint_id):
+            await release.wait()
+
+    async def test_busy_endpoint_does_not_block_others(self, make_manager):
+        """Test a saturated endpoint leaves the other endpoints' slots free."""
+        manager = make_manager(make_query(), ExecutionConfig(max_concurrent=2))
+        slow, fast = uuid4(), uuid4()
+        release = asyncio.Event()
+        holders = [asyncio.create_task(self.hold_slot(manager, slow, release)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        async with asyncio.timeout(1):
+            async with manager._execution_slot(fast):
+                pass
+        assert manager._endpoint_semaphores[slow].locked()
+
+        release.set()
+        await asyncio.gather(*holders)
+
+    async def test_total_cap_applies_across_endpoints(self, make_manager):
+        """Test max_concurrent_total limits executions over all endpoints together."""
+        manager = make_manager(
+            make_query(), ExecutionConfig(max_concurrent=2, max_concurrent_total=2)
+        )
+        release = asyncio.Event()
+        holders = [asyncio.create_task(self.hold_slot(manager, uuid4(), release)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                async with manager._execution_slot(uuid4()):
+                    pass
+
+        release.set()
+        await asyncio.gather(*holders)
+
+
+class TestScheduler:
+    """Test the heap-driven scheduler loop."""
+
+    def make_scheduled(self, manager, due_in):
+        scheduled = ScheduledExecution(
+            id=uuid4(),
+            query_id=uuid4(),
+            cron_expression="0 * * * *",
+            endpoint_id=uuid4(),
+            config=manager.config,
+            next_execution=datetime.now(UTC) + timedelta(seconds=due_in),
+        )
+        manager._scheduled_executions[scheduled.id] = scheduled
+        manager._push_schedule(scheduled)
+        return scheduled
+
+    async def run_scheduler(self, manager, seconds):
+        manager._scheduler_task = asyncio.create_task(manager._scheduler_loop())
+        await asyncio.sleep(seconds)
+        await manager.stop()
+
+    async def test_due_execution_fires_on_time_and_is_rescheduled(self, make_manager):
+        """Test a run fires when due rather than at the next poll, then is queued again."""
+        manager = make_manager(make_query())
+        manager._execute_scheduled_query = AsyncMock()
+        scheduled = self.make_scheduled(manager, due_in=0.05)
+
+        await self.run_scheduler(manager, 0.3)
+
+        manager._execute_scheduled_query.assert_awaited_once_with(scheduled)
+        assert scheduled.last_execution is not None
+        assert scheduled.next_execution > scheduled.last_execution
+        assert manager._schedule_heap == [(scheduled.next_execution.timestamp(), scheduled.id)]
+
+    async def test_scheduled_runs_bypass_the_result_cache(self, make_manager, client):
+        """Test each monitoring run executes even when an identical result is cached."""
+        query = make_query()
+        manager = make_manager(query)
+        scheduled = self.make_scheduled(manager, due_in=3600)
+
+        await manager.execute_query(query.id, scheduled.endpoint_id)
+        await manager._execute_scheduled_query(scheduled)
+        await manager._execute_scheduled_query(scheduled)
+
+        assert client.execute_query.await_count == 3
+        assert scheduled.config.enable_caching
+
+    async def test_sooner_execution_wakes_the_scheduler(self, make_manager):
+        """Test queueing a run ahead of the first one interrupts the scheduler's sleep."""
+        manager = make_manager(make_query())
+        manager._execute_scheduled_query = AsyncMock()
+        later = self.make_scheduled(manager, due_in=3600)
+        manager._scheduler_task = asyncio.create_task(manager._scheduler_loop())
+        await asyncio.sleep(0.05)
+
+        sooner = self.make_scheduled(manager, due_in=0.05)
+        await asyncio.sleep(0.3)
+        await manager.stop()
+
+        manager._execute_scheduled_query.assert_awaited_once_with(sooner)
+        assert later.last_execution is None
+
+    async def test_running_executions_are_tracked_until_done(self, make_manager):
+        """Test a fired run is listed as running and removed once it finishes."""
+        manager = make_manager(make_query())
+        release = asyncio.Event()
+
+        async def run(scheduled):
+            await release.wait()
+
+        manager._execute_scheduled_query = run
+        self.make_scheduled(manager, due_in=0)
+        manager._scheduler_task = asyncio.create_task(manager._scheduler_loop())
+
+        await asyncio.sleep(0.05)
+        assert len(manager._running_executions) == 1
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert not manager._running_executions
+        await manager.stop()
+
+    async def test_stop_cancels_running_executions(self, make_manager):
+        """Test stopping cancels in-flight runs and waits for them to unwind."""
+        manager = make_manager(make_query())
+        cancelled = asyncio.Event()
+
+        async def run(scheduled):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        manager._execute_scheduled_query = run
+        self.make_scheduled(manager, due_in=0)
+        manager._scheduler_task = asyncio.create_task(manager._scheduler_loop())
+        await asyncio.sleep(0.05)
+
+        await manager.stop()
+
+        assert cancelled.is_set()
+        assert not manager._running_executions
+
+    async def test_schedule_is_stored_with_the_shared_statement(self, make_manager):
+        """Test schedules are written by the prebuilt statement with named parameters."""
+        manager = make_manager(make_query())
+        manager.db_session.execute = AsyncMock()
+        manager.db_session.commit = AsyncMock()
+        scheduled = self.make_scheduled(manager, due_in=60)
+
+        await manager._store_scheduled_execution(scheduled)
+        await manager.unschedule_query(scheduled.id)
+
+        (insert, params), (delete, delete_params) = (
+            call.args for call in manager.db_session.execute.await_args_list
+        )
+        assert insert is _INSERT_SCHEDULED_EXECUTION
+        assert params["id"] == scheduled.id
+        assert params["next_execution"] == scheduled.next_execution
+        assert delete is _DELETE_SCHEDULED_EXECUTION
+        assert delete_params == {"id": scheduled.id}
+
+    def test_cron_expression_is_parsed_once(self, make_manager, monkeypatch):
+        """Test later runs reuse the parsed cron expression and count from the given time."""
+        from fraiseql_doctor.core import execution_manager
+
+        manager = make_manager(make_query())
+        scheduled = self.make_scheduled(manager, due_in=0)
+        parse = MagicMock(wraps=execution_manager._croniter.croniter)
+        monkeypatch.setattr(execution_manager._croniter, "croniter", parse)
+        start = datetime(2024, 1, 1, 10, 15, tzinfo=UTC)
+
+        assert scheduled.next_run_after(start) == datetime(2024, 1, 1, 11, 0, tzinfo=UTC)
+        assert scheduled.next_run_after(start + timedelta(hours=5)) == datetime(
+            2024, 1, 1, 16, 0, tzinfo=UTC
+        )
+        assert parse.call_count == 1
+
+    async def test_unscheduled_entries_are_skipped(self, make_manager):
+        """Test a run removed before it is due doesn't fire."""
+        manager = make_manager(make_query())
+        manager._execute_scheduled_query = AsyncMock()
+        scheduled = self.make_scheduled(manager, due_in=0.05)
+        del manager._scheduled_executions[scheduled.id]
+
+        await self.run_scheduler(manager, 0.3)
+
+        manager._execute_scheduled_query.assert_not_awaited()
+        assert not manager._schedule_heap
+
+
+def test_serialized_config_has_string_priority_keys(make_manager):
+    """Test configs serialize to JSON-ready dicts, including reloaded string keys."""
+    manager = make_manager(make_query())
+    config = ExecutionConfig(max_concurrent=3)
+
+    serialized = manager._serialize_config(config)
+
+    assert serialized["max_concurrent"] == 3
+    assert serialized["priority_weights"] == {
+        "QueryPriority.LOW": 1,
+        "QueryPriority.MEDIUM": 2,
+        "QueryPriority.HIGH": 3,
+        "QueryPriority.CRITICAL": 5,
+    }
+    assert config.priority_weights[QueryPriority.LOW] == 1
+    reloaded = ExecutionConfig(**serialized)
+    assert manager._serialize_config(reloaded) == serialized
+
+
+def test_start_times_executions_with_the_monotonic_clock(monkeypatch):
+    """Test completion is derived from the elapsed perf_counter time, not the wall clock."""
+    started = _Start(datetime(2024, 1, 1, tzinfo=UTC), counter=100.0)
+    monkeypatch.setattr("time.perf_counter", lambda: 101.5)
+
+    assert started.finish() == (datetime(2024, 1, 1, 0, 0, 1, 500000, tzinfo=UTC), 1.5)
+
+
+async def test_eager_task_runs_until_first_await():
+    """Test tasks of coroutines that never suspend finish as soon as they are created."""
+
+    async def immediate():
+        return "done"
+
+    task = _eager_task(immediate())
+
+    assert task.done() is _EAGER_TASKS
+    assert await task == "done"
+
+
+async def test_map_bounded_limits_tasks_and_keeps_order():
+    """Test at most ``limit`` items run at once and results (or fallbacks) keep item order."""
+    running = peak = 0
+
+    async def work(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        if item == 3:
+            raise ValueError("bad item")
+        return item * 10
+
+    results = await _map_bounded(
+        work, list(range(8)), limit=3, on_error=lambda item, error: f"{item}: {error}"
+    )
+
+    assert peak == 3
+    assert results == [0, 10, 20, "3: bad item", 40, 50, 60, 70]
+
+
+async def test_nested_map_bounded_calls_share_the_limit():
+    """Test calls made from a worker draw on the outer call's limit instead of their own."""
+    running = peak = 0
+
+    async def leaf(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return item
+
+    async def window(items):
+        return await _map_bounded(leaf, items, limit=3, on_error=None)
+
+    tasks_before = len(asyncio.all_tasks())
+    batch = asyncio.ensure_future(
+        _map_bounded(window, [[0, 1, 2], [3, 4], [5]], limit=3, on_error=None)
+    )
+    await asyncio.sleep(0.005)
+    assert len(asyncio.all_tasks()) - tasks_before <= 3
+
+    assert await batch == [[0, 1, 2], [3, 4], [5]]
+    assert peak == 3
+
+
+async def test_map_bounded_cancels_its_workers_with_the_caller():
+    """Test cancelling the calling task also cancels the workers it started."""
+    started = asyncio.Event()
+
+    async def block(item):
+        started.set()
+        await asyncio.sleep(3600)
+
+    tasks_before = asyncio.all_tasks()
+    batch = asyncio.create_task(_map_bounded(block, list(range(4)), limit=2, on_error=None))
+    await started.wait()
+    batch.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await batch
+    await asyncio.sleep(0)
+
+    assert asyncio.all_tasks() == tasks_before
+
+
+async def test_offload_moves_only_large_work_to_thread_pool(make_manager):
+    """Test large work runs in the thread pool, created on first use, and small work inline."""
+    manager = make_manager(make_query())
+    loop_thread = threading.get_ident()
+
+    assert await manager._offload(1024, threading.get_ident) == loop_thread
+    assert "_thread_pool" not in vars(manager)
+    assert await manager._offload(_OFFLOAD_THRESHOLD_BYTES, threading.get_ident) != loop_thread
+    assert manager._thread_pool._max_workers <= 2
@@ -2,7 +2,9 @@
 
 Tests following TDD approach for GraphQL client functionality.
 """
+
 import asyncio
+import json
 from unittest.mock import Mock
 
 import aiohttp
@@ -137,6 +139,7 @@ class TestGraphQLExecution:
             assert response.errors is None
             assert response.complexity_score == 5
             assert response.response_time_ms > 0
+            assert response.response_size_bytes == len(json.dumps(expected_response))
 
     @pytest.mark.asyncio()
     async def test_execute_query_with_variables(self, sample_endpoint):
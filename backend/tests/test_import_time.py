@@ -0,0 +1,42 @@
+"""Import-time regression guards.
+
+Import lightweight entry points in a fresh interpreter and fail when a module
+they are meant to leave unloaded shows up in the import trace.
+"""
+
+import pytest
+
+# Heavy modules that must not be imported as a side effect of ``core.database``
+CORE_DATABASE_FORBIDDEN = (
+    # DB drivers load when an engine is created, not with the PostgreSQL column types
+    "asyncpg",
+    "psycopg2",
+    "httpx",
+    "croniter",
+    "graphql",
+    "fraiseql_doctor.core.database.models",
+    "fraiseql_doctor.core.database.schemas",
+    "fraiseql_doctor.core.execution_manager",
+    "fraiseql_doctor.core.query_collection",
+    "fraiseql_doctor.core.result_storage",
+    "fraiseql_doctor.services.fraiseql_client",
+    "fraiseql_doctor.schemas.query",
+)
+
+
+@pytest.fixture(scope="module")
+def core_database_imports(modules_loaded_by):
+    """Forbidden modules imported by ``import fraiseql_doctor.core.database``."""
+    return modules_loaded_by("import fraiseql_doctor.core.database", CORE_DATABASE_FORBIDDEN)
+
+
+@pytest.mark.parametrize("forbidden", CORE_DATABASE_FORBIDDEN)
+def test_core_database_import_stays_light(core_database_imports, forbidden):
+    """Test importing core.database doesn't pull in a heavy module."""
+    loaded = [
+        name
+        for name in core_database_imports
+        if name == forbidden or name.startswith(f"{forbidden}.")
+    ]
+
+    assert not loaded, f"importing fraiseql_doctor.core.database loaded {loaded}"
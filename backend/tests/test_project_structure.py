@@ -55,3 +55,51 @@ def test_package_structure():
         import fraiseql_doctor.services
     except ImportError as e:
         pytest.fail(f"Package structure not properly configured: {e}")
+
+
+def test_database_package_import_is_minimal(modules_loaded_by):
+    """Test importing core.database doesn't evaluate the re-export shims."""
+    script = "from fraiseql_doctor.core.database import Base, get_database_session, get_db_session"
+    shims = [
+        "fraiseql_doctor.core.database.models",
+        "fraiseql_doctor.core.database.schemas",
+        "fraiseql_doctor.core.execution_manager",
+        "fraiseql_doctor.core.query_collection",
+        "fraiseql_doctor.core.result_storage",
+        "fraiseql_doctor.schemas.query",
+    ]
+
+    assert modules_loaded_by(script, shims) == []
+
+
+def test_database_shims_match_generator():
+    """Test the core.database re-export shims are the generator's current output."""
+    import subprocess
+    import sys
+
+    script = Path(__file__).parent.parent / "scripts" / "generate_database_shims.py"
+    result = subprocess.run(
+        [sys.executable, str(script), "--check"], capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_database_stubs_pass_ruff_import_sorting():
+    """Test the generated stubs survive the pre-commit ruff --fix hook unchanged."""
+    import shutil
+    import subprocess
+
+    ruff = shutil.which("ruff")
+    if ruff is None:
+        pytest.skip("ruff is not installed")
+    backend = Path(__file__).parent.parent
+    stubs = sorted((backend / "src" / "fraiseql_doctor" / "core" / "database").glob("*.pyi"))
+    result = subprocess.run(
+        [ruff, "check", "--no-cache", "--select", "I", *map(str, stubs)],
+        capture_output=True,
+        text=True,
+        cwd=backend,
+    )
+
+    assert result.returncode == 0, result.stdout
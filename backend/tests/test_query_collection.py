@@ -0,0 +1,490 @@
+"""Unit tests for the query collection manager."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers
+
+from fraiseql_doctor.core import query_collection
+from fraiseql_doctor.core.query_collection import (
+    DatabaseUnavailableError,
+    QueryCollectionManager,
+    QueryCollectionMetrics,
+    QuerySearchFilter,
+    QueryStatus,
+)
+from fraiseql_doctor.schemas.query import QueryCollectionCreate, QueryCreate
+from fraiseql_doctor.services.complexity import ComplexityMetrics, QueryComplexityAnalyzer
+from fraiseql_doctor.services.retry import CircuitBreakerConfig
+from fraiseql_doctor.utils import cache
+
+
+@pytest.fixture()
+def manager(monkeypatch):
+    """Collection manager over a stub session, building stand-in queries from rows."""
+    monkeypatch.setattr(
+        query_collection.Query,
+        "from_dict",
+        classmethod(lambda cls, row: SimpleNamespace(pk_query=row["id"], name=row["name"])),
+    )
+    return QueryCollectionManager(MagicMock(), MagicMock())
+
+
+@pytest.fixture()
+def orm_statements():
+    """Skip unless the ORM models configure, as statements selecting them need that."""
+    try:
+        configure_mappers()
+    except SQLAlchemyError as e:
+        pytest.skip(f"ORM models don't configure: {e}")
+
+
+async def test_get_queries_fetches_uncached_queries_at_once(manager, orm_statements):
+    """Test one select by primary key loads every uncached query and results keep order."""
+    cached, first, second, unknown = uuid4(), uuid4(), uuid4(), uuid4()
+    manager._query_cache[cached] = SimpleNamespace(pk_query=cached, name="cached")
+    result = MagicMock()
+    result.scalars.return_value = [
+        SimpleNamespace(pk_query=second, name="second"),
+        SimpleNamespace(pk_query=first, name="first"),
+    ]
+    manager.db_session.execute = AsyncMock(return_value=result)
+
+    queries = await manager.get_queries([first, cached, unknown, second, first])
+
+    assert [query and query.name for query in queries] == [
+        "first",
+        "cached",
+        None,
+        "second",
+        "first",
+    ]
+    manager.db_session.execute.assert_awaited_once()
+    (statement,) = manager.db_session.execute.await_args.args
+    compiled = statement.compile(dialect=postgresql.dialect())
+    assert "FROM tb_query" in str(compiled)
+    assert "tb_query.pk_query IN" in str(compiled)
+    assert list(compiled.params.values()) == [[first, unknown, second]]
+
+
+async def test_get_queries_skips_the_database_when_all_cached(manager):
+    """Test fully cached requests don't touch the database."""
+    query_id = uuid4()
+    manager._query_cache[query_id] = SimpleNamespace(pk_query=query_id, name="cached")
+    manager.db_session.execute = AsyncMock()
+
+    assert [query.name for query in await manager.get_queries([query_id])] == ["cached"]
+    manager.db_session.execute.assert_not_awaited()
+
+
+async def test_list_collections_computes_metrics_in_one_query(manager, monkeypatch):
+    """Test metrics for every listed collection come from a single aggregate query."""
+    monkeypatch.setattr(
+        query_collection.QueryCollection,
+        "from_dict",
+        classmethod(lambda cls, row: SimpleNamespace(pk_query_collection=row["id"])),
+    )
+    busy, empty = uuid4(), uuid4()
+    manager.db_session.execute = AsyncMock(
+        side_effect=[
+            [{"id": busy}, {"id": empty}],
+            [
+                {
+                    "collection_id": busy,
+                    "total_queries": 3,
+                    "active_queries": 2,
+                    "avg_complexity_score": 4.5,
+                    "total_executions": 10,
+                    "success_rate": 0.9,
+                    "avg_execution_time": 0.25,
+                    "last_executed": None,
+                }
+            ],
+        ]
+    )
+
+    collections = await manager.list_collections(include_metrics=True)
+
+    assert manager.db_session.execute.await_count == 2
+    assert manager.db_session.execute.await_args.args[1] == [[busy, empty]]
+    assert collections[0].metrics == QueryCollectionMetrics(
+        total_queries=3,
+        active_queries=2,
+        avg_complexity_score=4.5,
+        total_executions=10,
+        success_rate=0.9,
+        avg_execution_time=0.25,
+    )
+    assert collections[1].metrics == QueryCollectionMetrics()
+
+
+async def test_collection_metrics_come_from_one_aggregate_row(manager):
+    """Test a single collection's metrics are read off one aggregate row, not its query rows."""
+    collection_id = uuid4()
+    manager.get_collection = AsyncMock(return_value=SimpleNamespace())
+    manager.db_session.execute = AsyncMock(
+        return_value=[
+            {
+                "collection_id": collection_id,
+                "total_queries": 5,
+                "active_queries": 4,
+                "avg_complexity_score": 0.0,
+                "total_executions": 0,
+                "success_rate": 0.0,
+                "avg_execution_time": 0.0,
+                "last_executed": None,
+            }
+        ]
+    )
+
+    metrics = await manager._calculate_collection_metrics(collection_id)
+
+    manager.db_session.execute.assert_awaited_once()
+    assert manager.db_session.execute.await_args.args[1] == [[collection_id]]
+    assert metrics == QueryCollectionMetrics(total_queries=5, active_queries=4)
+
+
+async def test_collection_tags_are_stored_as_a_list(manager, monkeypatch):
+    """Test new collections keep their tags as a JSON-ready list, like queries do."""
+    monkeypatch.setattr(query_collection, "QueryCollection", SimpleNamespace)
+    manager.get_collection_by_name = AsyncMock(return_value=None)
+    manager.db_session.commit = AsyncMock()
+
+    collection = await manager.create_collection(
+        QueryCollectionCreate(name="users", tags=["api", "users"], created_by="tester")
+    )
+    assert collection.tags == ["api", "users"]
+
+
+async def test_new_collection_is_created_and_updated_at_the_same_instant(manager, monkeypatch):
+    """Test a fresh collection's creation and update timestamps are identical."""
+    monkeypatch.setattr(query_collection, "QueryCollection", SimpleNamespace)
+    manager.get_collection_by_name = AsyncMock(return_value=None)
+    manager.db_session.commit = AsyncMock()
+
+    collection = await manager.create_collection(
+        QueryCollectionCreate(name="users", created_by="tester")
+    )
+    assert collection.created_at == collection.updated_at
+
+
+async def test_initial_queries_are_stored_with_the_collection_in_one_commit(manager, monkeypatch):
+    """Test initial queries are analyzed up front and written in the collection's transaction."""
+    monkeypatch.setattr(query_collection, "QueryCollection", SimpleNamespace)
+    monkeypatch.setattr(query_collection, "Query", SimpleNamespace)
+    manager.get_collection_by_name = AsyncMock(return_value=None)
+    manager.db_session.commit = AsyncMock()
+    manager.complexity_analyzer.analyze_query = MagicMock(
+        return_value=SimpleNamespace(
+            complexity_score=3.0, estimated_execution_time=0.1, field_count=2, depth=1
+        )
+    )
+    initial = [
+        QueryCreate(name=f"q{i}", query_text="query { users { id } }", created_by="tester")
+        for i in range(3)
+    ]
+
+    collection = await manager.create_collection(
+        QueryCollectionCreate(name="users", created_by="tester", initial_queries=initial)
+    )
+
+    manager.db_session.commit.assert_awaited_once()
+    manager.db_session.add.assert_called_once_with(collection)
+    (queries,) = manager.db_session.add_all.call_args.args
+    assert [query.name for query in queries] == ["q0", "q1", "q2"]
+    assert {query.expected_complexity_score for query in queries} == {3}
+    assert all(manager._query_cache[query.pk_query] is query for query in queries)
+
+
+async def test_initial_queries_are_analyzed_by_the_real_analyzer(manager, monkeypatch):
+    """Test create_collection works with the synchronous QueryComplexityAnalyzer."""
+    monkeypatch.setattr(query_collection, "QueryCollection", SimpleNamespace)
+    monkeypatch.setattr(query_collection, "Query", SimpleNamespace)
+    manager.get_collection_by_name = AsyncMock(return_value=None)
+    manager.db_session.commit = AsyncMock()
+    analyzer = manager.complexity_analyzer = QueryComplexityAnalyzer()
+    texts = ["query { users { id } }", "query { users(first: 5) { id posts { title } } }"]
+    initial = [
+        QueryCreate(name=f"q{i}", query_text=text, created_by="tester")
+        for i, text in enumerate(texts)
+    ]
+
+    await manager.create_collection(
+        QueryCollectionCreate(name="users", created_by="tester", initial_queries=initial)
+    )
+
+    (queries,) = manager.db_session.add_all.call_args.args
+    assert [query.expected_complexity_score for query in queries] == [
+        int(analyzer.analyze_query(text).complexity_score) for text in texts
+    ]
+    assert {query.query_metadata["estimated_cost"] for query in queries} == {0.0}
+
+
+async def test_invalid_initial_query_stores_nothing(manager, monkeypatch):
+    """Test a collection whose initial queries don't validate is not written at all."""
+    monkeypatch.setattr(query_collection, "QueryCollection", SimpleNamespace)
+    manager.get_collection_by_name = AsyncMock(return_value=None)
+    manager.db_session.commit = AsyncMock()
+    manager.complexity_analyzer.analyze_query = MagicMock(side_effect=SyntaxError("bad"))
+    initial = [QueryCreate(name="q", query_text="query { users { id } }", created_by="tester")]
+
+    with pytest.raises(ValueError, match="Invalid GraphQL query: bad"):
+        await manager.create_collection(
+            QueryCollectionCreate(name="users", created_by="tester", initial_queries=initial)
+        )
+
+    manager.db_session.commit.assert_not_awaited()
+
+
+async def test_cached_queries_expire(manager, monkeypatch):
+    """Test a cached query is fetched again once its cache entry has expired."""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    query_id = uuid4()
+    manager.db_session.get = AsyncMock(return_value=SimpleNamespace(pk_query=query_id))
+
+    await manager.get_query(query_id)
+    await manager.get_query(query_id)
+    assert manager.db_session.get.await_count == 1
+
+    now[0] += manager._query_cache.ttl
+    await manager.get_query(query_id)
+    assert manager.db_session.get.await_count == 2
+
+
+async def test_bulk_status_update_touches_cached_queries_only(manager):
+    """Test cached queries get the status and the exact timestamp written to the database."""
+    cached, uncached = uuid4(), uuid4()
+    manager._query_cache[cached] = SimpleNamespace(pk_query=cached, status=None, updated_at=None)
+    manager.db_session.execute = AsyncMock(return_value=SimpleNamespace(rowcount=2))
+    manager.db_session.commit = AsyncMock()
+
+    assert await manager.bulk_update_query_status([cached, uncached], QueryStatus.ACTIVE) == 2
+
+    query = manager._query_cache[cached]
+    _, updated_at, _ = manager.db_session.execute.await_args.args[1]
+    assert (query.status, query.updated_at) == (QueryStatus.ACTIVE, updated_at)
+    assert uncached not in manager._query_cache
+
+
+async def test_search_binds_only_active_filters_in_order(manager):
+    """Test set filters are numbered in clause order with paging bound last."""
+    manager.db_session.execute = AsyncMock(return_value=[])
+    search = QuerySearchFilter(
+        text="user", status=QueryStatus.ACTIVE, complexity_min=0, tags=frozenset({"core"})
+    )
+
+    await manager.search_queries(search)
+
+    sql, params = manager.db_session.execute.await_args.args
+    assert sql == (
+        "SELECT * FROM queries WHERE 1=1"
+        " AND (name ILIKE $1 OR description ILIKE $1 OR content ILIKE $1)"
+        " AND status = $2"
+        " AND metadata->>'complexity_score' >= $3"
+        " AND tags @> $4"
+        " ORDER BY created_at DESC LIMIT $5 OFFSET $6"
+    )
+    assert params == ["%user%", "active", "0", ["core"], 100, 0]
+
+
+async def test_search_without_filters_only_pages(manager):
+    """Test empty text and lists don't add predicates."""
+    manager.db_session.execute = AsyncMock(return_value=[])
+
+    await manager.search_queries(QuerySearchFilter(text="", collection_ids=[], offset=20))
+
+    sql, params = manager.db_session.execute.await_args.args
+    assert sql == "SELECT * FROM queries WHERE 1=1 ORDER BY created_at DESC LIMIT $1 OFFSET $2"
+    assert params == [100, 20]
+
+
+async def test_validate_all_queries_reports_failures_and_validates_the_rest(manager):
+    """Test a query that fails analysis is reported without stopping the others."""
+    queries = [
+        SimpleNamespace(
+            pk_query=uuid4(),
+            name=f"q{i}",
+            query_text="{ bad }" if i == 1 else "{ ok }",
+            metadata=SimpleNamespace(),
+            status=None,
+        )
+        for i in range(8)
+    ]
+    manager.get_collection = AsyncMock(return_value=SimpleNamespace(queries=queries))
+    manager.db_session.commit = AsyncMock()
+
+    def analyze(query_text):
+        if query_text == "{ bad }":
+            raise ValueError("Syntax error")
+        return SimpleNamespace(
+            complexity_score=1.0, estimated_execution_time=0.1, field_count=1, depth=1
+        )
+
+    manager.complexity_analyzer.analyze_query = analyze
+
+    results = await manager.validate_all_queries(uuid4())
+
+    assert (results["valid"], results["invalid"]) == (7, 1)
+    assert results["errors"] == [
+        {"query_id": str(queries[1].pk_query), "query_name": "q1", "error": "Syntax error"}
+    ]
+    assert queries[1].status == QueryStatus.ERROR
+    assert {query.status for query in queries[2:]} == {QueryStatus.VALIDATED}
+    manager.db_session.commit.assert_awaited_once()
+
+
+async def test_delete_query_unlinks_it_from_its_collection_in_place(manager):
+    """Test the deleted query leaves the collection's own list and the cache."""
+    query_id, collection_id = uuid4(), uuid4()
+    query = SimpleNamespace(id=query_id, collection_id=collection_id)
+    others = [SimpleNamespace(id=uuid4()), SimpleNamespace(id=uuid4())]
+    queries = [others[0], query, others[1]]
+    collection = SimpleNamespace(queries=queries, updated_at=None)
+    manager._query_cache[query_id] = query
+    manager.get_collection = AsyncMock(return_value=collection)
+    manager.db_session.delete = AsyncMock()
+    manager.db_session.commit = AsyncMock()
+
+    assert await manager.delete_query(query_id)
+
+    assert collection.queries is queries
+    assert queries == others
+    assert query_id not in manager._query_cache
+    manager.db_session.delete.assert_awaited_once_with(query)
+
+
+async def test_collection_name_lookups_use_the_cache(manager):
+    """Test a cached collection is found by name without a query, until it is renamed."""
+    collection_id = uuid4()
+    collection = SimpleNamespace(pk_query_collection=collection_id, name="users")
+    manager.db_session.get = AsyncMock(return_value=collection)
+    manager.db_session.execute = AsyncMock(return_value=[])
+    manager.db_session.commit = AsyncMock()
+    await manager.get_collection(collection_id)
+
+    assert await manager.get_collection_by_name("users") is collection
+    manager.db_session.execute.assert_not_awaited()
+
+    rename = SimpleNamespace(name="people", description=None, tags=None, is_active=None)
+    await manager.update_collection(collection_id, rename)
+
+    assert await manager.get_collection_by_name("people") is collection
+    assert await manager.get_collection_by_name("users") is None
+    # Only the rename's conflict check and the old name went to the database
+    assert [call.args[1] for call in manager.db_session.execute.await_args_list] == [
+        ["people"],
+        ["users"],
+    ]
+
+
+async def test_update_keeping_the_name_skips_the_conflict_check(manager):
+    """Test an update that doesn't change the name doesn't look the name up."""
+    collection_id = uuid4()
+    manager._cache[collection_id] = SimpleNamespace(pk_query_collection=collection_id, name="users")
+    manager.get_collection_by_name = AsyncMock()
+    manager.db_session.commit = AsyncMock()
+
+    update = SimpleNamespace(name="users", description="All users", tags=None, is_active=None)
+    collection = await manager.update_collection(collection_id, update)
+
+    assert collection.description == "All users"
+    manager.get_collection_by_name.assert_not_awaited()
+
+
+async def test_statements_stay_within_the_concurrency_cap():
+    """Test no more statements than max_concurrent_queries run at once."""
+    manager = QueryCollectionManager(MagicMock(), MagicMock(), max_concurrent_queries=2)
+    running = peak = 0
+
+    async def execute(statement, params):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return []
+
+    manager.db_session.execute = execute
+
+    await asyncio.gather(*(manager.get_query_by_name(f"q{i}") for i in range(6)))
+
+    assert peak == 2
+
+
+async def test_open_circuit_stops_sending_statements():
+    """Test repeated database failures open the breaker, which then fails fast."""
+    manager = QueryCollectionManager(
+        MagicMock(),
+        MagicMock(),
+        circuit_breaker_config=CircuitBreakerConfig(failure_threshold=2, recovery_timeout=60),
+    )
+    manager.db_session.execute = AsyncMock(side_effect=ConnectionError("connection refused"))
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            await manager.get_query_by_name("users")
+    with pytest.raises(DatabaseUnavailableError):
+        await manager.get_query_by_name("users")
+
+    assert manager.db_session.execute.await_count == 2
+
+
+async def test_query_text_is_analyzed_once(manager):
+    """Test analyses are reused for identical text, while failures are retried."""
+    analysis = SimpleNamespace(complexity_score=1.0)
+    manager.complexity_analyzer.analyze_query = MagicMock(
+        side_effect=[analysis, SyntaxError("bad"), analysis, analysis]
+    )
+
+    assert manager._analyze("query { users { id } }") is analysis
+    assert manager._analyze("query { users { id } }") is analysis
+    with pytest.raises(SyntaxError):
+        manager._analyze("query { users }")
+    assert manager._analyze("query { users }") is analysis
+    assert manager._analyze("query { posts { id } }") is analysis
+
+    assert [call.args[0] for call in manager.complexity_analyzer.analyze_query.call_args_list] == [
+        "query { users { id } }",
+        "query { users }",
+        "query { users }",
+        "query { posts { id } }",
+    ]
+
+
+def test_analysis_uses_the_synchronous_analyzer():
+    """Test a real analyzer's metrics are returned and reused for the same text."""
+    analyzer = QueryComplexityAnalyzer()
+    manager = QueryCollectionManager(MagicMock(), analyzer)
+    query_text = "query { users(first: 10) { id posts { title } } }"
+
+    analysis = manager._analyze(query_text)
+
+    assert isinstance(analysis, ComplexityMetrics)
+    assert analysis == analyzer.analyze_query(query_text)
+    assert manager._analyze(query_text) is analysis
+
+
+def test_unanalyzed_query_keeps_supplied_analysis(manager, monkeypatch):
+    """Test analysis fields supplied with the schema are stored when validation is skipped."""
+    monkeypatch.setattr(query_collection, "Query", SimpleNamespace)
+    schema = QueryCreate(
+        name="users",
+        query_text="query { users { id } }",
+        created_by="tester",
+        expected_complexity_score=3,
+        query_metadata={"complexity_score": 3.0, "depth": 2, "last_validated": "2026-01-01"},
+    )
+
+    query = manager._new_query(SimpleNamespace(pk_query_collection=uuid4()), schema, None, None)
+
+    assert query.expected_complexity_score == 3
+    assert query.query_metadata["complexity_score"] == 3.0
+    assert query.query_metadata["depth"] == 2
+    assert query.query_metadata["field_count"] == 0
+    assert query.query_metadata["last_validated"] == "2026-01-01"
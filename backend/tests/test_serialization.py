@@ -0,0 +1,98 @@
+"""Tests for JSON serialization helpers."""
+
+import io
+import json
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from fraiseql_doctor.utils import serialization
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with and without orjson."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_dumps_round_trips_plain_data(backend):
+    """Test plain JSON data survives a round trip."""
+    data = {"name": "users", "tags": ["a", "b"], "score": 1.5, "active": True, "extra": None}
+
+    assert json.loads(serialization.dumps(data)) == data
+
+
+def test_dumps_indent_matches_stdlib_layout(backend):
+    """Test indented output uses the same two-space layout as json.dumps."""
+    data = {"query": {"fields": [1, 2]}, "empty": {}}
+
+    assert serialization.dumps(data, indent=True) == json.dumps(data, indent=2)
+
+
+def test_dumps_handles_uuid_and_datetime(backend):
+    """Test UUIDs and datetimes are emitted as strings."""
+    query_id = UUID("12345678-1234-5678-1234-567812345678")
+    created = datetime(2024, 1, 2, 3, 4, 5)
+
+    decoded = json.loads(serialization.dumps({"id": query_id, "created_at": created}))
+
+    assert decoded["id"] == str(query_id)
+    assert decoded["created_at"].replace("T", " ") == str(created)
+
+
+def test_dump_writes_document_and_newline(backend):
+    """Test dump writes the same text as dumps followed by a newline."""
+    data = {"query": {"fields": [1, 2]}, "name": "users"}
+    stream = io.StringIO()
+
+    serialization.dump(data, stream, indent=True)
+
+    assert stream.getvalue() == serialization.dumps(data, indent=True) + "\n"
+
+
+def test_dump_bytes_writes_utf8_document_and_newline(backend):
+    """Test dump_bytes writes the UTF-8 encoding of dumps plus a newline."""
+    data = {"name": "café", "query": {"fields": [1, 2]}}
+    stream = io.BytesIO()
+
+    serialization.dump_bytes(data, stream, indent=True)
+
+    assert not stream.closed
+    assert stream.getvalue() == (serialization.dumps(data, indent=True) + "\n").encode()
+
+
+def test_dumps_head_keeps_prefix_of_full_document(backend):
+    """Test dumps_head returns the leading characters and flags the cut."""
+    data = {"items": [{"id": i, "name": f"user-{i}", "bio": "é" * 5} for i in range(200)]}
+    full = serialization.dumps(data, indent=True)
+
+    assert serialization.dumps_head(data, 100, indent=True) == (full[:100], True)
+    assert serialization.dumps_head(data, len(full), indent=True) == (full, False)
+    assert serialization.dumps_head({"a": 1}, 100) == (serialization.dumps({"a": 1}), False)
+
+
+def test_dumps_bytes_is_compact_utf8(backend):
+    """Test dumps_bytes gives the same compact UTF-8 document with either backend."""
+    data = {"name": "café", "items": [1, 2], "empty": None}
+
+    assert serialization.dumps_bytes(data) == '{"name":"café","items":[1,2],"empty":null}'.encode()
+
+
+def test_canonical_bytes_ignores_key_order(backend):
+    """Test canonical_bytes is compact and independent of key insertion order."""
+    first = serialization.canonical_bytes({"b": 1, "a": {"y": [1, 2], "x": None}})
+    second = serialization.canonical_bytes({"a": {"x": None, "y": [1, 2]}, "b": 1})
+
+    assert first == second == b'{"a":{"x":null,"y":[1,2]},"b":1}'
+
+
+def test_loads_raises_stdlib_decode_error(backend):
+    """Test malformed input raises json.JSONDecodeError with either backend."""
+    assert serialization.loads('{"limit": 10}') == {"limit": 10}
+
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads("{not json")